@@ -11,6 +11,8 @@ from app.domain.schedule.repository import ScheduleRepository
 from app.domain.closure.repository import ClosureRepository
 from app.domain.notice.repository import NoticeRepository
 from app.domain.fee.repository import FeeRepository
+from app.domain.daily_schedule.repository import DailyScheduleRepository
+from app.domain.calendar_snapshot.repository import CalendarSnapshotRepository
 from app.shared.util import get_season_from_month, should_include_schedule, should_include_session
 from app.shared.util.closure_utils import check_facility_closure
 
@@ -27,22 +29,26 @@ class ScheduleService:
         closure_repo: ClosureRepository,
         notice_repo: NoticeRepository,
         fee_repo: FeeRepository,
+        daily_schedule_repo: Optional[DailyScheduleRepository] = None,
+        calendar_snapshot_repo: Optional[CalendarSnapshotRepository] = None,
     ):
         self._facility_repo = facility_repo
         self._schedule_repo = schedule_repo
         self._closure_repo = closure_repo
         self._notice_repo = notice_repo
         self._fee_repo = fee_repo
+        self._daily_schedule_repo = daily_schedule_repo
+        self._calendar_snapshot_repo = calendar_snapshot_repo
 
-    def get_facilities(self) -> List[dict]:
+    async def get_facilities(self) -> List[dict]:
         """시설 목록 조회"""
         try:
-            return self._facility_repo.find_all_with_schedule_summary()
+            return await self._facility_repo.find_all_with_schedule_summary()
         except Exception as e:
             logger.error(f"시설 목록 조회 실패: {e}")
             return []
 
-    def get_schedules(
+    async def get_schedules(
         self,
         facility: Optional[str] = None,
         month: Optional[str] = None,
@@ -50,7 +56,7 @@ class ScheduleService:
     ) -> List[dict]:
         """스케줄 조회"""
         try:
-            schedules = self._schedule_repo.find_schedules(facility, month)
+            schedules = await self._schedule_repo.find_schedules(facility, month)
 
             # 자동 계절 계산 (season이 명시되지 않은 경우)
             if month and not season:
@@ -82,6 +88,11 @@ class ScheduleService:
                         filtered_schedules.append(schedule)
                 schedules = filtered_schedules
 
+            # 휴무일 일괄 조회 (facility + month 쌍 단위 1회 쿼리)
+            closures_map = await self._closure_repo.find_by_facility_months(
+                (schedule.facility_id, schedule.valid_month) for schedule in schedules
+            )
+
             # 데이터 그룹핑 (facility + month 기준)
             schedules_map = {}
 
@@ -93,49 +104,14 @@ class ScheduleService:
                 key = f"{facility_id}_{valid_month}"
 
                 if key not in schedules_map:
-                    closures = self._closure_repo.find_by_facility_and_month(facility_id, valid_month)
-
-                    closure_info = None
-                    if closures:
-                        specific_dates = [c for c in closures if c.closure_type == 'specific_date']
-                        regular_closures = [c for c in closures if c.closure_type == 'regular']
-
-                        full_closure = next(
-                            (c for c in specific_dates if c.closure_date is None), None
-                        )
-                        if full_closure:
-                            closure_info = {
-                                "is_closed": True,
-                                "closure_type": "monthly",
-                                "reason": full_closure.reason or "임시휴장"
-                            }
-                        elif len(specific_dates) >= 15:
-                            reason = specific_dates[0].reason if specific_dates else "임시휴장"
-                            closure_info = {
-                                "is_closed": True,
-                                "closure_type": "monthly",
-                                "reason": reason
-                            }
-                        elif specific_dates or regular_closures:
-                            closure_info = {
-                                "is_closed": False,
-                                "closure_type": "partial",
-                                "specific_dates": len(specific_dates),
-                                "regular_closures": [
-                                    {
-                                        "day_of_week": c.day_of_week,
-                                        "week_pattern": c.week_pattern,
-                                        "reason": c.reason
-                                    } for c in regular_closures
-                                ]
-                            }
+                    closures = closures_map.get((facility_id, valid_month), [])
 
                     schedules_map[key] = {
                         "facility_id": facility_id,
                         "facility_name": facility_name,
                         "valid_month": valid_month,
                         "schedules": {},
-                        "closure_info": closure_info
+                        "closure_info": self._build_closure_info(closures)
                     }
 
                 schedule_key = f"{schedule.day_type}_{schedule.season or ''}"
@@ -175,11 +151,65 @@ class ScheduleService:
             logger.error(f"스케줄 조회 실패: {e}")
             return []
 
-    def get_daily_schedules(self, date_str: str) -> List[dict]:
+    @staticmethod
+    def _build_closure_info(closures: list) -> Optional[dict]:
+        """시설 + 월 휴무일 목록 → 월간 휴무 요약 (휴무일 없으면 None)"""
+        if not closures:
+            return None
+
+        specific_dates = [c for c in closures if c.closure_type == 'specific_date']
+        regular_closures = [c for c in closures if c.closure_type == 'regular']
+
+        full_closure = next(
+            (c for c in specific_dates if c.closure_date is None), None
+        )
+        if full_closure:
+            return {
+                "is_closed": True,
+                "closure_type": "monthly",
+                "reason": full_closure.reason or "임시휴장"
+            }
+        if len(specific_dates) >= 15:
+            return {
+                "is_closed": True,
+                "closure_type": "monthly",
+                "reason": specific_dates[0].reason
+            }
+        if specific_dates or regular_closures:
+            return {
+                "is_closed": False,
+                "closure_type": "partial",
+                "specific_dates": len(specific_dates),
+                "regular_closures": [
+                    {
+                        "day_of_week": c.day_of_week,
+                        "week_pattern": c.week_pattern,
+                        "reason": c.reason
+                    } for c in regular_closures
+                ]
+            }
+        return None
+
+    async def get_daily_schedules(self, date_str: str) -> List[dict]:
         """특정 날짜의 자유수영 스케줄 조회"""
         try:
             date_obj = datetime.strptime(date_str, "%Y-%m-%d")
 
+            # 적재 시점에 미리 계산된 일별 스케줄 우선 사용
+            # (백필 전이라 일부 시설만 생성된 월은 시설이 빠지지 않도록 실시간 계산)
+            if self._daily_schedule_repo is not None:
+                month_str = f"{date_obj.year}-{date_obj.month:02d}"
+                if not await self._daily_schedule_repo.is_month_materialized(month_str):
+                    logger.warning(
+                        f"일별 스케줄 미생성 시설 있음 ({month_str}), 실시간 계산으로 대체 "
+                        f"(python main.py --rebuild-daily로 백필)"
+                    )
+                else:
+                    materialized = await self._daily_schedule_repo.find_by_date(date_obj.date())
+                    if materialized:
+                        logger.info(f"일별 스케줄 조회 (materialized): {date_str}, {len(materialized)}개 시설")
+                        return materialized
+
             weekday = date_obj.weekday()
             if weekday == 5:
                 day_type = "토요일"
@@ -193,7 +223,7 @@ class ScheduleService:
 
             logger.info(f"날짜 조회: {date_str} → {day_type}, {season}, {valid_month}")
 
-            schedules = self._schedule_repo.find_by_day_type_and_month(day_type, valid_month)
+            schedules = await self._schedule_repo.find_by_day_type_and_month(day_type, valid_month)
 
             # Filter by season
             schedules = [
@@ -202,6 +232,18 @@ class ScheduleService:
             ]
             logger.info(f"Season filter: {season}, {len(schedules)} schedules after filtering")
 
+            # 월 단위 부가 데이터 일괄 조회 (테이블당 1회 쿼리)
+            notices = await self._notice_repo.find_by_valid_month(valid_month)
+            notices_map = {}
+            for notice in notices:
+                notices_map.setdefault(notice.facility_id, notice)
+
+            facility_ids = {schedule.facility_id for schedule in schedules} | set(notices_map)
+            closures_map = await self._closure_repo.find_by_facility_months(
+                (facility_id, valid_month) for facility_id in facility_ids
+            )
+            fees_map = await self._fee_repo.find_by_facility_ids(facility_ids)
+
             facilities_map = {}
 
             for schedule in schedules:
@@ -209,12 +251,12 @@ class ScheduleService:
                 facility_name = schedule.facility.name
 
                 if facility_id not in facilities_map:
-                    notice = self._notice_repo.find_by_facility_and_month(facility_id, valid_month)
+                    notice = notices_map.get(facility_id)
 
-                    closures = self._closure_repo.find_by_facility_and_month(facility_id, valid_month)
+                    closures = closures_map.get((facility_id, valid_month), [])
                     is_closed, closure_reason = check_facility_closure(closures, date_obj, valid_month)
 
-                    fees = self._fee_repo.find_by_facility_id(facility_id)
+                    fees = fees_map.get(facility_id, [])
 
                     facilities_map[facility_id] = {
                         "facility_id": facility_id,
@@ -256,8 +298,9 @@ class ScheduleService:
                     })
 
             # 휴장 시설 추가
-            closed_facilities = self._get_closed_facilities(
-                valid_month, set(facilities_map.keys()), date_str, day_type
+            closed_facilities = await self._get_closed_facilities(
+                valid_month, notices_map, closures_map, fees_map,
+                set(facilities_map.keys()), date_str, day_type
             )
             for closed_facility in closed_facilities:
                 if closed_facility["facility_id"] not in facilities_map:
@@ -275,34 +318,36 @@ class ScheduleService:
             logger.error(f"일별 스케줄 조회 실패: {e}")
             return []
 
-    def _get_closed_facilities(
+    async def _get_closed_facilities(
         self,
         valid_month: str,
+        notices_map: dict,
+        closures_map: dict,
+        fees_map: dict,
         existing_facility_ids: set,
         date_str: str,
         day_type: str
     ) -> List[dict]:
         """전체 휴장 시설 조회 (스케줄이 없지만 Notice와 휴장 정보가 있는 시설)"""
         try:
-            notices = self._notice_repo.find_by_valid_month(valid_month)
+            candidate_ids = set(notices_map) - existing_facility_ids
+            if not candidate_ids:
+                return []
 
-            closed_facilities = []
-            for notice in notices:
-                facility_id = notice.facility_id
-
-                if facility_id in existing_facility_ids:
-                    continue
+            scheduled_ids = await self._schedule_repo.find_facility_ids_by_month(valid_month)
 
-                schedule_count = self._schedule_repo.count_by_facility_and_month(facility_id, valid_month)
-                if schedule_count > 0:
+            closed_facilities = []
+            for facility_id, notice in notices_map.items():
+                if facility_id not in candidate_ids or facility_id in scheduled_ids:
                     continue
 
-                closure = self._closure_repo.find_first_by_facility_and_month(facility_id, valid_month)
-                if not closure:
+                closures = closures_map.get((facility_id, valid_month), [])
+                if not closures:
                     continue
+                closure = closures[0]
 
                 facility = notice.facility
-                fees = self._fee_repo.find_by_facility_id(facility_id)
+                fees = fees_map.get(facility_id, [])
 
                 closed_facilities.append({
                     "facility_id": facility_id,
@@ -331,14 +376,30 @@ class ScheduleService:
             logger.error(f"휴장 시설 조회 실패: {e}")
             return []
 
-    def get_calendar_data(self, year: int, month: int) -> dict:
-        """달력용 데이터 조회"""
+    async def get_calendar_snapshot(self, year: int, month: int) -> Optional[bytes]:
+        """parser가 미리 렌더링한 달력 응답 JSON (decode 없이 저장된 그대로, 없으면 None)"""
+        if self._calendar_snapshot_repo is None:
+            return None
+
         month_str = f"{year}-{month:02d}"
+        try:
+            payload = await self._calendar_snapshot_repo.find_payload(month_str)
+        except Exception as e:
+            logger.warning(f"달력 스냅샷 조회 실패, 실시간 계산으로 대체: {month_str}, {e}")
+            return None
 
+        if not payload:
+            return None
+        logger.info(f"Calendar data (snapshot): {month_str}")
+        return payload.encode()
+
+    async def get_calendar_data(self, year: int, month: int) -> dict:
+        """달력용 데이터 조회 (실시간 계산)"""
+        month_str = f"{year}-{month:02d}"
         season = get_season_from_month(month)
         logger.info(f"Calendar data: {year}-{month:02d}, Season: {season}")
 
-        schedules = self.get_schedules(month=month_str, season=season)
+        schedules = await self.get_schedules(month=month_str, season=season)
 
         return {
             "year": year,
@@ -5,6 +5,8 @@ from .notice import Notice, NoticeRepository
 from .fee import Fee, FeeRepository
 from .closure import FacilityClosure, ClosureRepository
 from .review import Review, ReviewRepository
+from .daily_schedule import DailySchedule, DailyScheduleMonth, DailyScheduleRepository
+from .calendar_snapshot import CalendarSnapshot, CalendarSnapshotRepository
 
 __all__ = [
     "Base",
@@ -13,5 +15,7 @@ __all__ = [
     "Notice", "NoticeRepository",
     "Fee", "FeeRepository",
     "FacilityClosure", "ClosureRepository",
-    "Review", "ReviewRepository"
+    "Review", "ReviewRepository",
+    "DailySchedule", "DailyScheduleMonth", "DailyScheduleRepository",
+    "CalendarSnapshot", "CalendarSnapshotRepository"
 ]
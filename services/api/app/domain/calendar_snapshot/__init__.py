@@ -0,0 +1,4 @@
+from .model import CalendarSnapshot
+from .repository import CalendarSnapshotRepository
+
+__all__ = ["CalendarSnapshot", "CalendarSnapshotRepository"]
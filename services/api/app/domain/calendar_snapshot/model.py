@@ -0,0 +1,20 @@
+"""
+CalendarSnapshot Model
+
+월간 달력 응답 스냅샷 (parser가 ScheduleSaved 시 미리 렌더링)
+"""
+from sqlalchemy import Column, String, Text, TIMESTAMP, func
+
+from app.domain.base import Base
+
+
+class CalendarSnapshot(Base):
+    """월간 달력 응답 스냅샷 모델"""
+    __tablename__ = 'calendar_snapshot'
+
+    valid_month = Column(String(7), primary_key=True)  # YYYY-MM
+    payload = Column(Text(16777215), nullable=False)  # 응답 JSON (MEDIUMTEXT)
+    updated_at = Column(TIMESTAMP, server_default=func.current_timestamp(), onupdate=func.current_timestamp())
+
+    def __repr__(self):
+        return f"<CalendarSnapshot(valid_month='{self.valid_month}')>"
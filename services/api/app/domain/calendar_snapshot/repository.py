@@ -0,0 +1,16 @@
+"""
+CalendarSnapshot Repository Interface
+
+월간 달력 스냅샷 데이터 접근을 위한 추상 인터페이스
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class CalendarSnapshotRepository(ABC):
+    """달력 스냅샷 Repository 인터페이스"""
+
+    @abstractmethod
+    async def find_payload(self, valid_month: str) -> Optional[str]:
+        """월(YYYY-MM)의 달력 응답 JSON 문자열 조회 (없으면 None)"""
+        pass
@@ -4,7 +4,7 @@ Closure Repository Interface
 휴무일 데이터 접근을 위한 추상 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from app.domain.closure.model import FacilityClosure
 
@@ -13,15 +13,22 @@ class ClosureRepository(ABC):
     """휴무일 Repository 인터페이스"""
 
     @abstractmethod
-    def find_by_facility_and_month(
+    async def find_by_facility_and_month(
         self, facility_id: int, valid_month: str
     ) -> List[FacilityClosure]:
         """시설 + 월별 휴무일 조회"""
         pass
 
     @abstractmethod
-    def find_first_by_facility_and_month(
+    async def find_first_by_facility_and_month(
         self, facility_id: int, valid_month: str
     ) -> Optional[FacilityClosure]:
         """시설 + 월별 첫 번째 휴무일 조회"""
         pass
+
+    @abstractmethod
+    async def find_by_facility_months(
+        self, pairs: Iterable[Tuple[int, str]]
+    ) -> Dict[Tuple[int, str], List[FacilityClosure]]:
+        """(시설 ID, 월) 쌍 목록의 휴무일 일괄 조회 → {(facility_id, valid_month): [...]}"""
+        pass
@@ -0,0 +1,4 @@
+from .model import DailySchedule, DailyScheduleMonth
+from .repository import DailyScheduleRepository
+
+__all__ = ["DailySchedule", "DailyScheduleMonth", "DailyScheduleRepository"]
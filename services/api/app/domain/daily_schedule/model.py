@@ -0,0 +1,42 @@
+"""
+DailySchedule Model
+
+일별 스케줄 조회용 materialized 테이블 (parser 적재 시점에 미리 계산)
+"""
+from sqlalchemy import Column, Integer, String, Date, Enum, Boolean, JSON, TIMESTAMP, ForeignKey, func
+
+from app.domain.base import Base
+
+
+class DailySchedule(Base):
+    """일별 스케줄 모델 (date + facility_id 단위)"""
+    __tablename__ = 'daily_schedule'
+
+    date = Column(Date, primary_key=True)
+    facility_id = Column(Integer, ForeignKey('facility.id', ondelete='CASCADE'), primary_key=True)
+    valid_month = Column(String(7), nullable=False)  # YYYY-MM
+    day_type = Column(Enum('평일', '토요일', '일요일'), nullable=False)
+    season = Column(String(20), nullable=False, default='')
+    is_closed = Column(Boolean, nullable=False, default=False)
+    closure_reason = Column(String(200), nullable=True)
+    sessions = Column(JSON, nullable=False)  # [{session_name, start_time, end_time, capacity, lanes}]
+    fees = Column(JSON, nullable=False)  # [{category, price, note}]
+    source_url = Column(String(500), nullable=True)
+    notice_title = Column(String(500), nullable=True)
+    crawled_at = Column(TIMESTAMP, nullable=True)
+
+    def __repr__(self):
+        return f"<DailySchedule(date={self.date}, facility_id={self.facility_id}, closed={self.is_closed})>"
+
+
+class DailyScheduleMonth(Base):
+    """시설 + 월 단위 daily_schedule 생성 기록 (parser DailyScheduleBuilder.refresh가 기록)"""
+    __tablename__ = 'daily_schedule_month'
+
+    facility_id = Column(Integer, ForeignKey('facility.id', ondelete='CASCADE'), primary_key=True)
+    valid_month = Column(String(7), primary_key=True)  # YYYY-MM
+    day_count = Column(Integer, nullable=False, default=0)
+    refreshed_at = Column(TIMESTAMP, server_default=func.now())
+
+    def __repr__(self):
+        return f"<DailyScheduleMonth(facility_id={self.facility_id}, valid_month='{self.valid_month}', days={self.day_count})>"
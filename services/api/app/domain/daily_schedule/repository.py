@@ -0,0 +1,22 @@
+"""
+DailySchedule Repository Interface
+
+일별 스케줄 materialized 데이터 접근을 위한 추상 인터페이스
+"""
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List
+
+
+class DailyScheduleRepository(ABC):
+    """일별 스케줄 Repository 인터페이스"""
+
+    @abstractmethod
+    async def find_by_date(self, target_date: date) -> List[dict]:
+        """특정 날짜의 일별 스케줄 조회 (시설 정보 포함, 응답 형태의 dict 목록)"""
+        pass
+
+    @abstractmethod
+    async def is_month_materialized(self, valid_month: str) -> bool:
+        """해당 월에 스케줄/휴장 데이터가 있는 모든 시설의 일별 스케줄이 생성되었는지 여부"""
+        pass
@@ -11,6 +11,6 @@ class FacilityRepository(ABC):
     """시설 Repository 인터페이스"""
 
     @abstractmethod
-    def find_all_with_schedule_summary(self) -> List[dict]:
+    async def find_all_with_schedule_summary(self) -> List[dict]:
         """시설 목록 + latest_month + schedule_count 집계 조회"""
         pass
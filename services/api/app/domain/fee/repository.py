@@ -4,7 +4,7 @@ Fee Repository Interface
 이용료 데이터 접근을 위한 추상 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, Iterable, List
 
 from app.domain.fee.model import Fee
 
@@ -13,6 +13,11 @@ class FeeRepository(ABC):
     """이용료 Repository 인터페이스"""
 
     @abstractmethod
-    def find_by_facility_id(self, facility_id: int) -> List[Fee]:
+    async def find_by_facility_id(self, facility_id: int) -> List[Fee]:
         """시설 ID로 이용료 목록 조회"""
         pass
+
+    @abstractmethod
+    async def find_by_facility_ids(self, facility_ids: Iterable[int]) -> Dict[int, List[Fee]]:
+        """시설 ID 목록의 이용료 일괄 조회 → {facility_id: [...]}"""
+        pass
@@ -13,26 +13,26 @@ class ReviewRepository(ABC):
     """리뷰 Repository 인터페이스"""
 
     @abstractmethod
-    def find_by_id(self, review_id: int) -> Optional[Review]:
+    async def find_by_id(self, review_id: int) -> Optional[Review]:
         """ID로 리뷰 조회"""
         pass
 
     @abstractmethod
-    def find_by_facility_id(self, facility_id: int) -> List[Review]:
+    async def find_by_facility_id(self, facility_id: int) -> List[Review]:
         """시설 ID로 리뷰 목록 조회 (최신순)"""
         pass
 
     @abstractmethod
-    def get_stats(self, facility_id: int) -> dict:
+    async def get_stats(self, facility_id: int) -> dict:
         """시설별 리뷰 통계 (평균 별점, 리뷰 수)"""
         pass
 
     @abstractmethod
-    def save(self, review: Review) -> Review:
+    async def save(self, review: Review) -> Review:
         """리뷰 저장"""
         pass
 
     @abstractmethod
-    def delete(self, review: Review) -> None:
+    async def delete(self, review: Review) -> None:
         """리뷰 삭제"""
         pass
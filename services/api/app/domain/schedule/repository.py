@@ -4,7 +4,7 @@ Schedule Repository Interface
 스케줄 데이터 접근을 위한 추상 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from app.domain.schedule.model import SwimSchedule
 
@@ -13,7 +13,7 @@ class ScheduleRepository(ABC):
     """스케줄 Repository 인터페이스"""
 
     @abstractmethod
-    def find_schedules(
+    async def find_schedules(
         self,
         facility_name: Optional[str] = None,
         valid_month: Optional[str] = None
@@ -22,15 +22,20 @@ class ScheduleRepository(ABC):
         pass
 
     @abstractmethod
-    def find_by_day_type_and_month(
+    async def find_by_day_type_and_month(
         self, day_type: str, valid_month: str
     ) -> List[SwimSchedule]:
         """요일 타입 + 월별 스케줄 조회 (facility, sessions eager load)"""
         pass
 
     @abstractmethod
-    def count_by_facility_and_month(
+    async def count_by_facility_and_month(
         self, facility_id: int, valid_month: str
     ) -> int:
         """시설 + 월별 스케줄 개수"""
         pass
+
+    @abstractmethod
+    async def find_facility_ids_by_month(self, valid_month: str) -> Set[int]:
+        """해당 월에 스케줄이 하나라도 있는 시설 ID 집합"""
+        pass
@@ -1,8 +1,8 @@
-from .persistence import engine, SessionLocal, get_db, get_schedule_service, get_review_service
+from .persistence import engine, SessionLocal, get_db, get_async_db, get_schedule_service, get_review_service
 from .cache import init_cache, close_cache, cache_key_builder
 
 __all__ = [
-    "engine", "SessionLocal", "get_db",
+    "engine", "SessionLocal", "get_db", "get_async_db",
     "get_schedule_service", "get_review_service",
     "init_cache", "close_cache", "cache_key_builder"
 ]
@@ -1,4 +1,7 @@
 from .redis import init_cache, close_cache, cache_key_builder
+from .decorator import cached
+from .fast_json import FastJSONResponse
+from .cache_warmer import CacheWarmer
 from .cache_subscriber import CacheSubscriber
 
-__all__ = ["init_cache", "close_cache", "cache_key_builder", "CacheSubscriber"]
+__all__ = ["init_cache", "close_cache", "cache_key_builder", "cached", "FastJSONResponse", "CacheWarmer", "CacheSubscriber"]
@@ -1,8 +1,11 @@
 """
 Redis Pub/Sub 캐시 무효화 Subscriber
 
-Parser의 DB 저장 이벤트를 수신하여 API 캐시를 클리어한다.
-2초 디바운스로 배치 저장 시 한 번만 클리어.
+Parser의 DB 저장 이벤트를 수신하여 영향받는 월/시설 태그의 캐시만 삭제한다.
+(Redis와 함께 이 프로세스의 L1 캐시 항목도 제거)
+2초 디바운스로 배치 저장 시 모인 이벤트를 한 번에 처리.
+월을 해석할 수 없는 이벤트가 섞이면 SCAN/UNLINK로 전체 삭제.
+배치 완료 이벤트(batch_complete) 수신 시 무효화 후 주요 엔드포인트 캐시를 워밍한다.
 """
 import asyncio
 import json
@@ -12,21 +15,29 @@ from redis import asyncio as aioredis
 from fastapi_cache import FastAPICache
 
 from app.shared.config import settings
+from app.infrastructure.cache.cache_tags import invalidation_tags, delete_tags, delete_all
+from app.infrastructure.cache.local_cache import TieredBackend
+from app.infrastructure.cache.cache_warmer import CacheWarmer
 
 logger = logging.getLogger(__name__)
 
 CHANNEL = "swim-scheduler:cache-invalidation"
 DEBOUNCE_SECONDS = 2.0
+WARMUP_LOCK_SECONDS = 300
 
 
 class CacheSubscriber:
     """Redis Pub/Sub 캐시 무효화 Subscriber"""
 
-    def __init__(self):
+    def __init__(self, warmer: CacheWarmer | None = None):
+        self._warmer = warmer
         self._redis: aioredis.Redis | None = None
         self._pubsub: aioredis.client.PubSub | None = None
         self._task: asyncio.Task | None = None
         self._debounce_task: asyncio.Task | None = None
+        self._pending_tags: set[str] = set()
+        self._pending_full_clear = False
+        self._pending_warmup = False
 
     async def start(self):
         try:
@@ -48,36 +59,105 @@ class CacheSubscriber:
 
                 try:
                     data = json.loads(message["data"])
+                except (json.JSONDecodeError, TypeError):
+                    data = None
+
+                if isinstance(data, dict) and data.get("event") == "batch_complete":
+                    logger.info(f"배치 완료 이벤트 수신: 신규 저장 {data.get('new_saved', 0)}건")
+                    self._pending_warmup = True
+                    self._schedule_flush()
+                    continue
+
+                if isinstance(data, dict):
                     logger.info(
                         f"캐시 무효화 이벤트 수신: {data.get('facility_name')} "
                         f"({data.get('valid_month')})"
                     )
-                except (json.JSONDecodeError, TypeError):
+                    tags = invalidation_tags(
+                        data.get("facility_name"), data.get("valid_month"),
+                        # 이전 parser의 메시지(필드 없음)는 이용료 변경으로 간주
+                        fees_changed=data.get("fees_changed", True),
+                    )
+                else:
                     logger.warning("캐시 무효화 메시지 파싱 실패")
+                    tags = None
+
+                if tags is None:
+                    self._pending_full_clear = True
+                else:
+                    self._pending_tags.update(tags)
 
-                # 디바운스: 기존 예약된 클리어 취소 후 재예약
-                if self._debounce_task and not self._debounce_task.done():
-                    self._debounce_task.cancel()
-                self._debounce_task = asyncio.create_task(self._debounced_clear())
+                self._schedule_flush()
         except asyncio.CancelledError:
             pass
         except Exception as e:
             logger.warning(f"캐시 무효화 리스너 오류: {e}")
 
+    def _schedule_flush(self):
+        """디바운스: 기존 예약된 클리어 취소 후 재예약"""
+        if self._debounce_task and not self._debounce_task.done():
+            self._debounce_task.cancel()
+        self._debounce_task = asyncio.create_task(self._debounced_clear())
+
     async def _debounced_clear(self):
         await asyncio.sleep(DEBOUNCE_SECONDS)
-        await self._clear_all_cache()
+
+        tags, full_clear, warmup = self._pending_tags, self._pending_full_clear, self._pending_warmup
+        self._pending_tags, self._pending_full_clear, self._pending_warmup = set(), False, False
+
+        # 꺼낸 작업은 새 메시지로 디바운스가 취소되어도 끝까지 수행
+        await asyncio.shield(self._flush(tags, full_clear, warmup))
+
+    async def _flush(self, tags: set[str], full_clear: bool, warmup: bool):
+        if full_clear:
+            await self._clear_all_cache()
+        elif tags:
+            await self._clear_tags(tags)
+
+        if warmup and self._warmer is not None:
+            await self._warm_cache()
+
+    async def _warm_cache(self):
+        """캐시 워밍 (여러 워커 중 락을 얻은 하나만 수행)"""
+        try:
+            backend = FastAPICache.get_backend()
+            lock_key = f"{FastAPICache.get_prefix()}:lock:warmup"
+            if not await backend.redis.set(lock_key, "1", nx=True, ex=WARMUP_LOCK_SECONDS):
+                logger.info("캐시 워밍: 다른 워커가 수행 중")
+                return
+            try:
+                await self._warmer.warm()
+            finally:
+                await backend.redis.delete(lock_key)
+        except Exception as e:
+            logger.warning(f"캐시 워밍 실패: {e}")
+
+    async def _clear_tags(self, tags: set[str]):
+        try:
+            backend = FastAPICache.get_backend()
+            prefix = FastAPICache.get_prefix()
+
+            deleted = await delete_tags(backend.redis, prefix, tags)
+            if isinstance(backend, TieredBackend):
+                # 다른 프로세스가 태그 Set을 먼저 삭제했으면 deleted가 비어 있으므로
+                # L1은 로컬 태그 인덱스로 삭제 (Redis 삭제 이후라 L2 stale 값을 다시 채우지 않음)
+                backend.local.evict(deleted)
+                backend.local.evict_tags(tags)
+            logger.info(f"캐시 무효화 완료: 태그 {len(tags)}개, {len(deleted)}개 키 삭제")
+        except Exception as e:
+            logger.warning(f"태그 캐시 삭제 실패, 전체 삭제로 대체: {e}")
+            await self._clear_all_cache()
 
     async def _clear_all_cache(self):
         try:
             backend = FastAPICache.get_backend()
-            redis_client = backend.redis
             prefix = FastAPICache.get_prefix()
 
-            keys = await redis_client.keys(f"{prefix}:*")
-            if keys:
-                await redis_client.delete(*keys)
-                logger.info(f"캐시 무효화 완료: {len(keys)}개 키 삭제")
+            if isinstance(backend, TieredBackend):
+                backend.local.clear()
+            deleted = await delete_all(backend.redis, prefix)
+            if deleted:
+                logger.info(f"캐시 전체 무효화 완료: {deleted}개 키 삭제")
             else:
                 logger.info("캐시 무효화: 삭제할 키 없음")
         except Exception as e:
@@ -0,0 +1,174 @@
+"""
+캐시 태그 관리
+
+캐시 키를 월/시설 단위 태그(Redis Set)에 등록해 두고,
+무효화 이벤트가 오면 영향받는 태그의 키만 삭제한다.
+
+태그 규칙 (응답이 의존하는 범위):
+    all                          전체 (시설 목록, 필터 없는 스케줄 등)
+    month:{YYYY-MM}              특정 월 (월별 스케줄, 일별, 캘린더)
+    facility:{시설명}             특정 시설의 전체 월
+    facility:{시설명}:month:{YYYY-MM}
+    fees                         여러 시설의 이용료를 포함하는 응답 (월별 스케줄, 일별, 캘린더)
+    facility:{시설명}:fees        특정 시설의 이용료를 포함하는 월 단위 응답
+
+이용료는 시설 단위(월 구분 없음)라 이용료가 바뀐 저장 이벤트는 다른 월의 응답도 무효화한다.
+"""
+import re
+from typing import Iterable, List, Optional, Set
+
+TAG_ALL = "all"
+TAG_FEES = "fees"
+
+_MONTH_PATTERNS = (
+    re.compile(r"^(\d{4})-(\d{1,2})"),
+    re.compile(r"(\d{4})년\s*(\d{1,2})월"),
+)
+
+
+def normalize_month(value: Optional[str]) -> Optional[str]:
+    """"2026-01", "2026-01-18", "2026년 1월" → "2026-01" (해석 불가 시 None)"""
+    if not value:
+        return None
+    for pattern in _MONTH_PATTERNS:
+        match = pattern.search(str(value))
+        if match:
+            year, month = int(match.group(1)), int(match.group(2))
+            if 1 <= month <= 12:
+                return f"{year}-{month:02d}"
+    return None
+
+
+def tag_key(prefix: str, tag: str) -> str:
+    """태그 Set의 Redis 키"""
+    return f"{prefix}:tag:{tag}"
+
+
+def resolve_tags(func_name: str, query_params: dict) -> List[str]:
+    """
+    캐시 대상 엔드포인트 + 쿼리 파라미터 → 등록할 태그 목록
+
+    해석할 수 없는 요청은 항상 전체 태그(all)로 등록해 누락 없이 무효화되게 한다.
+    """
+    if func_name == "get_schedules":
+        facility = query_params.get("facility")
+        month_param = query_params.get("month")
+        month = normalize_month(month_param)
+        if month_param and not month:
+            return [TAG_ALL]
+        if facility and month:
+            return [f"facility:{facility}:month:{month}", f"facility:{facility}:fees"]
+        if facility:
+            return [f"facility:{facility}"]
+        if month:
+            return [f"month:{month}", TAG_FEES]
+        return [TAG_ALL]
+
+    if func_name == "get_daily_schedules":
+        month = normalize_month(query_params.get("date"))
+        return [f"month:{month}", TAG_FEES] if month else [TAG_ALL]
+
+    if func_name == "get_calendar_schedules":
+        try:
+            month = normalize_month(f"{int(query_params['year'])}-{int(query_params['month'])}")
+        except (KeyError, ValueError):
+            month = None
+        return [f"month:{month}", TAG_FEES] if month else [TAG_ALL]
+
+    return [TAG_ALL]
+
+
+def key_tags(prefix: str, cache_key: str) -> List[str]:
+    """
+    캐시 키(cache_key_builder 형식: {prefix}:{module}:{함수명}[:k=v...]) → 태그 목록
+
+    L1 태그 인덱스용. Redis 태그 Set 없이도 각 프로세스가 같은 태그로 무효화할 수 있게 한다.
+    해석할 수 없는 키는 전체 태그(all)로 분류한다.
+    """
+    if not cache_key.startswith(f"{prefix}:"):
+        return [TAG_ALL]
+    parts = cache_key[len(prefix) + 1:].split(":")
+    if len(parts) < 2:
+        return [TAG_ALL]
+
+    query_params = {}
+    last = None
+    for part in parts[2:]:
+        name, sep, value = part.partition("=")
+        if sep and name:
+            query_params[name] = value
+            last = name
+        elif last is not None:
+            # 값에 ':'가 포함된 경우
+            query_params[last] += f":{part}"
+        else:
+            return [TAG_ALL]
+    return resolve_tags(parts[1], query_params)
+
+
+def invalidation_tags(facility_name: Optional[str], valid_month: Optional[str],
+                      fees_changed: bool = True) -> Optional[List[str]]:
+    """
+    저장 이벤트(시설, 월) → 삭제할 태그 목록
+
+    fees_changed면 이용료를 포함하는 다른 월의 응답도 삭제한다.
+
+    Returns:
+        태그 목록 (월을 해석할 수 없으면 None → 전체 삭제 필요)
+    """
+    month = normalize_month(valid_month)
+    if not month:
+        return None
+
+    tags = [TAG_ALL, f"month:{month}"]
+    if facility_name:
+        tags += [f"facility:{facility_name}", f"facility:{facility_name}:month:{month}"]
+    if fees_changed:
+        tags.append(TAG_FEES)
+        if facility_name:
+            tags.append(f"facility:{facility_name}:fees")
+    return tags
+
+
+async def register_key(redis_client, prefix: str, cache_key: str, tags: Iterable[str], expire: int) -> None:
+    """캐시 키를 태그 Set에 등록 (태그 Set은 최대 캐시 TTL 후 자동 만료)"""
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for tag in tags:
+            pipe.sadd(tag_key(prefix, tag), cache_key)
+            pipe.expire(tag_key(prefix, tag), expire)
+        await pipe.execute()
+
+
+async def delete_tags(redis_client, prefix: str, tags: Iterable[str]) -> Set[str]:
+    """태그에 등록된 캐시 키와 태그 Set 삭제 → 삭제한 캐시 키 목록"""
+    tag_keys = [tag_key(prefix, tag) for tag in tags]
+
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for key in tag_keys:
+            pipe.smembers(key)
+        members = await pipe.execute()
+
+    cache_keys = set()
+    for keys in members:
+        cache_keys.update(
+            key.decode() if isinstance(key, bytes) else key for key in keys or ()
+        )
+
+    await redis_client.unlink(*cache_keys, *tag_keys)
+    return cache_keys
+
+
+async def delete_all(redis_client, prefix: str, batch_size: int = 500) -> int:
+    """SCAN + UNLINK로 prefix 하위 전체 키 삭제 (KEYS 블로킹 회피)"""
+    deleted = 0
+    batch = []
+    async for key in redis_client.scan_iter(match=f"{prefix}:*", count=batch_size):
+        batch.append(key)
+        if len(batch) >= batch_size:
+            await redis_client.unlink(*batch)
+            deleted += len(batch)
+            batch = []
+    if batch:
+        await redis_client.unlink(*batch)
+        deleted += len(batch)
+    return deleted
@@ -0,0 +1,66 @@
+"""
+캐시 사전 워밍
+
+Parser의 배치 완료 이벤트 수신 후, 사용자 요청이 cold key에 닿기 전에
+주요 엔드포인트를 앱 내부(ASGI)로 호출하여 캐시를 미리 채운다.
+캐시 데코레이터를 그대로 거치므로 키 생성/태그 등록/L1 적재가 실제 요청과 동일하다.
+"""
+import logging
+from datetime import date, timedelta
+from typing import List
+
+import httpx
+
+from app.shared.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _next_month(year: int, month: int) -> tuple[int, int]:
+    return (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+class CacheWarmer:
+    """배치 완료 후 주요 엔드포인트 캐시 워밍"""
+
+    def __init__(self, app, base_path: str = "/api"):
+        self._app = app
+        self._base_path = base_path
+
+    def build_paths(self, today: date) -> List[str]:
+        """워밍 대상 경로 목록 (시설 목록, 이번 달/다음 달 스케줄·캘린더, 향후 N일 일별)"""
+        months = [(today.year, today.month), _next_month(today.year, today.month)]
+
+        paths = [f"{self._base_path}/facilities"]
+        for year, month in months:
+            paths.append(f"{self._base_path}/schedules?month={year}-{month:02d}")
+            paths.append(f"{self._base_path}/schedules/calendar?year={year}&month={month}")
+        for offset in range(settings.CACHE_WARMUP_DAYS):
+            target = today + timedelta(days=offset)
+            paths.append(f"{self._base_path}/schedules/daily?date={target.isoformat()}")
+        return paths
+
+    async def warm(self) -> int:
+        """
+        캐시 워밍 실행 (no-cache 요청으로 stale 값도 새로 계산)
+
+        Returns:
+            성공한 요청 수
+        """
+        paths = self.build_paths(date.today())
+        success = 0
+
+        transport = httpx.ASGITransport(app=self._app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://cache-warmer") as client:
+            for path in paths:
+                try:
+                    response = await client.get(path, headers={"Cache-Control": "no-cache"})
+                    if response.status_code == 200:
+                        success += 1
+                    else:
+                        logger.warning(f"캐시 워밍 응답 오류: {path} ({response.status_code})")
+                except Exception as e:
+                    logger.warning(f"캐시 워밍 실패: {path}, {e}")
+
+        logger.info(f"캐시 워밍 완료: {success}/{len(paths)}개 경로")
+        return success
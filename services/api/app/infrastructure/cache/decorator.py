@@ -0,0 +1,233 @@
+"""
+스케줄 엔드포인트 캐시 데코레이터
+
+fastapi_cache.decorator.cache 대체:
+- Single-flight: 같은 키의 동시 miss는 한 번만 계산하고 나머지는 결과를 공유
+- Stale-while-revalidate: 만료 후 stale 구간에서는 이전 값을 즉시 반환하고
+  백그라운드에서 한 번만 재계산
+
+저장 형식: b"{fresh_until(epoch)}\\n" + JSON payload
+Redis TTL은 expire + stale_ttl 로 설정해 stale 값이 남아 있게 한다.
+
+계산은 요청보다 오래 살 수 있으므로(single-flight 합류, stale 갱신) service_factory를 주면
+요청에 주입된 service(요청 세션) 대신 계산마다 자체 세션의 service를 만들어 사용한다.
+
+fast=True: orjson으로 인코딩하고, hit 시 저장된 bytes를 decode 없이 그대로 응답한다.
+(response_model 검증을 거치지 않으므로 반환 타입이 이미 응답 형태인 엔드포인트에만 사용)
+엔드포인트가 Response를 반환하면 인코딩 없이 본문(body)을 그대로 저장한다.
+"""
+import asyncio
+import hashlib
+import logging
+import time
+from functools import wraps
+from inspect import Parameter, iscoroutinefunction, signature
+from typing import Any, AsyncContextManager, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from fastapi_cache import FastAPICache
+from fastapi_cache.coder import JsonCoder
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+from app.shared.config import settings
+from app.infrastructure.cache.redis import cache_key_builder, register_cache_key
+from app.infrastructure.cache.fast_json import FastJSONResponse, dumps
+from app.infrastructure.metrics.registry import CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+CACHE_STATUS_HEADER = "X-FastAPI-Cache"
+
+_INJECTED_REQUEST = "__swim_cache_request"
+_INJECTED_RESPONSE = "__swim_cache_response"
+
+_MISSING = object()
+
+# 진행 중인 계산 (cache key → Task), 프로세스 단위 single-flight
+_inflight: Dict[str, asyncio.Task] = {}
+
+
+def _pack(fresh_until: float, payload: bytes) -> bytes:
+    return f"{int(fresh_until)}\n".encode() + payload
+
+
+def _unpack(raw: bytes) -> Optional[Tuple[float, bytes]]:
+    """저장 값 → (fresh_until, payload). 형식이 다르면 None (이전 데코레이터 값 등)"""
+    header, sep, payload = raw.partition(b"\n")
+    if not sep or not header.isdigit():
+        return None
+    return float(header), payload
+
+
+def _etag(payload: bytes) -> str:
+    return f'W/"{hashlib.sha1(payload).hexdigest()[:16]}"'
+
+
+def _uncacheable(request: Optional[Request]) -> bool:
+    if not FastAPICache.get_enable():
+        return True
+    if request is None:
+        return False
+    if request.method != "GET":
+        return True
+    return request.headers.get("Cache-Control") == "no-store"
+
+
+def _find_param(sig, annotation) -> Optional[str]:
+    return next((p.name for p in sig.parameters.values() if p.annotation is annotation), None)
+
+
+async def _single_flight(key: str, compute: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+    """
+    같은 키의 계산을 하나로 합침
+
+    Returns:
+        (계산 결과, 다른 요청의 계산에 합류했는지 여부)
+    """
+    task = _inflight.get(key)
+    coalesced = task is not None
+    if task is None:
+        task = asyncio.ensure_future(compute())
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _inflight.pop(key, None) if _inflight.get(key) is t else None)
+
+    # 요청이 취소되어도 공유 계산은 계속 진행
+    return await asyncio.shield(task), coalesced
+
+
+def _log_refresh_error(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception():
+        logger.warning(f"캐시 백그라운드 갱신 실패: {task.exception()}")
+
+
+def cached(
+    expire: int,
+    stale_ttl: Optional[int] = None,
+    key_builder: Callable = cache_key_builder,
+    fast: bool = False,
+    service_factory: Optional[Callable[[], AsyncContextManager[Any]]] = None,
+    service_param: str = "service",
+):
+    """
+    캐시 데코레이터 (single-flight + stale-while-revalidate)
+
+    Args:
+        expire: fresh 유지 시간 (초)
+        stale_ttl: 만료 후 stale 값을 반환할 수 있는 시간 (초, 기본 settings.CACHE_STALE_TTL)
+        key_builder: 캐시 키 빌더
+        fast: orjson 인코딩 + 저장된 bytes 직접 응답
+        service_factory: 계산마다 새 service를 여는 async context manager 팩토리
+        service_param: service_factory 결과로 교체할 엔드포인트 파라미터 이름
+    """
+    stale_ttl = settings.CACHE_STALE_TTL if stale_ttl is None else stale_ttl
+    encode = dumps if fast else JsonCoder.encode
+
+    def wrapper(func):
+        sig = signature(func)
+        request_name = _find_param(sig, Request)
+        response_name = _find_param(sig, Response)
+
+        # 엔드포인트에 Request/Response 파라미터가 없으면 주입 (FastAPI가 채워줌)
+        extra = []
+        if request_name is None:
+            request_name = _INJECTED_REQUEST
+            extra.append(Parameter(_INJECTED_REQUEST, Parameter.KEYWORD_ONLY, annotation=Request))
+        if response_name is None:
+            response_name = _INJECTED_RESPONSE
+            extra.append(Parameter(_INJECTED_RESPONSE, Parameter.KEYWORD_ONLY, annotation=Response))
+
+        async def call(args, kwargs):
+            kwargs = {k: v for k, v in kwargs.items() if k not in (_INJECTED_REQUEST, _INJECTED_RESPONSE)}
+            if iscoroutinefunction(func):
+                return await func(*args, **kwargs)
+            return await run_in_threadpool(func, *args, **kwargs)
+
+        @wraps(func)
+        async def inner(*args, **kwargs):
+            request: Optional[Request] = kwargs.get(request_name)
+            response: Optional[Response] = kwargs.get(response_name)
+
+            if _uncacheable(request):
+                return await call(args, kwargs)
+
+            backend = FastAPICache.get_backend()
+            cache_key = key_builder(func, FastAPICache.get_prefix(), request=request, response=response)
+            if asyncio.iscoroutine(cache_key):
+                cache_key = await cache_key
+
+            async def compute() -> Tuple[Any, bytes]:
+                if service_factory is None:
+                    result = await call(args, kwargs)
+                else:
+                    async with service_factory() as service:
+                        result = await call(args, {**kwargs, service_param: service})
+                # 엔드포인트가 직접 만든 응답(미리 인코딩된 JSON 등)은 본문을 그대로 저장
+                payload = result.body if isinstance(result, Response) else encode(result)
+                try:
+                    await backend.set(cache_key, _pack(time.time() + expire, payload), expire + stale_ttl)
+                except Exception as e:
+                    logger.warning(f"캐시 저장 실패: {cache_key}, {e}")
+                else:
+                    await register_cache_key(func, cache_key, request)
+                return result, payload
+
+            try:
+                _, raw = await backend.get_with_ttl(cache_key)
+            except Exception as e:
+                logger.warning(f"캐시 조회 실패: {cache_key}, {e}")
+                raw = None
+
+            unpacked = _unpack(raw) if raw is not None else None
+            no_cache = request is not None and request.headers.get("Cache-Control") == "no-cache"
+
+            if unpacked is None or no_cache:
+                (result, payload), coalesced = await _single_flight(cache_key, compute)
+                status, max_age = ("COALESCED" if coalesced else "MISS"), expire
+            else:
+                fresh_until, payload = unpacked
+                remaining = int(fresh_until - time.time())
+                if remaining > 0:
+                    status, max_age = "HIT", remaining
+                else:
+                    # stale: 즉시 반환하고 백그라운드에서 한 번만 갱신
+                    status, max_age = "STALE", 0
+                    if cache_key not in _inflight:
+                        refresh = asyncio.ensure_future(_single_flight(cache_key, compute))
+                        refresh.add_done_callback(_log_refresh_error)
+                result = _MISSING
+
+            CACHE_REQUESTS.labels(func.__name__, status.lower()).inc()
+
+            etag = _etag(payload)
+            headers = {
+                "Cache-Control": f"max-age={max_age}",
+                "ETag": etag,
+                CACHE_STATUS_HEADER: status,
+            }
+            not_modified = status in ("HIT", "STALE") and request is not None \
+                and request.headers.get("if-none-match") == etag
+
+            if fast:
+                if not_modified:
+                    return Response(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+                return FastJSONResponse(payload, headers=headers)
+
+            if response is not None:
+                response.headers.update(headers)
+                if not_modified:
+                    response.status_code = HTTP_304_NOT_MODIFIED
+                    return response
+
+            return JsonCoder.decode(payload) if result is _MISSING else result
+
+        if extra:
+            params = list(sig.parameters.values())
+            var_kw = [p for p in params if p.kind is Parameter.VAR_KEYWORD]
+            params = [p for p in params if p.kind is not Parameter.VAR_KEYWORD]
+            inner.__signature__ = sig.replace(parameters=[*params, *extra, *var_kw])
+
+        return inner
+
+    return wrapper
@@ -0,0 +1,24 @@
+"""
+orjson 기반 JSON 직렬화/응답
+
+캐시에는 인코딩된 bytes를 저장하고, hit 시 decode/re-encode 없이 그대로 응답한다.
+"""
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+
+def dumps(content: Any) -> bytes:
+    """orjson 인코딩 (orjson이 모르는 타입은 jsonable_encoder로 변환)"""
+    return orjson.dumps(content, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 응답 클래스 (이미 인코딩된 bytes는 그대로 전송)"""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, (bytes, bytearray)):
+            return bytes(content)
+        return dumps(content)
@@ -0,0 +1,144 @@
+"""
+프로세스 내 L1 캐시
+
+Redis(fastapi-cache2 backend) 앞단에 두는 LRU + TTL 메모리 캐시.
+hot key(오늘 일별 스케줄, 이번 달 캘린더 등)는 Redis 왕복 없이 응답한다.
+무효화는 CacheSubscriber가 Redis 태그 삭제와 함께 수행한다.
+L1은 프로세스마다 따로 있으므로 키의 태그를 로컬 인덱스로 관리해, Redis 태그 Set을
+다른 프로세스가 먼저 삭제했더라도 같은 태그로 로컬 항목을 지울 수 있게 한다.
+"""
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi_cache.backends import Backend
+
+from app.infrastructure.metrics.registry import CACHE_BACKEND_LOOKUPS
+
+
+class LocalLRUCache:
+    """크기 제한 LRU + 항목별 TTL 캐시 (이벤트 루프 단일 스레드 전용)"""
+
+    def __init__(self, max_entries: int, ttl: int, tagger: Optional[Callable[[str], Iterable[str]]] = None):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._tagger = tagger
+        # key → (value, 로컬 만료 시각, 원본 만료 시각 or None)
+        self._entries: "OrderedDict[str, Tuple[bytes, float, Optional[float]]]" = OrderedDict()
+        # 태그 → 키, 키 → 태그 (tagger가 있을 때만)
+        self._tag_keys: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, List[str]] = {}
+
+    def get(self, key: str) -> Tuple[int, Optional[bytes]]:
+        """(남은 TTL, 값) 반환. 없거나 만료되면 (0, None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return 0, None
+
+        value, expires_at, origin_expires_at = entry
+        now = time.monotonic()
+        if expires_at <= now:
+            self._remove(key)
+            return 0, None
+
+        self._entries.move_to_end(key)
+        ttl = int(origin_expires_at - now) if origin_expires_at is not None else -1
+        return ttl, value
+
+    def set(self, key: str, value: bytes, expire: Optional[int] = None) -> None:
+        """값 저장 (로컬 TTL은 원본 TTL을 넘지 않음)"""
+        if self._max_entries <= 0 or self._ttl <= 0:
+            return
+
+        now = time.monotonic()
+        if expire is not None and expire > 0:
+            origin_expires_at = now + expire
+            local_ttl = min(self._ttl, expire)
+        else:
+            origin_expires_at = None
+            local_ttl = self._ttl
+
+        self._entries[key] = (value, now + local_ttl, origin_expires_at)
+        self._entries.move_to_end(key)
+        if self._tagger is not None and key not in self._key_tags:
+            tags = list(self._tagger(key))
+            self._key_tags[key] = tags
+            for tag in tags:
+                self._tag_keys.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self._max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+
+    def evict(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._remove(key)
+
+    def evict_tags(self, tags: Iterable[str]) -> int:
+        """태그에 속한 항목 삭제 → 삭제한 항목 수"""
+        keys = set()
+        for tag in tags:
+            keys.update(self._tag_keys.get(tag, ()))
+        self.evict(keys)
+        return len(keys)
+
+    def evict_prefix(self, prefix: str) -> None:
+        self.evict([k for k in self._entries if k.startswith(prefix)])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tag_keys.clear()
+        self._key_tags.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TieredBackend(Backend):
+    """L1(프로세스 메모리) → L2(Redis) 2단 캐시 backend"""
+
+    def __init__(self, remote: Backend, local: LocalLRUCache):
+        self.remote = remote
+        self.local = local
+
+    @property
+    def redis(self):
+        """태그 관리/Subscriber가 사용하는 Redis 클라이언트"""
+        return self.remote.redis
+
+    async def get_with_ttl(self, key: str) -> Tuple[int, Optional[bytes]]:
+        ttl, value = self.local.get(key)
+        if value is not None:
+            CACHE_BACKEND_LOOKUPS.labels("l1").inc()
+            return ttl, value
+
+        ttl, value = await self.remote.get_with_ttl(key)
+        if value is not None:
+            CACHE_BACKEND_LOOKUPS.labels("l2").inc()
+            self.local.set(key, value, ttl if ttl and ttl > 0 else None)
+        else:
+            CACHE_BACKEND_LOOKUPS.labels("none").inc()
+        return ttl, value
+
+    async def get(self, key: str) -> Optional[bytes]:
+        _, value = await self.get_with_ttl(key)
+        return value
+
+    async def set(self, key: str, value: bytes, expire: Optional[int] = None) -> None:
+        await self.remote.set(key, value, expire)
+        self.local.set(key, value, expire)
+
+    async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
+        if namespace:
+            self.local.evict_prefix(f"{namespace}:")
+        elif key:
+            self.local.evict([key])
+        return await self.remote.clear(namespace, key)
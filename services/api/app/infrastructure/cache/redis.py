@@ -2,6 +2,7 @@
 Redis 캐시 설정
 fastapi-cache2를 사용한 캐싱 구현
 """
+import logging
 from typing import Optional
 from fastapi import Request, Response
 from fastapi_cache import FastAPICache
@@ -9,7 +10,18 @@ from fastapi_cache.backends.redis import RedisBackend
 from redis import asyncio as aioredis
 
 from app.shared.config import settings
+from app.infrastructure.cache.cache_tags import key_tags, resolve_tags, register_key
+from app.infrastructure.cache.local_cache import LocalLRUCache, TieredBackend
 
+logger = logging.getLogger(__name__)
+
+# 태그 Set TTL (가장 긴 캐시 TTL + stale 구간 이상 유지)
+TAG_TTL = max(
+    settings.CACHE_TTL_FACILITIES,
+    settings.CACHE_TTL_SCHEDULES,
+    settings.CACHE_TTL_DAILY,
+    settings.CACHE_TTL_CALENDAR,
+) + settings.CACHE_STALE_TTL
 
 async def init_cache() -> None:
     """
@@ -19,7 +31,13 @@ async def init_cache() -> None:
     redis = aioredis.from_url(
         f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}"
     )
-    FastAPICache.init(RedisBackend(redis), prefix="swim-api-cache")
+    prefix = "swim-api-cache"
+    local = LocalLRUCache(
+        max_entries=settings.CACHE_L1_MAX_ENTRIES,
+        ttl=settings.CACHE_L1_TTL,
+        tagger=lambda key: key_tags(prefix, key),
+    )
+    FastAPICache.init(TieredBackend(RedisBackend(redis), local), prefix=prefix)
 
 
 async def close_cache() -> None:
@@ -32,7 +50,7 @@ async def close_cache() -> None:
         await backend.redis.close()
 
 
-def cache_key_builder(
+async def cache_key_builder(
     func,
     namespace: Optional[str] = "",
     request: Optional[Request] = None,
@@ -57,5 +75,25 @@ def cache_key_builder(
         params_str = ":".join(f"{k}={v}" for k, v in sorted_params)
 
     if params_str:
-        return f"{prefix}:{module}:{func_name}:{params_str}"
-    return f"{prefix}:{module}:{func_name}"
+        cache_key = f"{prefix}:{module}:{func_name}:{params_str}"
+    else:
+        cache_key = f"{prefix}:{module}:{func_name}"
+
+    return cache_key
+
+
+async def register_cache_key(func, cache_key: str, request: Optional[Request] = None) -> None:
+    """
+    캐시 키를 월/시설 태그 Set에 등록 (부분 무효화 대상)
+
+    태그 Set은 TAG_TTL 후 만료되므로 캐시를 저장할 때마다 다시 등록한다.
+    """
+    query_params = dict(request.query_params) if request else {}
+    try:
+        backend = FastAPICache.get_backend()
+        await register_key(
+            backend.redis, FastAPICache.get_prefix(), cache_key,
+            resolve_tags(func.__name__, query_params), TAG_TTL
+        )
+    except Exception as e:
+        logger.warning(f"캐시 태그 등록 실패: {cache_key}, {e}")
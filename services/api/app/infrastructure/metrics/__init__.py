@@ -0,0 +1,9 @@
+from .db import InstrumentedAsyncQueuePool, QueryStats, current_query_stats, instrument_engine
+from .middleware import METRICS_PATH, MetricsMiddleware, metrics_endpoint
+from .query_budget import QueryBudgetExceeded, query_budget
+
+__all__ = [
+    "InstrumentedAsyncQueuePool", "QueryStats", "current_query_stats", "instrument_engine",
+    "METRICS_PATH", "MetricsMiddleware", "metrics_endpoint",
+    "QueryBudgetExceeded", "query_budget",
+]
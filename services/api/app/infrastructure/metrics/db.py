@@ -0,0 +1,117 @@
+"""
+SQLAlchemy 메트릭
+
+- 엔진 이벤트(before/after_cursor_execute)로 쿼리 시간 측정
+- 요청 단위 QueryStats(contextvar)에 쿼리 수/시간 누적 → MetricsMiddleware가 라우트별로 기록
+- 풀 checkout 대기 시간은 풀 클래스에서 측정 (SQLAlchemy에 checkout 이전 이벤트가 없음)
+- 쿼리 검사 모드(dev/test)에서는 정규화한 SQL 형태별 실행 횟수도 누적 (N+1 탐지)
+
+비동기 엔진도 sync_engine에 이벤트를 등록하면 되고,
+SQLAlchemy가 greenlet에 호출자의 context를 넘겨주므로 contextvar가 그대로 보인다.
+"""
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.infrastructure.metrics.registry import DB_POOL_CHECKOUT_WAIT, DB_QUERY_DURATION
+
+_QUERY_START = "metrics_query_start"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\([^)]+\)s|%s|\?")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """SQL → 형태 (리터럴/바인드 파라미터/IN 목록 길이 제거)"""
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryStats:
+    """요청 하나에서 실행된 쿼리 수/시간 (track_statements=True면 SQL 형태별 횟수도 기록)"""
+
+    __slots__ = ("count", "duration", "statements")
+
+    def __init__(self, track_statements: bool = False):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Optional[Counter] = Counter() if track_statements else None
+
+    def duplicates(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold번 이상 반복된 SQL 형태 (많은 순)"""
+        if not self.statements:
+            return []
+        return [(shape, n) for shape, n in self.statements.most_common() if n >= threshold]
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """현재 요청의 QueryStats (요청 밖이면 None)"""
+    return _query_stats.get()
+
+
+def bind_query_stats(stats: QueryStats) -> Token:
+    """현재 context에 QueryStats 연결 (미들웨어에서 요청 시작 시 호출)"""
+    return _query_stats.set(stats)
+
+
+def reset_query_stats(token: Token) -> None:
+    """bind_query_stats 이전 상태로 복원"""
+    _query_stats.reset(token)
+
+
+def _operation(statement: str) -> str:
+    """SQL 첫 키워드 (SELECT/INSERT/...)"""
+    head = statement.lstrip()[:16].split(None, 1)
+    return head[0].upper() if head else "UNKNOWN"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info[_QUERY_START] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info.pop(_QUERY_START, None)
+    if start is None:
+        return
+    elapsed = time.perf_counter() - start
+
+    DB_QUERY_DURATION.labels(_operation(statement)).observe(elapsed)
+
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += elapsed
+        if stats.statements is not None:
+            stats.statements[normalize_statement(statement)] += 1
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진에 쿼리 측정 이벤트 등록 (비동기 엔진은 sync_engine 전달)"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """checkout 대기 시간을 기록하는 비동기 큐 풀"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
@@ -0,0 +1,81 @@
+"""
+요청 메트릭 미들웨어 (순수 ASGI)
+
+- 라우트 템플릿별 요청 처리 시간
+- 요청당 SQL 쿼리 수/시간 (QueryStats)
+- 쿼리 검사 모드: 요청당 쿼리 예산 / N+1 검사 (query_budget)
+"""
+import time
+
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.shared.config import settings
+from app.infrastructure.metrics.db import QueryStats, bind_query_stats, reset_query_stats
+from app.infrastructure.metrics.query_budget import inspect_queries
+from app.infrastructure.metrics.registry import (
+    DB_QUERIES_PER_REQUEST,
+    DB_TIME_PER_REQUEST,
+    REQUEST_LATENCY,
+)
+
+METRICS_PATH = "/metrics"
+
+# 매칭되는 라우트가 없는 요청 (404 스캔 등)은 하나의 라벨로 묶음
+_UNMATCHED = "unmatched"
+
+
+def _route_template(scope: Scope) -> str:
+    """요청 경로 → 라우트 템플릿 (/api/facilities/{facility_id} 등)"""
+    app = scope.get("app")
+    router = getattr(app, "router", None)
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return _UNMATCHED
+
+
+class MetricsMiddleware:
+    """요청 처리 시간 및 요청당 쿼리 메트릭 기록"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] == METRICS_PATH:
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(track_statements=settings.QUERY_INSPECTION_ENABLED)
+        token = bind_query_stats(stats)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # 응답 시작 시점에는 엔드포인트 쿼리가 모두 끝난 상태
+                if stats.statements is not None:
+                    inspect_queries(scope, stats, message)
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            reset_query_stats(token)
+
+            route = _route_template(scope)
+            REQUEST_LATENCY.labels(scope["method"], route, str(status_code)).observe(elapsed)
+            DB_QUERIES_PER_REQUEST.labels(route).observe(stats.count)
+            DB_TIME_PER_REQUEST.labels(route).observe(stats.duration)
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus scrape 엔드포인트"""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,75 @@
+"""
+요청당 쿼리 예산 / N+1 검사 (dev/test 전용, QUERY_INSPECTION_ENABLED)
+
+- 응답 헤더 X-Query-Count에 요청당 쿼리 수를 싣는다.
+- 같은 형태의 SQL이 QUERY_DUPLICATE_THRESHOLD번 이상 반복되면 N+1 의심으로 경고 로그를 남긴다.
+- 쿼리 수가 라우트 예산(@query_budget, 기본 QUERY_BUDGET_DEFAULT)을 넘으면
+  X-Query-Budget-Exceeded 헤더 + 경고 로그, QUERY_BUDGET_STRICT면 QueryBudgetExceeded를 발생시켜
+  500 응답(테스트에서는 예외)으로 실패시킨다.
+
+Usage:
+    @router.get("/schedules/daily")
+    @query_budget(10)
+    @cached(...)
+    async def get_daily_schedules(...): ...
+"""
+import logging
+from typing import Callable, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import Message, Scope
+
+from app.shared.config import settings
+from app.infrastructure.metrics.db import QueryStats
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-Query-Count"
+QUERY_BUDGET_HEADER = "X-Query-Budget-Exceeded"
+
+_BUDGET_ATTR = "__query_budget__"
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """라우트 쿼리 예산 초과 (QUERY_BUDGET_STRICT)"""
+
+
+def query_budget(max_queries: int) -> Callable:
+    """엔드포인트 요청당 최대 쿼리 수 지정"""
+
+    def wrapper(func):
+        setattr(func, _BUDGET_ATTR, max_queries)
+        return func
+
+    return wrapper
+
+
+def budget_for(endpoint: Optional[Callable]) -> int:
+    """엔드포인트 예산 (미지정 시 기본값)"""
+    return getattr(endpoint, _BUDGET_ATTR, settings.QUERY_BUDGET_DEFAULT)
+
+
+def inspect_queries(scope: Scope, stats: QueryStats, message: Message) -> None:
+    """
+    응답 시작 직전 쿼리 검사 (http.response.start 메시지에 헤더 추가)
+
+    Raises:
+        QueryBudgetExceeded: 예산 초과 + QUERY_BUDGET_STRICT
+    """
+    path = scope.get("path", "")
+    headers = MutableHeaders(scope=message)
+    headers.append(QUERY_COUNT_HEADER, str(stats.count))
+
+    for shape, count in stats.duplicates(settings.QUERY_DUPLICATE_THRESHOLD):
+        logger.warning(f"N+1 의심: {path} 동일 쿼리 {count}회 - {shape[:200]}")
+
+    budget = budget_for(scope.get("endpoint"))
+    if stats.count <= budget:
+        return
+
+    headers.append(QUERY_BUDGET_HEADER, f"{stats.count}/{budget}")
+    detail = f"쿼리 예산 초과: {path} {stats.count}/{budget}"
+    logger.warning(detail)
+
+    if settings.QUERY_BUDGET_STRICT:
+        raise QueryBudgetExceeded(detail)
@@ -0,0 +1,58 @@
+"""
+Prometheus 메트릭 정의
+
+/metrics 엔드포인트가 기본 registry를 그대로 노출한다.
+라벨에는 라우트 템플릿(/api/schedules/daily)만 사용해 cardinality를 고정한다.
+"""
+from prometheus_client import Counter, Histogram
+
+# 일별 스케줄 등 캐시 hit는 ms 미만, DB 경유는 수십 ms~수 초
+_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+_QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+REQUEST_LATENCY = Histogram(
+    "swim_api_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route", "status"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+CACHE_REQUESTS = Counter(
+    "swim_api_cache_requests_total",
+    "캐시 데코레이터 결과 (hit/stale/miss/coalesced)",
+    ["endpoint", "result"],
+)
+
+CACHE_BACKEND_LOOKUPS = Counter(
+    "swim_api_cache_backend_lookups_total",
+    "캐시 backend 조회 결과 (l1/l2/none)",
+    ["tier"],
+)
+
+DB_QUERY_DURATION = Histogram(
+    "swim_api_db_query_duration_seconds",
+    "SQL 쿼리 실행 시간",
+    ["operation"],
+    buckets=_QUERY_BUCKETS,
+)
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    "swim_api_db_queries_per_request",
+    "요청당 SQL 쿼리 수",
+    ["route"],
+    buckets=_QUERY_COUNT_BUCKETS,
+)
+
+DB_TIME_PER_REQUEST = Histogram(
+    "swim_api_db_time_per_request_seconds",
+    "요청당 SQL 실행 시간 합계",
+    ["route"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "swim_api_db_pool_checkout_wait_seconds",
+    "커넥션 풀 checkout 대기 시간 (신규 연결 생성 포함)",
+    buckets=_QUERY_BUCKETS,
+)
@@ -1,19 +1,24 @@
-from .database import engine, SessionLocal, get_db
+from .database import engine, SessionLocal, get_db, async_engine, AsyncSessionLocal, get_async_db
 from .facility_repository import SqlAlchemyFacilityRepository
 from .schedule_repository import SqlAlchemyScheduleRepository
 from .closure_repository import SqlAlchemyClosureRepository
 from .notice_repository import SqlAlchemyNoticeRepository
 from .fee_repository import SqlAlchemyFeeRepository
 from .review_repository import SqlAlchemyReviewRepository
+from .daily_schedule_repository import SqlAlchemyDailyScheduleRepository
+from .calendar_snapshot_repository import SqlAlchemyCalendarSnapshotRepository
 from .dependencies import get_schedule_service, get_review_service
 
 __all__ = [
     "engine", "SessionLocal", "get_db",
+    "async_engine", "AsyncSessionLocal", "get_async_db",
     "SqlAlchemyFacilityRepository",
     "SqlAlchemyScheduleRepository",
     "SqlAlchemyClosureRepository",
     "SqlAlchemyNoticeRepository",
     "SqlAlchemyFeeRepository",
     "SqlAlchemyReviewRepository",
+    "SqlAlchemyDailyScheduleRepository",
+    "SqlAlchemyCalendarSnapshotRepository",
     "get_schedule_service", "get_review_service",
 ]
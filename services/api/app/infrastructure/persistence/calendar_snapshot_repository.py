@@ -0,0 +1,19 @@
+"""SqlAlchemy CalendarSnapshot Repository 구현체"""
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.calendar_snapshot.model import CalendarSnapshot
+from app.domain.calendar_snapshot.repository import CalendarSnapshotRepository
+
+
+class SqlAlchemyCalendarSnapshotRepository(CalendarSnapshotRepository):
+
+    def __init__(self, db: AsyncSession):
+        self._db = db
+
+    async def find_payload(self, valid_month: str) -> Optional[str]:
+        # 엔티티 로딩 없이 payload 컬럼만 조회
+        stmt = select(CalendarSnapshot.payload).where(CalendarSnapshot.valid_month == valid_month)
+        return (await self._db.execute(stmt)).scalar_one_or_none()
@@ -1,8 +1,9 @@
 """SqlAlchemy Closure Repository 구현체"""
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.closure.model import FacilityClosure
 from app.domain.closure.repository import ClosureRepository
@@ -10,10 +11,10 @@ from app.domain.closure.repository import ClosureRepository
 
 class SqlAlchemyClosureRepository(ClosureRepository):
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self._db = db
 
-    def find_by_facility_and_month(
+    async def find_by_facility_and_month(
         self, facility_id: int, valid_month: str
     ) -> List[FacilityClosure]:
         stmt = (
@@ -23,9 +24,9 @@ class SqlAlchemyClosureRepository(ClosureRepository):
                 FacilityClosure.valid_month == valid_month
             )
         )
-        return list(self._db.execute(stmt).scalars().all())
+        return list((await self._db.execute(stmt)).scalars().all())
 
-    def find_first_by_facility_and_month(
+    async def find_first_by_facility_and_month(
         self, facility_id: int, valid_month: str
     ) -> Optional[FacilityClosure]:
         stmt = (
@@ -36,4 +37,23 @@ class SqlAlchemyClosureRepository(ClosureRepository):
             )
             .limit(1)
         )
-        return self._db.execute(stmt).scalar_one_or_none()
+        return (await self._db.execute(stmt)).scalar_one_or_none()
+
+    async def find_by_facility_months(
+        self, pairs: Iterable[Tuple[int, str]]
+    ) -> Dict[Tuple[int, str], List[FacilityClosure]]:
+        pairs = list(set(pairs))
+        grouped: Dict[Tuple[int, str], List[FacilityClosure]] = defaultdict(list)
+        if not pairs:
+            return grouped
+
+        stmt = (
+            select(FacilityClosure)
+            .where(
+                tuple_(FacilityClosure.facility_id, FacilityClosure.valid_month).in_(pairs)
+            )
+            .order_by(FacilityClosure.id)
+        )
+        for closure in (await self._db.execute(stmt)).scalars().all():
+            grouped[(closure.facility_id, closure.valid_month)].append(closure)
+        return grouped
@@ -0,0 +1,75 @@
+"""SqlAlchemy DailySchedule Repository 구현체"""
+from datetime import date
+from typing import List, Set
+
+from sqlalchemy import select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.daily_schedule.model import DailySchedule, DailyScheduleMonth
+from app.domain.daily_schedule.repository import DailyScheduleRepository
+from app.domain.closure.model import FacilityClosure
+from app.domain.facility.model import Facility
+from app.domain.schedule.model import SwimSchedule
+
+
+class SqlAlchemyDailyScheduleRepository(DailyScheduleRepository):
+
+    # 생성이 완료된 월 (프로세스 단위, 요청마다 만들어지는 저장소 간 공유)
+    _materialized_months: Set[str] = set()
+
+    def __init__(self, db: AsyncSession):
+        self._db = db
+
+    async def find_by_date(self, target_date: date) -> List[dict]:
+        stmt = (
+            select(
+                DailySchedule,
+                Facility.name,
+                Facility.address,
+                Facility.website_url,
+            )
+            .join(Facility, Facility.id == DailySchedule.facility_id)
+            .where(DailySchedule.date == target_date)
+            .order_by(Facility.name)
+        )
+
+        return [
+            {
+                "facility_id": row.DailySchedule.facility_id,
+                "facility_name": row.name,
+                "address": row.address,
+                "website_url": row.website_url,
+                "date": target_date.isoformat(),
+                "day_type": row.DailySchedule.day_type,
+                "season": row.DailySchedule.season or "",
+                "valid_month": row.DailySchedule.valid_month,
+                "sessions": row.DailySchedule.sessions or [],
+                "source_url": row.DailySchedule.source_url,
+                "notice_title": row.DailySchedule.notice_title,
+                "is_closed": bool(row.DailySchedule.is_closed),
+                "closure_reason": row.DailySchedule.closure_reason,
+                "fees": row.DailySchedule.fees or [],
+                "crawled_at": row.DailySchedule.crawled_at.isoformat() if row.DailySchedule.crawled_at else None,
+            }
+            for row in (await self._db.execute(stmt)).all()
+        ]
+
+    async def is_month_materialized(self, valid_month: str) -> bool:
+        if valid_month in self._materialized_months:
+            return True
+
+        # 스케줄/휴장 데이터가 있는 (시설, 월)은 parser 저장 시 항상 DailyScheduleBuilder.refresh를 거치며
+        # daily_schedule_month에 기록된다 (0일이어도 기록). 기록이 빠진 시설이 있으면 백필 전
+        with_data = union(
+            select(SwimSchedule.facility_id).where(SwimSchedule.valid_month == valid_month),
+            select(FacilityClosure.facility_id).where(FacilityClosure.valid_month == valid_month),
+        ).subquery()
+        marked = select(DailyScheduleMonth.facility_id).where(DailyScheduleMonth.valid_month == valid_month)
+
+        stmt = select(with_data.c.facility_id).where(with_data.c.facility_id.not_in(marked)).limit(1)
+        if (await self._db.execute(stmt)).first() is not None:
+            return False
+
+        # 이후 저장도 같은 트랜잭션에서 기록되므로 한 번 완료된 월은 계속 완료 상태
+        self._materialized_months.add(valid_month)
+        return True
@@ -2,12 +2,16 @@
 Database Session Management
 
 SQLAlchemy 세션 관리 및 FastAPI 의존성 주입
+- 비동기 엔진(aiomysql): API 요청 처리 (이벤트 루프 블로킹 없음)
+- 동기 엔진(pymysql): 시작 시 테이블 생성 등 관리 작업
 """
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.shared.config import settings
+from app.infrastructure.metrics.db import InstrumentedAsyncQueuePool, instrument_engine
 
 # SQLAlchemy 엔진 생성
 SQLALCHEMY_DATABASE_URL = settings.db_url
@@ -28,21 +32,46 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# 비동기 엔진 (요청 처리용, 쿼리/풀 checkout 메트릭 수집)
+async_engine = create_async_engine(
+    settings.async_db_url,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+    pool_recycle=3600,
+    echo=False,
+)
+instrument_engine(async_engine.sync_engine)
+
+# 비동기 세션 팩토리 (커밋 후 속성 접근 시 lazy load가 일어나지 않도록 expire 비활성화)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 
 def get_db() -> Generator[Session, None, None]:
+    """동기 DB 세션 (관리 작업/스크립트용)"""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    FastAPI 의존성 주입용 DB 세션
+    FastAPI 의존성 주입용 비동기 DB 세션
 
     Usage:
         @app.get("/items")
-        def get_items(db: Session = Depends(get_db)):
-            return db.query(Item).all()
+        async def get_items(db: AsyncSession = Depends(get_async_db)):
+            return (await db.execute(select(Item))).scalars().all()
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-__all__ = ["engine", "SessionLocal", "get_db"]
+__all__ = ["engine", "SessionLocal", "get_db", "async_engine", "AsyncSessionLocal", "get_async_db"]
@@ -3,45 +3,58 @@ FastAPI Depends() 팩토리 함수
 
 Repository → Service DI 체인
 """
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.infrastructure.persistence.database import get_db
+from app.infrastructure.persistence.database import AsyncSessionLocal, get_async_db
 from app.infrastructure.persistence.facility_repository import SqlAlchemyFacilityRepository
 from app.infrastructure.persistence.schedule_repository import SqlAlchemyScheduleRepository
 from app.infrastructure.persistence.closure_repository import SqlAlchemyClosureRepository
 from app.infrastructure.persistence.notice_repository import SqlAlchemyNoticeRepository
 from app.infrastructure.persistence.fee_repository import SqlAlchemyFeeRepository
 from app.infrastructure.persistence.review_repository import SqlAlchemyReviewRepository
+from app.infrastructure.persistence.daily_schedule_repository import SqlAlchemyDailyScheduleRepository
+from app.infrastructure.persistence.calendar_snapshot_repository import SqlAlchemyCalendarSnapshotRepository
 from app.application.schedule.service import ScheduleService
 from app.application.review.service import ReviewService
 
 
 # Repository factories
-def get_facility_repository(db: Session = Depends(get_db)):
+def get_facility_repository(db: AsyncSession = Depends(get_async_db)):
     return SqlAlchemyFacilityRepository(db)
 
 
-def get_schedule_repository(db: Session = Depends(get_db)):
+def get_schedule_repository(db: AsyncSession = Depends(get_async_db)):
     return SqlAlchemyScheduleRepository(db)
 
 
-def get_closure_repository(db: Session = Depends(get_db)):
+def get_closure_repository(db: AsyncSession = Depends(get_async_db)):
     return SqlAlchemyClosureRepository(db)
 
 
-def get_notice_repository(db: Session = Depends(get_db)):
+def get_notice_repository(db: AsyncSession = Depends(get_async_db)):
     return SqlAlchemyNoticeRepository(db)
 
 
-def get_fee_repository(db: Session = Depends(get_db)):
+def get_fee_repository(db: AsyncSession = Depends(get_async_db)):
     return SqlAlchemyFeeRepository(db)
 
 
-def get_review_repository(db: Session = Depends(get_db)):
+def get_review_repository(db: AsyncSession = Depends(get_async_db)):
     return SqlAlchemyReviewRepository(db)
 
 
+def get_daily_schedule_repository(db: AsyncSession = Depends(get_async_db)):
+    return SqlAlchemyDailyScheduleRepository(db)
+
+
+def get_calendar_snapshot_repository(db: AsyncSession = Depends(get_async_db)):
+    return SqlAlchemyCalendarSnapshotRepository(db)
+
+
 # Service factories
 def get_schedule_service(
     facility_repo=Depends(get_facility_repository),
@@ -49,8 +62,33 @@ def get_schedule_service(
     closure_repo=Depends(get_closure_repository),
     notice_repo=Depends(get_notice_repository),
     fee_repo=Depends(get_fee_repository),
+    daily_schedule_repo=Depends(get_daily_schedule_repository),
+    calendar_snapshot_repo=Depends(get_calendar_snapshot_repository),
 ):
-    return ScheduleService(facility_repo, schedule_repo, closure_repo, notice_repo, fee_repo)
+    return ScheduleService(
+        facility_repo, schedule_repo, closure_repo, notice_repo, fee_repo,
+        daily_schedule_repo, calendar_snapshot_repo,
+    )
+
+
+@asynccontextmanager
+async def schedule_service_scope() -> AsyncIterator[ScheduleService]:
+    """
+    요청과 독립된 세션의 ScheduleService
+
+    캐시 single-flight/백그라운드 갱신처럼 응답 이후에도 이어질 수 있는 계산용
+    (요청 세션은 응답 후 닫힘)
+    """
+    async with AsyncSessionLocal() as db:
+        yield get_schedule_service(
+            SqlAlchemyFacilityRepository(db),
+            SqlAlchemyScheduleRepository(db),
+            SqlAlchemyClosureRepository(db),
+            SqlAlchemyNoticeRepository(db),
+            SqlAlchemyFeeRepository(db),
+            SqlAlchemyDailyScheduleRepository(db),
+            SqlAlchemyCalendarSnapshotRepository(db),
+        )
 
 
 def get_review_service(
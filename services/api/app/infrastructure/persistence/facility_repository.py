@@ -2,7 +2,7 @@
 from typing import List
 
 from sqlalchemy import select, func
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.facility.model import Facility
 from app.domain.facility.repository import FacilityRepository
@@ -11,10 +11,10 @@ from app.domain.schedule.model import SwimSchedule
 
 class SqlAlchemyFacilityRepository(FacilityRepository):
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self._db = db
 
-    def find_all_with_schedule_summary(self) -> List[dict]:
+    async def find_all_with_schedule_summary(self) -> List[dict]:
         stmt = (
             select(
                 Facility.id,
@@ -29,7 +29,7 @@ class SqlAlchemyFacilityRepository(FacilityRepository):
             .order_by(Facility.name)
         )
 
-        results = self._db.execute(stmt).all()
+        results = (await self._db.execute(stmt)).all()
 
         return [
             {
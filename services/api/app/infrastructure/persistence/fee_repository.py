@@ -1,8 +1,9 @@
 """SqlAlchemy Fee Repository 구현체"""
-from typing import List
+from collections import defaultdict
+from typing import Dict, Iterable, List
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.fee.model import Fee
 from app.domain.fee.repository import FeeRepository
@@ -10,9 +11,20 @@ from app.domain.fee.repository import FeeRepository
 
 class SqlAlchemyFeeRepository(FeeRepository):
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self._db = db
 
-    def find_by_facility_id(self, facility_id: int) -> List[Fee]:
+    async def find_by_facility_id(self, facility_id: int) -> List[Fee]:
         stmt = select(Fee).where(Fee.facility_id == facility_id)
-        return list(self._db.execute(stmt).scalars().all())
+        return list((await self._db.execute(stmt)).scalars().all())
+
+    async def find_by_facility_ids(self, facility_ids: Iterable[int]) -> Dict[int, List[Fee]]:
+        facility_ids = set(facility_ids)
+        grouped: Dict[int, List[Fee]] = defaultdict(list)
+        if not facility_ids:
+            return grouped
+
+        stmt = select(Fee).where(Fee.facility_id.in_(facility_ids)).order_by(Fee.id)
+        for fee in (await self._db.execute(stmt)).scalars().all():
+            grouped[fee.facility_id].append(fee)
+        return grouped
@@ -2,7 +2,8 @@
 from typing import List, Optional
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.domain.notice.model import Notice
 from app.domain.notice.repository import NoticeRepository
@@ -10,10 +11,10 @@ from app.domain.notice.repository import NoticeRepository
 
 class SqlAlchemyNoticeRepository(NoticeRepository):
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self._db = db
 
-    def find_by_facility_and_month(
+    async def find_by_facility_and_month(
         self, facility_id: int, valid_date: str
     ) -> Optional[Notice]:
         stmt = (
@@ -24,12 +25,14 @@ class SqlAlchemyNoticeRepository(NoticeRepository):
             )
             .limit(1)
         )
-        return self._db.execute(stmt).scalar_one_or_none()
+        return (await self._db.execute(stmt)).scalar_one_or_none()
 
-    def find_by_valid_month(self, valid_month: str) -> List[Notice]:
+    async def find_by_valid_month(self, valid_month: str) -> List[Notice]:
         stmt = (
             select(Notice)
             .join(Notice.facility)
+            .options(selectinload(Notice.facility).lazyload("*"))
             .where(Notice.valid_date == valid_month)
+            .order_by(Notice.id)
         )
-        return list(self._db.execute(stmt).scalars().all())
+        return list((await self._db.execute(stmt)).scalars().all())
@@ -2,7 +2,7 @@
 from typing import List, Optional
 
 from sqlalchemy import select, func
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.review.model import Review
 from app.domain.review.repository import ReviewRepository
@@ -10,21 +10,21 @@ from app.domain.review.repository import ReviewRepository
 
 class SqlAlchemyReviewRepository(ReviewRepository):
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self._db = db
 
-    def find_by_id(self, review_id: int) -> Optional[Review]:
-        return self._db.get(Review, review_id)
+    async def find_by_id(self, review_id: int) -> Optional[Review]:
+        return await self._db.get(Review, review_id)
 
-    def find_by_facility_id(self, facility_id: int) -> List[Review]:
+    async def find_by_facility_id(self, facility_id: int) -> List[Review]:
         stmt = (
             select(Review)
             .where(Review.facility_id == facility_id)
             .order_by(Review.created_at.desc())
         )
-        return list(self._db.execute(stmt).scalars().all())
+        return list((await self._db.execute(stmt)).scalars().all())
 
-    def get_stats(self, facility_id: int) -> dict:
+    async def get_stats(self, facility_id: int) -> dict:
         stmt = (
             select(
                 func.avg(Review.rating).label('average_rating'),
@@ -32,19 +32,19 @@ class SqlAlchemyReviewRepository(ReviewRepository):
             )
             .where(Review.facility_id == facility_id)
         )
-        row = self._db.execute(stmt).one()
+        row = (await self._db.execute(stmt)).one()
         return {
             "facility_id": facility_id,
             "average_rating": round(float(row.average_rating), 1) if row.average_rating else 0,
             "review_count": row.review_count
         }
 
-    def save(self, review: Review) -> Review:
+    async def save(self, review: Review) -> Review:
         self._db.add(review)
-        self._db.commit()
-        self._db.refresh(review)
+        await self._db.commit()
+        await self._db.refresh(review)
         return review
 
-    def delete(self, review: Review) -> None:
-        self._db.delete(review)
-        self._db.commit()
+    async def delete(self, review: Review) -> None:
+        await self._db.delete(review)
+        await self._db.commit()
@@ -1,8 +1,9 @@
 """SqlAlchemy Schedule Repository 구현체"""
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from sqlalchemy import select, func
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.domain.facility.model import Facility
 from app.domain.schedule.model import SwimSchedule
@@ -11,10 +12,10 @@ from app.domain.schedule.repository import ScheduleRepository
 
 class SqlAlchemyScheduleRepository(ScheduleRepository):
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self._db = db
 
-    def find_schedules(
+    async def find_schedules(
         self,
         facility_name: Optional[str] = None,
         valid_month: Optional[str] = None
@@ -23,7 +24,7 @@ class SqlAlchemyScheduleRepository(ScheduleRepository):
             select(SwimSchedule)
             .join(SwimSchedule.facility)
             .options(
-                selectinload(SwimSchedule.facility),
+                selectinload(SwimSchedule.facility).lazyload("*"),
                 selectinload(SwimSchedule.sessions)
             )
             .order_by(
@@ -38,16 +39,16 @@ class SqlAlchemyScheduleRepository(ScheduleRepository):
         if valid_month:
             stmt = stmt.where(SwimSchedule.valid_month == valid_month)
 
-        return list(self._db.execute(stmt).scalars().all())
+        return list((await self._db.execute(stmt)).scalars().all())
 
-    def find_by_day_type_and_month(
+    async def find_by_day_type_and_month(
         self, day_type: str, valid_month: str
     ) -> List[SwimSchedule]:
         stmt = (
             select(SwimSchedule)
             .join(SwimSchedule.facility)
             .options(
-                selectinload(SwimSchedule.facility),
+                selectinload(SwimSchedule.facility).lazyload("*"),
                 selectinload(SwimSchedule.sessions)
             )
             .where(
@@ -56,9 +57,9 @@ class SqlAlchemyScheduleRepository(ScheduleRepository):
             )
             .order_by(Facility.name)
         )
-        return list(self._db.execute(stmt).scalars().all())
+        return list((await self._db.execute(stmt)).scalars().all())
 
-    def count_by_facility_and_month(
+    async def count_by_facility_and_month(
         self, facility_id: int, valid_month: str
     ) -> int:
         stmt = (
@@ -68,4 +69,12 @@ class SqlAlchemyScheduleRepository(ScheduleRepository):
                 SwimSchedule.valid_month == valid_month
             )
         )
-        return self._db.execute(stmt).scalar()
+        return (await self._db.execute(stmt)).scalar()
+
+    async def find_facility_ids_by_month(self, valid_month: str) -> Set[int]:
+        stmt = (
+            select(SwimSchedule.facility_id)
+            .where(SwimSchedule.valid_month == valid_month)
+            .distinct()
+        )
+        return set((await self._db.execute(stmt)).scalars().all())
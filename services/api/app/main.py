@@ -12,9 +12,11 @@ from app.shared.logging.logging_config import setup_logging, get_logger
 from app.presentation.schedule.controller import router as schedule_router
 from app.presentation.review.controller import router as review_router
 from app.domain.base import Base
-from app.infrastructure.persistence.database import engine
+from app.infrastructure.persistence.database import engine, async_engine
 from app.infrastructure.cache.redis import init_cache, close_cache
 from app.infrastructure.cache.cache_subscriber import CacheSubscriber
+from app.infrastructure.cache.cache_warmer import CacheWarmer
+from app.infrastructure.metrics import METRICS_PATH, MetricsMiddleware, metrics_endpoint
 
 
 @asynccontextmanager
@@ -32,6 +34,8 @@ async def lifespan(app: FastAPI):
     from app.domain.fee.model import Fee
     from app.domain.closure.model import FacilityClosure
     from app.domain.review.model import Review
+    from app.domain.daily_schedule.model import DailySchedule, DailyScheduleMonth
+    from app.domain.calendar_snapshot.model import CalendarSnapshot
 
     Base.metadata.create_all(bind=engine)
 
@@ -39,14 +43,15 @@ async def lifespan(app: FastAPI):
     await init_cache()
 
     # 캐시 무효화 Subscriber 시작
-    cache_subscriber = CacheSubscriber()
+    cache_subscriber = CacheSubscriber(warmer=CacheWarmer(app))
     await cache_subscriber.start()
 
     yield
 
-    # Shutdown: 캐시 무효화 Subscriber 종료 → Redis 연결 종료
+    # Shutdown: 캐시 무효화 Subscriber 종료 → Redis 연결 종료 → DB 풀 정리
     await cache_subscriber.stop()
     await close_cache()
+    await async_engine.dispose()
 
 
 app = FastAPI(
@@ -69,6 +74,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 메트릭 (가장 바깥 미들웨어로 등록해 전체 처리 시간 측정)
+app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(schedule_router, prefix="/api", tags=["schedules"])
 app.include_router(review_router, prefix="/api", tags=["reviews"])
@@ -84,6 +92,9 @@ async def root():
     }
 
 
+app.add_route(METRICS_PATH, metrics_endpoint, include_in_schema=False)
+
+
 @app.get("/health")
 async def health_check():
     """헬스 체크"""
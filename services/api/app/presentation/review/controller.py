@@ -25,7 +25,7 @@ async def get_reviews(
     service: ReviewService = Depends(get_review_service),
 ):
     """시설별 리뷰 목록 조회 (최신순)"""
-    return service.get_reviews(facility_id)
+    return await service.get_reviews(facility_id)
 
 
 @router.get("/reviews/stats", response_model=ReviewStatsResponse)
@@ -34,7 +34,7 @@ async def get_review_stats(
     service: ReviewService = Depends(get_review_service),
 ):
     """시설별 리뷰 통계 (평균 별점, 리뷰 수)"""
-    return service.get_review_stats(facility_id)
+    return await service.get_review_stats(facility_id)
 
 
 @router.post("/reviews", response_model=ReviewResponse, status_code=201)
@@ -43,7 +43,7 @@ async def create_review(
     service: ReviewService = Depends(get_review_service),
 ):
     """리뷰 작성"""
-    return service.create_review(
+    return await service.create_review(
         facility_id=body.facility_id,
         nickname=body.nickname,
         password=body.password,
@@ -60,7 +60,7 @@ async def update_review(
 ):
     """리뷰 수정 (비밀번호 검증)"""
     try:
-        result = service.update_review(
+        result = await service.update_review(
             review_id=review_id,
             password=body.password,
             rating=body.rating,
@@ -83,7 +83,7 @@ async def delete_review(
 ):
     """리뷰 삭제 (비밀번호 검증)"""
     try:
-        result = service.delete_review(
+        result = await service.delete_review(
             review_id=review_id,
             password=body.password,
         )
@@ -5,26 +5,29 @@ Schedule API Controller (Routes)
 """
 from typing import List, Optional
 from fastapi import APIRouter, Query, HTTPException, Depends, Request
-from fastapi_cache.decorator import cache
 
 from app.application import ScheduleService
 from app.presentation.schedule.response import FacilityResponse
-from app.infrastructure.persistence.dependencies import get_schedule_service
+from app.infrastructure.persistence.dependencies import get_schedule_service, schedule_service_scope
 from app.shared.config import settings
-from app.infrastructure.cache import cache_key_builder
+from app.infrastructure.cache import cached
+from app.infrastructure.cache.fast_json import FastJSONResponse
+from app.infrastructure.metrics import query_budget
 
 router = APIRouter()
 
 
-@router.get("/facilities", response_model=List[FacilityResponse])
-@cache(expire=settings.CACHE_TTL_FACILITIES, key_builder=cache_key_builder)
+@router.get("/facilities", response_model=List[FacilityResponse], response_class=FastJSONResponse)
+@query_budget(2)
+@cached(expire=settings.CACHE_TTL_FACILITIES, fast=True, service_factory=schedule_service_scope)
 async def get_facilities(request: Request, service: ScheduleService = Depends(get_schedule_service)):
     """시설 목록 조회"""
-    return service.get_facilities()
+    return await service.get_facilities()
 
 
-@router.get("/schedules", response_model=List[dict])
-@cache(expire=settings.CACHE_TTL_SCHEDULES, key_builder=cache_key_builder)
+@router.get("/schedules", response_model=List[dict], response_class=FastJSONResponse)
+@query_budget(4)
+@cached(expire=settings.CACHE_TTL_SCHEDULES, fast=True, service_factory=schedule_service_scope)
 async def get_schedules(
     request: Request,
     facility: Optional[str] = Query(None, description="시설명 (예: 야탑유스센터)"),
@@ -32,11 +35,12 @@ async def get_schedules(
     service: ScheduleService = Depends(get_schedule_service),
 ):
     """스케줄 조회"""
-    return service.get_schedules(facility=facility, month=month)
+    return await service.get_schedules(facility=facility, month=month)
 
 
-@router.get("/schedules/daily", response_model=List[dict])
-@cache(expire=settings.CACHE_TTL_DAILY, key_builder=cache_key_builder)
+@router.get("/schedules/daily", response_model=List[dict], response_class=FastJSONResponse)
+@query_budget(10)
+@cached(expire=settings.CACHE_TTL_DAILY, fast=True, service_factory=schedule_service_scope)
 async def get_daily_schedules(
     request: Request,
     date: str = Query(..., description="날짜 (YYYY-MM-DD 형식, 예: 2026-01-18)"),
@@ -46,7 +50,7 @@ async def get_daily_schedules(
     if len(date) != 10 or date.count('-') != 2:
         raise HTTPException(status_code=400, detail="날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식을 사용하세요.")
 
-    schedules = service.get_daily_schedules(date)
+    schedules = await service.get_daily_schedules(date)
 
     if not schedules:
         return []
@@ -54,8 +58,9 @@ async def get_daily_schedules(
     return schedules
 
 
-@router.get("/schedules/calendar")
-@cache(expire=settings.CACHE_TTL_CALENDAR, key_builder=cache_key_builder)
+@router.get("/schedules/calendar", response_class=FastJSONResponse)
+@query_budget(6)
+@cached(expire=settings.CACHE_TTL_CALENDAR, fast=True, service_factory=schedule_service_scope)
 async def get_calendar_schedules(
     request: Request,
     year: int = Query(..., description="년도 (예: 2026)"),
@@ -63,4 +68,8 @@ async def get_calendar_schedules(
     service: ScheduleService = Depends(get_schedule_service),
 ):
     """달력용 스케줄 조회"""
-    return service.get_calendar_data(year=year, month=month)
+    # 스냅샷은 저장된 JSON을 그대로 응답 (decode/재인코딩 없음)
+    snapshot = await service.get_calendar_snapshot(year=year, month=month)
+    if snapshot is not None:
+        return FastJSONResponse(snapshot)
+    return await service.get_calendar_data(year=year, month=month)
@@ -37,6 +37,11 @@ class Settings:
         """SQLAlchemy 데이터베이스 URL"""
         return f"mysql+pymysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def async_db_url(self) -> str:
+        """SQLAlchemy 비동기 데이터베이스 URL (aiomysql)"""
+        return f"mysql+aiomysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+
     # 로깅 설정
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT: str = os.getenv("LOG_FORMAT", "json")  # "json" or "text"
@@ -67,6 +72,22 @@ class Settings:
     CACHE_TTL_DAILY: int = 43200        # 12시간 - 일별 스케줄
     CACHE_TTL_CALENDAR: int = 86400     # 24시간 - 캘린더 데이터
 
+    # 만료 후 stale 값을 반환하며 백그라운드 갱신하는 시간 (초)
+    CACHE_STALE_TTL: int = int(os.getenv("CACHE_STALE_TTL", "3600"))
+
+    # 배치 완료 후 일별 스케줄 캐시 워밍 일수 (오늘 포함)
+    CACHE_WARMUP_DAYS: int = int(os.getenv("CACHE_WARMUP_DAYS", "14"))
+
+    # 프로세스 내 L1 캐시 (Redis 앞단, 0이면 비활성화)
+    CACHE_L1_MAX_ENTRIES: int = int(os.getenv("CACHE_L1_MAX_ENTRIES", "256"))
+    CACHE_L1_TTL: int = int(os.getenv("CACHE_L1_TTL", "300"))  # 5분 - pub/sub 유실 대비 상한
+
+    # 요청당 쿼리 검사 (N+1 탐지 / 쿼리 예산, dev/test 전용 - 명시적으로 켠 경우만 활성화)
+    QUERY_INSPECTION_ENABLED: bool = os.getenv("QUERY_INSPECTION_ENABLED", "false").lower() == "true"
+    QUERY_BUDGET_DEFAULT: int = int(os.getenv("QUERY_BUDGET_DEFAULT", "10"))
+    QUERY_BUDGET_STRICT: bool = os.getenv("QUERY_BUDGET_STRICT", "false").lower() == "true"  # 초과 시 500 (테스트용)
+    QUERY_DUPLICATE_THRESHOLD: int = int(os.getenv("QUERY_DUPLICATE_THRESHOLD", "3"))
+
 
 # 싱글톤 인스턴스
 settings = Settings()
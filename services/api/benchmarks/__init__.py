@@ -0,0 +1,16 @@
+"""
+ScheduleService 성능 벤치마크
+
+합성 데이터(현재 규모의 N배)를 SQLite/MariaDB에 적재하고
+서비스 메서드/엔드포인트의 응답 시간, 쿼리 수, 메모리를 기록한다.
+
+Usage:
+    cd services/api
+    python -m benchmarks.schedule_service --scales 10 100 1000
+"""
+import os
+
+# app import 시점에 settings와 로깅이 초기화되므로 그 전에 설정
+# (파일 로깅 비활성화 → logs/ 디렉터리를 만들지 않음, 서비스 INFO 로그 생략)
+os.environ.setdefault("LOG_FILE_ENABLED", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
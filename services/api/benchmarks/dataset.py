@@ -0,0 +1,364 @@
+"""
+벤치마크용 합성 데이터셋
+
+현재 운영 규모(시설 8곳, 월 6개)를 기준으로 시설 수를 scale배 늘려
+스케줄/세션/휴무/공지/이용료 행 수가 모두 scale배가 되도록 만든다.
+월/세션/휴무 밀도는 현재 수준을 유지한다. (--months로 월 수 조정 가능)
+
+- 첫 달: parser가 미리 만드는 daily_schedule / calendar_snapshot 적재 (materialized 경로)
+- 둘째 달 이후: 적재 없음 (ORM 실시간 계산 경로)
+- 시설 50곳 중 1곳은 매달 전체 휴장 (스케줄 없음, 공지 + 휴무만 존재)
+
+같은 scale/seed면 항상 같은 데이터가 만들어진다.
+"""
+import calendar
+import json
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.domain.base import Base
+from app.domain.facility.model import Facility
+from app.domain.schedule.model import SwimSchedule, SwimSession
+from app.domain.notice.model import Notice
+from app.domain.fee.model import Fee
+from app.domain.closure.model import FacilityClosure
+from app.domain.review.model import Review  # noqa: F401 (Base.metadata 등록)
+from app.domain.daily_schedule.model import DailySchedule, DailyScheduleMonth
+from app.domain.calendar_snapshot.model import CalendarSnapshot
+from app.application.schedule.service import ScheduleService
+from app.infrastructure.persistence.facility_repository import SqlAlchemyFacilityRepository
+from app.infrastructure.persistence.schedule_repository import SqlAlchemyScheduleRepository
+from app.infrastructure.persistence.closure_repository import SqlAlchemyClosureRepository
+from app.infrastructure.persistence.notice_repository import SqlAlchemyNoticeRepository
+from app.infrastructure.persistence.fee_repository import SqlAlchemyFeeRepository
+from app.infrastructure.persistence.daily_schedule_repository import SqlAlchemyDailyScheduleRepository
+from app.infrastructure.persistence.calendar_snapshot_repository import SqlAlchemyCalendarSnapshotRepository
+from app.shared.util import get_season_from_month, should_include_session
+
+# 현재 운영 규모 근사치
+BASELINE_FACILITIES = 8
+BASELINE_MONTHS = 6
+
+DAY_TYPES = ("평일", "토요일", "일요일")
+WEEKDAY_NAMES = ("월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일")
+SESSIONS_PER_DAY_TYPE = {"평일": 6, "토요일": 4, "일요일": 4}
+FEE_CATEGORIES = (("성인", 4000), ("청소년", 3000), ("어린이", 2500), ("경로", 2000))
+
+FULL_CLOSURE_EVERY = 50
+INSERT_CHUNK = 5000
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """합성 데이터셋 규격"""
+    scale: int
+    months: int = BASELINE_MONTHS
+    start_month: str = "2026-01"
+    seed: int = 42
+
+    @property
+    def facility_count(self) -> int:
+        return BASELINE_FACILITIES * self.scale
+
+    @property
+    def month_list(self) -> List[str]:
+        year, month = map(int, self.start_month.split("-"))
+        result = []
+        for _ in range(self.months):
+            result.append(f"{year}-{month:02d}")
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return result
+
+    @property
+    def materialized_month(self) -> str:
+        """daily_schedule / calendar_snapshot이 적재된 달"""
+        return self.month_list[0]
+
+    @property
+    def fallback_month(self) -> str:
+        """적재 데이터 없이 실시간 계산하는 달"""
+        months = self.month_list
+        return months[1] if len(months) > 1 else months[0]
+
+    @staticmethod
+    def facility_name(facility_id: int) -> str:
+        return f"벤치수영장{facility_id:05d}"
+
+
+def _is_full_closure(facility_id: int) -> bool:
+    return facility_id % FULL_CLOSURE_EVERY == 0
+
+
+def _day_type(day: date) -> str:
+    weekday = day.weekday()
+    if weekday == 5:
+        return "토요일"
+    if weekday == 6:
+        return "일요일"
+    return "평일"
+
+
+def _month_days(valid_month: str) -> List[date]:
+    year, month = map(int, valid_month.split("-"))
+    return [date(year, month, d) for d in range(1, calendar.monthrange(year, month)[1] + 1)]
+
+
+class _Generator:
+    """DatasetSpec → 테이블별 행 목록"""
+
+    def __init__(self, spec: DatasetSpec):
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.rows: Dict[str, List[dict]] = {
+            table: [] for table in (
+                "facility", "notice", "fee", "swim_schedule", "swim_session",
+                "facility_closure", "daily_schedule", "daily_schedule_month",
+            )
+        }
+        self._notice_id = 0
+        self._schedule_id = 0
+        self._session_id = 0
+        self._closure_id = 0
+
+    def build(self) -> Dict[str, List[dict]]:
+        crawled_at = datetime(2026, 1, 1, 6, 0, 0)
+
+        for facility_id in range(1, self.spec.facility_count + 1):
+            self.rows["facility"].append({
+                "id": facility_id,
+                "name": self.spec.facility_name(facility_id),
+                "address": f"경기도 성남시 벤치구 {facility_id}번길",
+                "website_url": f"https://bench.example.com/facility/{facility_id}",
+            })
+            fees = self._fees(facility_id)
+
+            for valid_month in self.spec.month_list:
+                notice = self._notice(facility_id, valid_month, crawled_at)
+                closures = self._closures(facility_id, valid_month, notice["id"])
+
+                sessions_by_day_type = {}
+                if not _is_full_closure(facility_id):
+                    for day_type in DAY_TYPES:
+                        sessions_by_day_type[day_type] = self._schedule(
+                            facility_id, valid_month, notice["id"], day_type
+                        )
+
+                if valid_month == self.spec.materialized_month:
+                    self._daily(facility_id, valid_month, notice, closures, fees, sessions_by_day_type)
+
+        return self.rows
+
+    def _fees(self, facility_id: int) -> List[dict]:
+        fees = []
+        for category, price in FEE_CATEGORIES:
+            row = {"facility_id": facility_id, "category": category, "price": price, "note": None}
+            self.rows["fee"].append(row)
+            fees.append(row)
+        return fees
+
+    def _notice(self, facility_id: int, valid_month: str, crawled_at: datetime) -> dict:
+        self._notice_id += 1
+        row = {
+            "id": self._notice_id,
+            "facility_id": facility_id,
+            "title": f"{valid_month} 자유수영 운영 안내 ({self.spec.facility_name(facility_id)})",
+            "source_url": f"https://bench.example.com/notice/{self._notice_id}",
+            "valid_date": valid_month,
+            "crawled_at": crawled_at,
+        }
+        self.rows["notice"].append(row)
+        return row
+
+    def _closures(self, facility_id: int, valid_month: str, notice_id: int) -> List[dict]:
+        closures = []
+
+        def add(**values):
+            self._closure_id += 1
+            row = {
+                "id": self._closure_id,
+                "facility_id": facility_id,
+                "notice_id": notice_id,
+                "valid_month": valid_month,
+                "day_of_week": None,
+                "week_pattern": None,
+                "closure_date": None,
+                **values,
+            }
+            self.rows["facility_closure"].append(row)
+            closures.append(row)
+
+        if _is_full_closure(facility_id):
+            add(closure_type="specific_date", reason="시설 보수공사로 인한 임시휴장")
+            return closures
+
+        add(
+            closure_type="regular",
+            day_of_week=WEEKDAY_NAMES[self.rng.randrange(5)],
+            week_pattern="2,4",
+            reason="정기휴관",
+        )
+        for day in self.rng.sample(_month_days(valid_month), 2):
+            add(closure_type="specific_date", closure_date=day, reason="수질 관리")
+        return closures
+
+    def _schedule(self, facility_id: int, valid_month: str, notice_id: int, day_type: str) -> List[dict]:
+        self._schedule_id += 1
+        schedule_id = self._schedule_id
+        month_num = int(valid_month.split("-")[1])
+        # 일부 시설은 연중 운영 (season 없음)
+        season = None if facility_id % 10 == 0 else get_season_from_month(month_num)
+
+        self.rows["swim_schedule"].append({
+            "id": schedule_id,
+            "facility_id": facility_id,
+            "notice_id": notice_id,
+            "day_type": day_type,
+            "season": season,
+            "valid_month": valid_month,
+        })
+
+        sessions = []
+        for index in range(SESSIONS_PER_DAY_TYPE[day_type]):
+            self._session_id += 1
+            start_hour = 6 + index * 2
+            row = {
+                "id": self._session_id,
+                "schedule_id": schedule_id,
+                "session_name": f"{index + 1}부",
+                "start_time": time(start_hour, 0),
+                "end_time": time(start_hour + 1, 50),
+                "capacity": self.rng.choice((40, 60, 80)),
+                "lanes": self.rng.choice((2, 3, 4)),
+                # 평일 마지막 회차는 수요일만 운영
+                "applicable_days": "수" if day_type == "평일" and index == SESSIONS_PER_DAY_TYPE[day_type] - 1 else None,
+            }
+            self.rows["swim_session"].append(row)
+            sessions.append(row)
+        return sessions
+
+    def _daily(self, facility_id: int, valid_month: str, notice: dict, closures: List[dict],
+               fees: List[dict], sessions_by_day_type: Dict[str, List[dict]]) -> None:
+        closed_dates = {c["closure_date"] for c in closures if c["closure_date"] is not None}
+        full_closure = _is_full_closure(facility_id)
+        month_num = int(valid_month.split("-")[1])
+
+        for day in _month_days(valid_month):
+            day_type = _day_type(day)
+            is_closed = full_closure or day in closed_dates
+            sessions = [] if is_closed else [
+                {
+                    "session_name": s["session_name"],
+                    "start_time": str(s["start_time"]),
+                    "end_time": str(s["end_time"]),
+                    "capacity": s["capacity"],
+                    "lanes": s["lanes"],
+                }
+                for s in sessions_by_day_type.get(day_type, [])
+                if should_include_session(s["applicable_days"], day.weekday())
+            ]
+            self.rows["daily_schedule"].append({
+                "date": day,
+                "facility_id": facility_id,
+                "valid_month": valid_month,
+                "day_type": day_type,
+                "season": "" if facility_id % 10 == 0 else get_season_from_month(month_num),
+                "is_closed": is_closed,
+                "closure_reason": closures[0]["reason"] if is_closed else None,
+                "sessions": sessions,
+                "fees": [{"category": f["category"], "price": f["price"], "note": ""} for f in fees],
+                "source_url": notice["source_url"],
+                "notice_title": notice["title"],
+                "crawled_at": notice["crawled_at"],
+            })
+
+        self.rows["daily_schedule_month"].append({
+            "facility_id": facility_id,
+            "valid_month": valid_month,
+            "day_count": len(_month_days(valid_month)),
+        })
+
+
+_TABLES = (
+    ("facility", Facility),
+    ("notice", Notice),
+    ("fee", Fee),
+    ("swim_schedule", SwimSchedule),
+    ("swim_session", SwimSession),
+    ("facility_closure", FacilityClosure),
+    ("daily_schedule", DailySchedule),
+    ("daily_schedule_month", DailyScheduleMonth),
+)
+
+
+def build_service(db: AsyncSession, materialized: bool = True) -> ScheduleService:
+    """
+    dependencies.get_schedule_service와 같은 구성의 서비스
+
+    Args:
+        db: 비동기 세션
+        materialized: False면 daily_schedule / calendar_snapshot 저장소 없이 구성 (실시간 계산만)
+    """
+    return ScheduleService(
+        SqlAlchemyFacilityRepository(db),
+        SqlAlchemyScheduleRepository(db),
+        SqlAlchemyClosureRepository(db),
+        SqlAlchemyNoticeRepository(db),
+        SqlAlchemyFeeRepository(db),
+        SqlAlchemyDailyScheduleRepository(db) if materialized else None,
+        SqlAlchemyCalendarSnapshotRepository(db) if materialized else None,
+    )
+
+
+def _chunks(rows: List[dict], size: int) -> Iterable[List[dict]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+async def seed(engine: AsyncEngine, spec: DatasetSpec) -> Dict[str, int]:
+    """
+    테이블 재생성 후 합성 데이터 적재
+
+    Returns:
+        테이블별 행 수
+    """
+    rows = _Generator(spec).build()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        for table, model in _TABLES:
+            for chunk in _chunks(rows[table], INSERT_CHUNK):
+                await conn.execute(model.__table__.insert(), chunk)
+
+    counts = {table: len(rows[table]) for table, _ in _TABLES}
+    counts["calendar_snapshot"] = await _seed_calendar_snapshot(engine, spec)
+    return counts
+
+
+async def _seed_calendar_snapshot(engine: AsyncEngine, spec: DatasetSpec) -> int:
+    """materialized 달의 달력 응답을 실시간 계산 경로로 만들어 스냅샷으로 저장 (parser와 동일한 형태)"""
+    session_factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+    year, month = map(int, spec.materialized_month.split("-"))
+
+    async with session_factory() as db:
+        service = build_service(db, materialized=False)
+        payload = await service.get_calendar_data(year, month)
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            CalendarSnapshot.__table__.insert(),
+            [{"valid_month": spec.materialized_month, "payload": json.dumps(payload, ensure_ascii=False)}]
+        )
+    return 1
+
+
+def describe(spec: DatasetSpec, counts: Optional[Dict[str, int]] = None) -> str:
+    """규격 요약 문자열 (로그용)"""
+    summary = f"x{spec.scale}: 시설 {spec.facility_count}곳, {spec.months}개월"
+    if counts:
+        summary += ", " + ", ".join(f"{table} {n:,}" for table, n in counts.items())
+    return summary
@@ -0,0 +1,396 @@
+"""
+ScheduleService 벤치마크
+
+scale별 합성 데이터셋(benchmarks.dataset)을 적재하고 케이스마다 측정한다.
+- cold: 커넥션 풀 폐기 직후 첫 호출 (엔드포인트는 응답 캐시도 비운 상태 = MISS)
+- warm: 워밍업 1회 후 --repeat회 반복 (엔드포인트는 응답 캐시 HIT)
+- queries: cold 호출 1회의 SQL 쿼리 수 (엔드포인트는 X-Query-Count 헤더)
+- peak_memory_kb: cold 호출 1회의 tracemalloc 최대 할당량 (시간 측정과 별도 실행)
+
+결과는 JSON(benchmarks/results/)으로 저장하고, --compare로 이전 결과와 비교한다.
+
+Usage:
+    cd services/api
+    pip install -r benchmarks/requirements.txt
+    python -m benchmarks.schedule_service                        # x10, x100, x1000 (SQLite)
+    python -m benchmarks.schedule_service --scales 10 --repeat 50
+    python -m benchmarks.schedule_service --compare benchmarks/results/20260301-120000_abc1234.json
+    python -m benchmarks.schedule_service --db-url "mysql+aiomysql://user:pw@localhost/swim_bench"
+"""
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+import sqlalchemy
+from fastapi import FastAPI
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from app.shared import settings
+from app.application.schedule.service import ScheduleService
+from app.infrastructure.cache.decorator import CACHE_STATUS_HEADER
+from app.infrastructure.metrics import MetricsMiddleware
+from app.infrastructure.metrics.db import QueryStats, bind_query_stats, instrument_engine, reset_query_stats
+from app.infrastructure.metrics.query_budget import QUERY_BUDGET_HEADER, QUERY_COUNT_HEADER
+from app.infrastructure.persistence.database import AsyncSessionLocal, get_async_db
+from app.presentation.schedule.controller import router as schedule_router
+from benchmarks.dataset import DatasetSpec, build_service, describe, seed
+
+logger = logging.getLogger("benchmarks.schedule_service")
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+DEFAULT_SCALES = (10, 100, 1000)
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    측정 케이스
+
+    service 케이스는 call(service, spec), endpoint 케이스는 path(spec)를 사용한다.
+    max_scale을 넘는 scale에서는 건너뛴다. (전체 조회처럼 결과 크기가 데이터 전체에 비례하는 케이스)
+    """
+    name: str
+    kind: str
+    call: Optional[Callable[[ScheduleService, DatasetSpec], Awaitable[Any]]] = None
+    path: Optional[Callable[[DatasetSpec], str]] = None
+    max_scale: Optional[int] = None
+
+
+def _first_day(valid_month: str) -> str:
+    return f"{valid_month}-01"
+
+
+def _year_month(valid_month: str) -> Dict[str, int]:
+    year, month = map(int, valid_month.split("-"))
+    return {"year": year, "month": month}
+
+
+CASES = (
+    Case("get_facilities", "service",
+         call=lambda s, spec: s.get_facilities()),
+    Case("get_schedules(month)", "service",
+         call=lambda s, spec: s.get_schedules(month=spec.fallback_month)),
+    Case("get_schedules(facility)", "service",
+         call=lambda s, spec: s.get_schedules(facility=spec.facility_name(1))),
+    Case("get_schedules(all)", "service",
+         call=lambda s, spec: s.get_schedules(), max_scale=100),
+    Case("get_daily_schedules(materialized)", "service",
+         call=lambda s, spec: s.get_daily_schedules(_first_day(spec.materialized_month))),
+    Case("get_daily_schedules(fallback)", "service",
+         call=lambda s, spec: s.get_daily_schedules(_first_day(spec.fallback_month))),
+    Case("get_calendar_snapshot", "service",
+         call=lambda s, spec: s.get_calendar_snapshot(**_year_month(spec.materialized_month))),
+    Case("get_calendar_data(fallback)", "service",
+         call=lambda s, spec: s.get_calendar_data(**_year_month(spec.fallback_month))),
+    Case("GET /api/facilities", "endpoint",
+         path=lambda spec: "/api/facilities"),
+    Case("GET /api/schedules?month", "endpoint",
+         path=lambda spec: f"/api/schedules?month={spec.fallback_month}"),
+    Case("GET /api/schedules/daily (materialized)", "endpoint",
+         path=lambda spec: f"/api/schedules/daily?date={_first_day(spec.materialized_month)}"),
+    Case("GET /api/schedules/daily (fallback)", "endpoint",
+         path=lambda spec: f"/api/schedules/daily?date={_first_day(spec.fallback_month)}"),
+    Case("GET /api/schedules/calendar (snapshot)", "endpoint",
+         path=lambda spec: "/api/schedules/calendar?year={year}&month={month}".format(
+             **_year_month(spec.materialized_month))),
+    Case("GET /api/schedules/calendar (fallback)", "endpoint",
+         path=lambda spec: "/api/schedules/calendar?year={year}&month={month}".format(
+             **_year_month(spec.fallback_month))),
+)
+
+
+def _result_size(result: Any) -> int:
+    """응답 항목 수 (빈 결과로 조용히 실패한 케이스를 구분하기 위한 값)"""
+    if isinstance(result, bytes):
+        return _result_size(json.loads(result))
+    if isinstance(result, dict):
+        return len(result.get("schedules", ()))
+    if isinstance(result, list):
+        return len(result)
+    return 0
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    """초 단위 샘플 → ms 통계"""
+    ms = sorted(s * 1000 for s in samples)
+    p95 = statistics.quantiles(ms, n=20)[18] if len(ms) >= 2 else ms[0]
+    return {
+        "runs": len(ms),
+        "min_ms": round(ms[0], 3),
+        "p50_ms": round(statistics.median(ms), 3),
+        "p95_ms": round(p95, 3),
+        "mean_ms": round(statistics.fmean(ms), 3),
+    }
+
+
+class ScheduleBenchmark:
+    """scale 하나(데이터셋 하나)에 대한 측정"""
+
+    def __init__(self, engine: AsyncEngine, spec: DatasetSpec, repeat: int, cold_runs: int):
+        self.engine = engine
+        self.spec = spec
+        self.repeat = repeat
+        self.cold_runs = cold_runs
+        self.session_factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+        # Redis 대신 인메모리 응답 캐시 (warm = 캐시 HIT 경로)
+        FastAPICache.reset()
+        FastAPICache.init(InMemoryBackend(), prefix="swim-api-bench")
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=self._build_app()), base_url="http://bench"
+        )
+
+    def _build_app(self) -> FastAPI:
+        """main.app과 같은 미들웨어/라우터 구성 (lifespan의 Redis/Subscriber 제외, DB 세션만 교체)"""
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+        app.include_router(schedule_router, prefix="/api")
+
+        async def get_bench_db():
+            async with self.session_factory() as db:
+                yield db
+
+        app.dependency_overrides[get_async_db] = get_bench_db
+        # 캐시 계산(service_factory)은 요청 의존성이 아닌 AsyncSessionLocal로 세션을 연다
+        AsyncSessionLocal.configure(bind=self.engine)
+        return app
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    async def _reset(self, kind: str) -> None:
+        """cold 상태로 초기화 (커넥션 풀 폐기, 엔드포인트는 응답 캐시도 비움)"""
+        await self.engine.dispose()
+        gc.collect()
+        if kind == "endpoint":
+            # InMemoryBackend 저장소는 클래스 공유이므로 인스턴스 교체가 아닌 prefix 단위 삭제
+            await FastAPICache.clear()
+
+    async def _call(self, case: Case) -> Dict[str, Any]:
+        """케이스 1회 실행 → 소요 시간/쿼리 수/결과"""
+        if case.kind == "service":
+            stats = QueryStats()
+            token = bind_query_stats(stats)
+            start = time.perf_counter()
+            try:
+                async with self.session_factory() as db:
+                    result = await case.call(build_service(db), self.spec)
+            finally:
+                elapsed = time.perf_counter() - start
+                reset_query_stats(token)
+            return {"elapsed": elapsed, "queries": stats.count, "items": _result_size(result)}
+
+        start = time.perf_counter()
+        response = await self.client.get(case.path(self.spec))
+        elapsed = time.perf_counter() - start
+        if response.status_code != 200:
+            raise RuntimeError(f"{case.name}: HTTP {response.status_code}")
+        return {
+            "elapsed": elapsed,
+            "queries": int(response.headers.get(QUERY_COUNT_HEADER, 0)),
+            "items": _result_size(response.json()),
+            "cache": response.headers.get(CACHE_STATUS_HEADER),
+            "budget_exceeded": response.headers.get(QUERY_BUDGET_HEADER),
+        }
+
+    async def run_case(self, case: Case) -> Dict[str, Any]:
+        cold_samples = []
+        first = None
+        for _ in range(self.cold_runs):
+            await self._reset(case.kind)
+            outcome = await self._call(case)
+            cold_samples.append(outcome["elapsed"])
+            first = first or outcome
+
+        # 메모리는 tracemalloc 오버헤드가 시간에 섞이지 않도록 별도 cold 실행으로 측정
+        await self._reset(case.kind)
+        tracemalloc.start()
+        try:
+            await self._call(case)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        await self._call(case)  # 워밍업
+        gc.collect()
+        warm = [await self._call(case) for _ in range(self.repeat)]
+
+        result = {
+            "scale": self.spec.scale,
+            "kind": case.kind,
+            "case": case.name,
+            "cold": _summarize(cold_samples),
+            "warm": _summarize([w["elapsed"] for w in warm]),
+            "queries": first["queries"],
+            "warm_queries": warm[-1]["queries"],
+            "peak_memory_kb": round(peak / 1024, 1),
+            "items": first["items"],
+        }
+        if case.kind == "endpoint":
+            result["warm_cache"] = warm[-1]["cache"]
+            result["budget_exceeded"] = first["budget_exceeded"]
+        return result
+
+
+def _git_commit() -> str:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _db_url(template: Optional[str], scale: int, workdir: Path) -> str:
+    """scale별 DB URL (기본: 임시 디렉터리의 SQLite 파일)"""
+    if template is None:
+        return f"sqlite+aiosqlite:///{workdir / f'bench_x{scale}.db'}"
+
+    url = template.format(scale=scale)
+    database = make_url(url).database or ""
+    # 테이블을 drop 후 재생성하므로 실수로 운영/개발 DB를 가리키지 않도록 이름으로 확인
+    if not url.startswith("sqlite") and "bench" not in database:
+        raise SystemExit(f"벤치마크 DB 이름에 'bench'가 포함되어야 합니다 (테이블을 재생성함): {database}")
+    return url
+
+
+def _format_row(result: Dict[str, Any]) -> str:
+    line = (
+        f"x{result['scale']:<5} {result['case']:<42} "
+        f"cold {result['cold']['p50_ms']:>9.1f}ms  "
+        f"warm p50 {result['warm']['p50_ms']:>8.2f}ms p95 {result['warm']['p95_ms']:>8.2f}ms  "
+        f"queries {result['queries']:>3}  peak {result['peak_memory_kb']:>10,.0f}KB  items {result['items']}"
+    )
+    if result.get("budget_exceeded"):
+        line += f"  [쿼리 예산 초과 {result['budget_exceeded']}]"
+    return line
+
+
+def _pct(new: float, old: float) -> str:
+    if not old:
+        return "   n/a"
+    return f"{(new - old) / old * 100:+6.1f}%"
+
+
+def compare(baseline_path: Path, report: Dict[str, Any]) -> None:
+    """이전 결과 대비 변화 출력 (같은 scale/케이스끼리)"""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    previous = {(r["scale"], r["case"]): r for r in baseline["results"]}
+
+    print(f"\n비교: {baseline['meta']['commit']} → {report['meta']['commit']}")
+    for result in report["results"]:
+        old = previous.get((result["scale"], result["case"]))
+        if old is None:
+            continue
+        print(
+            f"x{result['scale']:<5} {result['case']:<42} "
+            f"cold {_pct(result['cold']['p50_ms'], old['cold']['p50_ms'])}  "
+            f"warm p50 {_pct(result['warm']['p50_ms'], old['warm']['p50_ms'])}  "
+            f"queries {old['queries']}→{result['queries']}  "
+            f"peak {_pct(result['peak_memory_kb'], old['peak_memory_kb'])}"
+        )
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    # 엔드포인트 쿼리 수는 쿼리 검사 모드의 X-Query-Count 헤더로 받는다 (예산 초과도 실패 대신 기록)
+    settings.QUERY_INSPECTION_ENABLED = True
+    settings.QUERY_BUDGET_STRICT = False
+
+    cases = [c for c in CASES if not args.cases or any(pattern in c.name for pattern in args.cases)]
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "repeat": args.repeat,
+            "cold_runs": args.cold_runs,
+            "months": args.months,
+        },
+        "datasets": {},
+        "results": [],
+    }
+
+    with tempfile.TemporaryDirectory(prefix="swim-bench-") as workdir:
+        for scale in args.scales:
+            spec = DatasetSpec(scale=scale, months=args.months)
+            url = _db_url(args.db_url, scale, Path(workdir))
+            engine = create_async_engine(url)
+            instrument_engine(engine.sync_engine)
+            report["meta"]["dialect"] = engine.dialect.name
+
+            start = time.perf_counter()
+            counts = await seed(engine, spec)
+            seed_seconds = time.perf_counter() - start
+            report["datasets"][str(scale)] = {"rows": counts, "seed_seconds": round(seed_seconds, 2)}
+            print(f"\n적재 완료 ({seed_seconds:.1f}s) {describe(spec, counts)}")
+
+            bench = ScheduleBenchmark(engine, spec, args.repeat, args.cold_runs)
+            try:
+                for case in cases:
+                    if case.max_scale is not None and scale > case.max_scale:
+                        print(f"x{scale:<5} {case.name:<42} 건너뜀 (max_scale={case.max_scale})")
+                        continue
+                    result = await bench.run_case(case)
+                    report["results"].append(result)
+                    print(_format_row(result))
+            finally:
+                await bench.close()
+                await engine.dispose()
+
+    return report
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ScheduleService 벤치마크 (합성 데이터)")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES),
+                        help="현재 규모 대비 배수 (기본: 10 100 1000)")
+    parser.add_argument("--months", type=int, default=DatasetSpec.months, help="적재할 월 수")
+    parser.add_argument("--repeat", type=int, default=20, help="warm 측정 반복 횟수")
+    parser.add_argument("--cold-runs", type=int, default=3, help="cold 측정 횟수")
+    parser.add_argument("--cases", nargs="*", help="케이스 이름 필터 (부분 일치)")
+    parser.add_argument("--db-url", help="DB URL 템플릿 ({scale} 치환, 기본: 임시 SQLite 파일)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    # 서비스 INFO 로그가 측정 출력과 섞이지 않도록 WARNING 이상만 콘솔로 (파일 로깅 없음)
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s", force=True)
+    # 인메모리 캐시 backend에는 Redis 태그 등록이 없음 / 예산 초과는 결과에 기록
+    logging.getLogger("app.infrastructure.cache.redis").setLevel(logging.ERROR)
+    logging.getLogger("app.infrastructure.metrics.query_budget").setLevel(logging.ERROR)
+
+    report = asyncio.run(run(args))
+
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}_{report['meta']['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        compare(args.compare, report)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -88,6 +88,41 @@ CREATE TABLE IF NOT EXISTS review (
     FOREIGN KEY (facility_id) REFERENCES facility(id) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- 8. daily_schedule (일별 스케줄, 적재 시점에 미리 계산된 조회용 테이블)
+CREATE TABLE IF NOT EXISTS daily_schedule (
+    date DATE NOT NULL,
+    facility_id INT NOT NULL,
+    valid_month VARCHAR(7) NOT NULL,          -- YYYY-MM
+    day_type ENUM('평일', '토요일', '일요일') NOT NULL,
+    season VARCHAR(20) NOT NULL DEFAULT '',
+    is_closed BOOLEAN NOT NULL DEFAULT FALSE,
+    closure_reason VARCHAR(200),
+    sessions JSON NOT NULL,                   -- [{session_name, start_time, end_time, capacity, lanes}]
+    fees JSON NOT NULL,                       -- [{category, price, note}]
+    source_url VARCHAR(500),
+    notice_title VARCHAR(500),
+    crawled_at TIMESTAMP NULL,
+    PRIMARY KEY (date, facility_id),
+    FOREIGN KEY (facility_id) REFERENCES facility(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 9. calendar_snapshot (월간 달력 응답 스냅샷, ScheduleSaved 시 parser가 렌더링)
+CREATE TABLE IF NOT EXISTS calendar_snapshot (
+    valid_month VARCHAR(7) PRIMARY KEY,       -- YYYY-MM
+    payload MEDIUMTEXT NOT NULL,              -- /api/schedules/calendar 응답 JSON
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 10. daily_schedule_month (시설 + 월 단위 daily_schedule 생성 기록, 생성된 날이 0일이어도 기록)
+CREATE TABLE IF NOT EXISTS daily_schedule_month (
+    facility_id INT NOT NULL,
+    valid_month VARCHAR(7) NOT NULL,          -- YYYY-MM
+    day_count INT NOT NULL DEFAULT 0,
+    refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (facility_id, valid_month),
+    FOREIGN KEY (facility_id) REFERENCES facility(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
 -- 인덱스 생성
 CREATE INDEX IF NOT EXISTS idx_schedule_facility ON swim_schedule(facility_id);
 CREATE INDEX IF NOT EXISTS idx_schedule_valid_month ON swim_schedule(valid_month);
@@ -97,3 +132,4 @@ CREATE INDEX IF NOT EXISTS idx_fee_facility ON fee(facility_id);
 CREATE INDEX IF NOT EXISTS idx_closure_facility_month ON facility_closure(facility_id, valid_month);
 CREATE INDEX IF NOT EXISTS idx_closure_date ON facility_closure(closure_date);
 CREATE INDEX IF NOT EXISTS idx_review_facility_created ON review(facility_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_daily_facility_month ON daily_schedule(facility_id, valid_month);
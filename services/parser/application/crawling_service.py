@@ -4,11 +4,15 @@
 - 기본 스케줄 및 월별 공지사항 크롤링
 """
 import logging
-from typing import List
+from typing import List, Optional, Set
+from core.crawler.base.watermark import CrawlWatermarks
 from core.crawler.factory import CrawlerFactory
 from core.exceptions import CrawlError
 from core.models.crawler import PostSummary, PostDetail
 from core.models.facility import Organization
+from infrastructure.config import settings
+from infrastructure.metrics.registry import CRAWL_PAGES, NOTICES_SKIPPED
+from infrastructure.utils.concurrency import run_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -16,12 +20,17 @@ logger = logging.getLogger(__name__)
 class CrawlingService:
     """크롤링 실행 서비스"""
 
-    def __init__(self, org: Organization):
+    def __init__(self, org: Organization, watermarks: Optional[CrawlWatermarks] = None,
+                 known_urls: Optional[Set[str]] = None):
         """
         Args:
             org: 기관 (Organization enum)
+            watermarks: 증분 크롤링 mark (None이면 max_pages까지 전체 크롤링)
+            known_urls: 이미 DB에 저장된 공지 URL (해당 공지는 상세 크롤링/반환 생략)
         """
         self.org = org
+        self.watermarks = watermarks
+        self.known_urls = known_urls or set()
         self.list_crawler, self.detail_crawler, self.facility_crawler = CrawlerFactory.create(org)
 
     def crawl_base_schedules(self) -> List[dict]:
@@ -55,24 +64,50 @@ class CrawlingService:
 
         # snhdc: API가 목록에서 이미 content를 제공하므로 직접 상세 정보 수집
         if self.org == Organization.SNHDC:
-            details = self.list_crawler.get_posts_with_details(keyword, max_pages)
+            details = self.list_crawler.get_posts_with_details(keyword, max_pages, watermarks=self.watermarks)
+            details = self._exclude_known(details, lambda d: d.source_url)
             logger.info(f"[{self.org.value}] 상세 정보 수집 완료: {len(details)}개")
             return details
 
         # snyouth: 목록 → 상세 순서로 크롤링
         # 1. 목록 수집
-        posts: List[PostSummary] = self.list_crawler.get_posts(keyword, max_pages)
+        posts: List[PostSummary] = self.list_crawler.get_posts(keyword, max_pages, watermarks=self.watermarks)
         logger.info(f"[{self.org.value}] 게시글 목록: {len(posts)}개")
 
-        # 2. 상세 정보 수집 (시설명 전달)
-        details = []
-        for post in posts:
+        # 2. 이미 저장된 공지는 상세 페이지 요청 생략 (상세 source_url = 목록의 detail_url)
+        posts = self._exclude_known(posts, lambda p: p.detail_url)
+
+        # 3. 상세 정보 수집 (시설명 전달, 동시 요청 + 목록 순서 유지)
+        def fetch_detail(post: PostSummary) -> Optional[PostDetail]:
             try:
                 detail = self.detail_crawler.get_detail(post.detail_url, facility_name=post.facility_name)
-                details.append(detail)
+                CRAWL_PAGES.labels(self.org.value, "detail").inc()
+                return detail
             except CrawlError as e:
                 logger.warning(f"상세 크롤링 실패: {e}")
-                continue
+                # 목록 단계에서 이미 관찰한 mark를 확정하면 이 공지는 다시 크롤링되지 않음
+                if self.watermarks is not None:
+                    self.watermarks.hold(f"{self.org.value} 상세 크롤링 실패: {post.detail_url}")
+                return None
+
+        details = [
+            detail for detail in run_concurrently(
+                fetch_detail, posts, settings.CRAWL_CONCURRENCY, thread_name_prefix="detail"
+            )
+            if detail
+        ]
 
         logger.info(f"[{self.org.value}] 상세 정보 수집 완료: {len(details)}개")
         return details
+
+    def _exclude_known(self, items: list, url_of) -> list:
+        """이미 DB에 저장된 공지 제외"""
+        if not self.known_urls:
+            return items
+
+        remaining = [item for item in items if url_of(item) not in self.known_urls]
+        skipped = len(items) - len(remaining)
+        if skipped:
+            logger.info(f"[{self.org.value}] 이미 저장된 공지 {skipped}개 건너뛰기")
+            NOTICES_SKIPPED.labels("crawl").inc(skipped)
+        return remaining
@@ -3,9 +3,12 @@
 각 핸들러는 특정 이벤트에 반응하여 사이드 이펙트를 수행한다.
 EventBus의 fail-safe에 의해 핸들러 실패가 파이프라인을 중단시키지 않는다.
 """
-from core.events import EventBus, ScheduleSaved, PoolClosureDetected
+from typing import Callable
+
+from core.events import EventBus, ScheduleSaved, BatchCompleted, PoolClosureDetected
 from infrastructure.notification import NotificationService
 from infrastructure.cache import CacheInvalidationPublisher
+from infrastructure.database.repository import SwimRepository
 
 
 class DiscordEventHandler:
@@ -36,8 +39,27 @@ class CacheEventHandler:
         self._publisher.publish_schedule_saved(
             facility_name=event.facility_name,
             valid_month=event.valid_month,
+            # 이용료는 시설 단위라 저장된 월과 무관하게 다른 월 응답에도 반영됨
+            fees_changed=bool(event.data.get("fees")),
         )
 
+    def on_batch_completed(self, event: BatchCompleted) -> None:
+        self._publisher.publish_batch_complete(new_saved=event.new_saved)
+
+
+class CalendarSnapshotHandler:
+    """달력 스냅샷 갱신 이벤트 처리
+
+    캐시 무효화보다 먼저 실행되어야 API가 갱신된 스냅샷을 다시 캐싱한다.
+    """
+
+    def __init__(self, repository_factory: Callable[[], SwimRepository]):
+        self._repository_factory = repository_factory
+
+    def on_schedule_saved(self, event: ScheduleSaved) -> None:
+        with self._repository_factory() as repo:
+            repo.refresh_calendar_snapshot(event.valid_month)
+
 
 class ClosureDetectionHandler:
     """휴장 감지 → PoolClosureDetected 이벤트 발행
@@ -5,6 +5,7 @@ import re
 
 from infrastructure.config.logging_config import get_logger
 from application.storage_service import StorageService
+from core.exceptions import RepositoryError
 from core.models.facility import Organization
 
 logger = get_logger(__name__)
@@ -69,9 +70,18 @@ class FallbackService:
         from infrastructure.container import container
         with container.swim_repository() as repo:
             success_count = 0
+            saved_months = set()
             for data in fallback_data:
                 if repo.save_parsed_data(data):
                     success_count += 1
+                    saved_months.add(data.get("valid_month", ""))
+
+            # 폴백은 ScheduleSaved를 발행하지 않으므로 달력 스냅샷을 직접 갱신
+            for valid_month in saved_months:
+                try:
+                    repo.refresh_calendar_snapshot(valid_month)
+                except RepositoryError as e:
+                    logger.error(f"달력 스냅샷 갱신 실패: {valid_month}, {e}")
 
         logger.info(f"폴백 저장 완료: {success_count}/{len(fallback_data)}개")
         logger.info("=== 4단계 완료 ===")
@@ -5,6 +5,8 @@
 - LLM 파싱
 """
 import logging
+import threading
+import time
 from pathlib import Path
 from typing import List, Optional, Dict
 from core.crawler.snhdc.attachment_downloader import AttachmentDownloader as SnhdcAttachmentDownloader
@@ -16,6 +18,10 @@ from core.parser.validators.content_validator import ContentValidator
 from core.parser.llm.llm_parser import LLMParser
 from core.models.crawler import PostDetail
 from core.models.facility_manager import FacilityNameMatcher
+from infrastructure.cache.download_manifest import file_sha256, get_download_manifest
+from infrastructure.config import settings
+from infrastructure.metrics.registry import EXTRACTION_DURATION
+from infrastructure.utils.concurrency import run_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +48,11 @@ class ParsingService:
         self.pdf_extractor = PdfTextExtractor()
         self.validator = ContentValidator()
         self.llm_parser = LLMParser()
+        self.manifest = get_download_manifest()
+
+        # 다운로드/추출/LLM 오류로 실패한 공지 제목 (수영 정보 없음 등 정상 제외는 포함하지 않음)
+        self.failed_notices: List[str] = []
+        self._failed_lock = threading.Lock()
 
     def parse_from_notice(self, notice: PostDetail) -> Optional[Dict]:
         """
@@ -76,6 +87,9 @@ class ParsingService:
                 text = notice.content_text
 
             if not text or len(text) < 50:
+                if notice.has_attachment and not file_path:
+                    # 첨부파일을 받지 못해 본문으로 대체했지만 본문에 내용이 없음
+                    raise DownloadError("첨부파일 다운로드 실패 (본문 텍스트 없음)")
                 logger.warning(f"텍스트 추출 실패 또는 텍스트가 너무 짧음: {notice.title}")
                 return None
 
@@ -126,26 +140,37 @@ class ParsingService:
 
         except (DownloadError, TextExtractionError, ParseError) as e:
             logger.warning(f"파싱 실패 [{notice.title}]: {e}")
+            with self._failed_lock:
+                self.failed_notices.append(notice.title)
             return None
 
-    def parse_batch(self, notices: List[PostDetail]) -> List[Dict]:
+    def parse_batch(self, notices: List[PostDetail], max_workers: Optional[int] = None) -> List[Dict]:
         """
         여러 공지사항 일괄 파싱
 
+        공지 단위로 다운로드 → 텍스트 추출 → LLM 파싱을 스레드 풀에서 동시에 실행한다.
+        (대부분 네트워크/LLM 대기 시간이라 GIL 영향이 작음)
+        결과는 입력 공지 순서를 유지한다.
+
         Args:
             notices: 게시글 상세 정보 리스트
+            max_workers: 동시 처리 공지 수 (기본 settings.PARSE_CONCURRENCY, 1이면 순차)
 
         Returns:
             파싱된 스케줄 데이터 리스트
         """
-        logger.info(f"일괄 파싱 시작: {len(notices)}개")
+        max_workers = max(1, min(max_workers or settings.PARSE_CONCURRENCY, len(notices) or 1))
+        logger.info(f"일괄 파싱 시작: {len(notices)}개 (동시 {max_workers}개)")
+
+        total = len(notices)
 
-        results = []
-        for i, notice in enumerate(notices, 1):
-            logger.info(f"[{i}/{len(notices)}] 처리 중...")
-            result = self.parse_from_notice(notice)
-            if result:
-                results.append(result)
+        def parse_one(item) -> Optional[Dict]:
+            i, notice = item
+            logger.info(f"[{i}/{total}] 처리 중...")
+            return self.parse_from_notice(notice)
+
+        parsed = run_concurrently(parse_one, enumerate(notices, 1), max_workers, thread_name_prefix="parse")
+        results = [result for result in parsed if result]
 
         logger.info(f"일괄 파싱 완료: {len(results)}/{len(notices)}개 성공")
         return results
@@ -217,7 +242,7 @@ class ParsingService:
 
     def _extract_text(self, file_path: Path) -> str:
         """
-        파일에서 텍스트 추출
+        파일에서 텍스트 추출 (같은 내용의 파일은 매니페스트에 저장된 추출 결과 재사용)
 
         Args:
             file_path: 파일 경로
@@ -230,8 +255,31 @@ class ParsingService:
         """
         ext = file_path.suffix.lower()
         if ext == ".hwp":
-            return self.hwp_extractor.extract_text(file_path)
+            extractor = self.hwp_extractor
         elif ext == ".pdf":
-            return self.pdf_extractor.extract_text(file_path)
+            extractor = self.pdf_extractor
         else:
             raise TextExtractionError(f"지원하지 않는 파일 형식: {ext}")
+
+        if self.manifest is None:
+            return self._timed_extract(extractor, file_path)
+
+        sha256 = file_sha256(file_path)
+        text = self.manifest.get_text(sha256)
+        if text is not None:
+            logger.info(f"추출 텍스트 재사용: {file_path.name}")
+            return text
+
+        text = self._timed_extract(extractor, file_path)
+        if text:
+            self.manifest.set_text(sha256, text)
+        return text
+
+    @staticmethod
+    def _timed_extract(extractor, file_path: Path) -> str:
+        """텍스트 추출 + 소요 시간 메트릭"""
+        start = time.perf_counter()
+        try:
+            return extractor.extract_text(file_path)
+        finally:
+            EXTRACTION_DURATION.labels(file_path.suffix.lower().lstrip(".")).observe(time.perf_counter() - start)
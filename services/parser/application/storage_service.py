@@ -189,6 +189,43 @@ class StorageService:
             json.dump(validated_results, f, ensure_ascii=False, indent=2)
         logger.info(f"검증된 데이터 저장: {filepath}")
 
+    def save_crawl_watermarks(self, marks: Dict[str, dict]):
+        """
+        증분 크롤링 high-water mark 저장
+
+        Args:
+            marks: {"기관:키워드:시설": {"post_id": ..., "date": ...}}
+        """
+        filepath = self.storage_dir / "crawl_watermarks.json"
+
+        data = {
+            "meta": {
+                "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "board_count": len(marks)
+            },
+            "watermarks": marks
+        }
+
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+        logger.info(f"크롤링 워터마크 저장 완료: {filepath}")
+
+    def load_crawl_watermarks(self) -> Dict[str, dict]:
+        """
+        증분 크롤링 high-water mark 로드
+
+        Returns:
+            게시판별 mark 딕셔너리 (파일 없으면 빈 딕셔너리 → 전체 크롤링)
+        """
+        filepath = self.storage_dir / "crawl_watermarks.json"
+        if not filepath.exists():
+            return {}
+
+        with open(filepath, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            return data.get("watermarks", {})
+
     def load_validated_parsed_data(self) -> List[Dict]:
         """
         검증된 파싱 결과 로드
@@ -15,14 +15,17 @@
 """
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from .crawling_service import CrawlingService
 from .parsing_service import ParsingService
 from .storage_service import StorageService
+from core.crawler.base.watermark import CrawlWatermarks
 from core.models.crawler import PostDetail
 from core.models.facility import Organization
 from infrastructure.config import settings
+from infrastructure.metrics.registry import NOTICES_SKIPPED
+from infrastructure.utils.concurrency import run_concurrently
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -33,13 +36,19 @@ DOWNLOAD_DIR = settings.DOWNLOAD_DIR
 class SwimCrawlerService:
     """통합 수영 크롤링 서비스 (snyouth + snhdc)"""
 
-    def __init__(self, storage: StorageService):
+    def __init__(self, storage: StorageService, watermarks: Optional[CrawlWatermarks] = None):
+        """
+        Args:
+            storage: 저장 서비스
+            watermarks: 증분 크롤링 mark (None이면 공지사항을 max_pages까지 전체 크롤링)
+        """
         self.storage = storage
+        self.watermarks = watermarks
 
     def crawl_base_schedules(self, save: bool = True) -> Dict[str, List[Dict]]:
         """
         기본 스케줄 크롤링 (이용안내 페이지)
-        양쪽 기관 모두 크롤링
+        양쪽 기관 모두 동시에 크롤링
 
         Args:
             save: JSON 파일로 저장 여부
@@ -49,30 +58,34 @@ class SwimCrawlerService:
         """
         logger.info("=== 기본 스케줄 크롤링 시작 ===")
 
-        all_facilities = {}
+        orgs = list(Organization)
 
-        # 각 기관별 크롤링
-        for org in Organization:
-            crawling_service = CrawlingService(org)
-            facilities = crawling_service.crawl_base_schedules()
-            all_facilities[org.value] = facilities
+        # 각 기관별 크롤링 (기관 단위 동시 실행, 사이트별 요청 간격은 세션 limiter가 유지)
+        results = run_concurrently(
+            lambda org: CrawlingService(org).crawl_base_schedules(),
+            orgs, len(orgs), thread_name_prefix="org"
+        )
+        all_facilities = {org.value: facilities for org, facilities in zip(orgs, results)}
 
-            if save:
-                self.storage.save_base_schedules(org, facilities)
+        if save:
+            for org in orgs:
+                self.storage.save_base_schedules(org, all_facilities[org.value])
 
         total = sum(len(facilities) for facilities in all_facilities.values())
         logger.info(f"기본 스케줄 크롤링 완료: 총 {total}개 시설")
         return all_facilities
 
-    def crawl_monthly_notices(self, keyword: str = "수영", max_pages: int = 5, save: bool = True) -> Dict[str, List[Dict]]:
+    def crawl_monthly_notices(self, keyword: str = "수영", max_pages: int = 5, save: bool = True,
+                              full: bool = False) -> Dict[str, List[Dict]]:
         """
         월별 공지사항 크롤링
-        양쪽 기관 모두 크롤링
+        양쪽 기관 모두 동시에 크롤링
 
         Args:
             keyword: 검색 키워드
             max_pages: 최대 페이지 수
             save: JSON 파일로 저장 여부
+            full: True면 증분 mark를 무시하고 max_pages까지 크롤링 (이미 저장된 공지도 포함)
 
         Returns:
             {"snyouth": [...], "snhdc": [...]} 형태의 게시글 상세 정보
@@ -82,10 +95,18 @@ class SwimCrawlerService:
         all_notices = {}
 
         # 각 기관별 크롤링
-        for org in Organization:
-            crawling_service = CrawlingService(org)
-            details: List[PostDetail] = crawling_service.crawl_monthly_notices(keyword, max_pages)
+        watermarks = None if full else self.watermarks
+        # 이미 DB에 있는 공지는 상세 페이지 요청/첨부파일 다운로드 대상에서 제외
+        known_urls = None if full else self._load_existing_notice_urls()
+        orgs = list(Organization)
+
+        def crawl_org(org: Organization) -> List[PostDetail]:
+            crawling_service = CrawlingService(org, watermarks=watermarks, known_urls=known_urls)
+            return crawling_service.crawl_monthly_notices(keyword, max_pages)
 
+        results = run_concurrently(crawl_org, orgs, len(orgs), thread_name_prefix="org")
+
+        for org, details in zip(orgs, results):
             # PostDetail을 dict로 변환
             all_notices[org.value] = [self._post_detail_to_dict(d) for d in details]
 
@@ -122,7 +143,8 @@ class SwimCrawlerService:
         }
 
     def parse_attachments(self, org: Organization, monthly_notices: Optional[Dict[str, List[Dict]]] = None,
-                          save: bool = True, skip_existing: bool = True) -> List[Dict]:
+                          save: bool = True, skip_existing: bool = True,
+                          max_workers: Optional[int] = None) -> List[Dict]:
         """
         기관별 첨부파일 다운로드 및 파싱 (snhdc, snyouth 모두 지원)
 
@@ -131,6 +153,7 @@ class SwimCrawlerService:
             monthly_notices: 월별 공지사항 (없으면 파일에서 로드)
             save: 파싱 결과 저장 여부
             skip_existing: 이미 DB에 있는 공지 건너뛰기 (True: 신규만 처리, False: 모두 처리)
+            max_workers: 동시 파싱 공지 수 (기본 settings.PARSE_CONCURRENCY)
 
         Returns:
             파싱된 결과 리스트
@@ -154,10 +177,7 @@ class SwimCrawlerService:
 
         # 신규 공지만 필터링 (DB 중복 확인)
         if skip_existing:
-            from infrastructure.container import container
-            repo = container.swim_repository()
-            existing_urls = repo.get_existing_notice_urls()
-            repo.close()
+            existing_urls = self._load_existing_notice_urls()
 
             notices_to_process = [
                 n for n in notices_with_files
@@ -167,6 +187,7 @@ class SwimCrawlerService:
 
             if skipped_count > 0:
                 logger.info(f"이미 처리된 공지 {skipped_count}개 건너뛰기")
+                NOTICES_SKIPPED.labels("parse").inc(skipped_count)
             logger.info(f"신규 공지: {len(notices_to_process)}개")
 
             # 신규 공지가 없으면 조기 종료
@@ -180,19 +201,16 @@ class SwimCrawlerService:
         # ParsingService 사용 (기관별 다운로더 선택)
         parsing_service = ParsingService(download_dir=DOWNLOAD_DIR / org.value, org_key=org.value)
 
-        # Dict를 PostDetail로 변환 후 파싱
-        parsed_results = []
-        for notice_dict in notices_to_process:
-            # Dict를 PostDetail로 변환
-            post_detail = self._dict_to_post_detail(notice_dict)
-
-            # 파싱 실행
-            result = parsing_service.parse_from_notice(post_detail)
-            if result:
-                parsed_results.append(result)
+        # Dict를 PostDetail로 변환 후 파싱 (공지 단위 동시 처리, 순서 유지)
+        post_details = [self._dict_to_post_detail(n) for n in notices_to_process]
+        parsed_results = parsing_service.parse_batch(post_details, max_workers=max_workers)
 
         logger.info(f"{org_name} 파싱 완료: {len(parsed_results)}/{len(notices_to_process)}개 성공")
 
+        # 저장 전에 실패한 공지가 있으면 증분 mark를 올리지 않음 (다음 실행에서 다시 크롤링)
+        if parsing_service.failed_notices and self.watermarks is not None:
+            self.watermarks.hold(f"{org_name} 파싱 실패 {len(parsing_service.failed_notices)}건")
+
         # 결과 저장
         if save and parsed_results:
             self.storage.save_parsed_schedules(org, parsed_results)
@@ -213,6 +231,13 @@ class SwimCrawlerService:
         """
         return self.parse_attachments(Organization.SNHDC, monthly_notices, save)
 
+    @staticmethod
+    def _load_existing_notice_urls() -> Set[str]:
+        """DB에 저장된 공지 URL (조회 실패 시 빈 set → 필터링 없이 진행)"""
+        from infrastructure.container import container
+        with container.swim_repository() as repo:
+            return repo.get_existing_notice_urls()
+
     @staticmethod
     def _dict_to_post_detail(notice_dict: Dict) -> PostDetail:
         """Dict를 PostDetail로 변환"""
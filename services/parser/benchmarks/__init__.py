@@ -0,0 +1,6 @@
+"""
+파싱 파이프라인 성능 벤치마크
+
+실제 응답을 기록한 픽스처로 crawl → parse → save_to_db를 오프라인 재생한다.
+(python -m benchmarks.pipeline_replay --help)
+"""
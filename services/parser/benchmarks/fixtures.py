@@ -0,0 +1,309 @@
+"""
+파이프라인 record/replay 픽스처 저장소
+
+실제 사이트/Anthropic API 응답을 SQLite 한 파일에 기록하고, 네트워크 없이 그대로 재생한다.
+- http_exchange: 크롤러/다운로더 HTTP 응답 (목록/상세/시설 페이지 HTML, 첨부파일 바이트)
+- llm_response: LLM 응답 텍스트 + 토큰 사용량
+- meta: 기록 당시 크롤링 조건 (키워드, 페이지 수 등, 재생 시 같은 요청을 만들기 위함)
+
+요청/프롬프트 해시를 키로 쓰므로 재생 시에도 같은 크롤링 조건이면 같은 키가 만들어진다.
+기록 당시 응답 시간도 저장해 두어 재생 시 네트워크 대기를 흉내낼 수 있다. (동시성 변경 효과 측정용)
+
+주입 지점:
+    install_transport_adapter(RecordingAdapter/ReplayAdapter)  # create_session() 세션
+    install_llm_client(RecordingLLMClient/ReplayLLMClient)     # LLMParser 클라이언트
+"""
+import hashlib
+import io
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# 기록된 본문은 이미 디코딩된 바이트이므로 전송 관련 헤더는 저장하지 않음
+_DROPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "connection"}
+
+
+def _http_key(method: str, url: str, body) -> str:
+    """메서드 + URL(쿼리 포함) + 본문(POST 폼) → 키"""
+    digest = hashlib.sha256(f"{method.upper()} {url}\n".encode("utf-8"))
+    if body:
+        digest.update(body if isinstance(body, bytes) else str(body).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _llm_key(messages) -> str:
+    """프롬프트 → 키 (모델 설정과 무관하게 같은 프롬프트면 같은 응답 재생)"""
+    prompt = "\n".join(str(m.get("content", "")) for m in messages)
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+class FixtureStore:
+    """SQLite 기반 픽스처 저장소 (스레드 안전, 재생 적중/누락 집계)"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: SQLite 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self.stats: Counter = Counter()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS http_exchange (
+                   request_key TEXT PRIMARY KEY,
+                   method TEXT NOT NULL,
+                   url TEXT NOT NULL,
+                   status INTEGER NOT NULL,
+                   reason TEXT,
+                   headers TEXT NOT NULL,
+                   body BLOB NOT NULL,
+                   content_type TEXT,
+                   latency REAL NOT NULL,
+                   recorded_at REAL NOT NULL
+               )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS llm_response (
+                   prompt_key TEXT PRIMARY KEY,
+                   model TEXT,
+                   text TEXT NOT NULL,
+                   input_tokens INTEGER NOT NULL,
+                   output_tokens INTEGER NOT NULL,
+                   latency REAL NOT NULL,
+                   recorded_at REAL NOT NULL
+               )"""
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+
+    def count(self, name: str) -> None:
+        """재생 적중/누락 집계"""
+        with self._lock:
+            self.stats[name] += 1
+
+    # -- meta --
+
+    def set_meta(self, values: Dict) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+                [(k, json.dumps(v, ensure_ascii=False)) for k, v in values.items()]
+            )
+
+    def get_meta(self) -> Dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT name, value FROM meta").fetchall()
+        return {name: json.loads(value) for name, value in rows}
+
+    # -- HTTP --
+
+    def put_http(self, request: requests.PreparedRequest, response: requests.Response,
+                 body: bytes, latency: float) -> None:
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS}
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO http_exchange
+                   (request_key, method, url, status, reason, headers, body, content_type, latency, recorded_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    _http_key(request.method, request.url, request.body), request.method, request.url,
+                    response.status_code, response.reason, json.dumps(headers, ensure_ascii=False),
+                    body, response.headers.get("Content-Type"), latency, time.time(),
+                )
+            )
+        self.count("http_recorded")
+
+    def get_http(self, request: requests.PreparedRequest) -> Optional[Tuple]:
+        """(status, reason, headers, body, latency) 또는 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, reason, headers, body, latency FROM http_exchange WHERE request_key = ?",
+                (_http_key(request.method, request.url, request.body),)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1], json.loads(row[2]), row[3], row[4]
+
+    # -- LLM --
+
+    def put_llm(self, messages, model: str, text: str, input_tokens: int, output_tokens: int,
+                latency: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO llm_response
+                   (prompt_key, model, text, input_tokens, output_tokens, latency, recorded_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (_llm_key(messages), model, text, input_tokens, output_tokens, latency, time.time())
+            )
+        self.count("llm_recorded")
+
+    def get_llm(self, messages) -> Optional[Tuple]:
+        """(text, input_tokens, output_tokens, latency) 또는 None"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT text, input_tokens, output_tokens, latency FROM llm_response WHERE prompt_key = ?",
+                (_llm_key(messages),)
+            ).fetchone()
+
+    def summary(self) -> Dict:
+        """저장된 픽스처 요약 (HTTP 건수/바이트, 첨부파일 건수, LLM 건수)"""
+        with self._lock:
+            http_count, http_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM http_exchange"
+            ).fetchone()
+            html_count = self._conn.execute(
+                "SELECT COUNT(*) FROM http_exchange WHERE content_type LIKE 'text/%' OR content_type LIKE '%json%'"
+            ).fetchone()[0]
+            llm_count = self._conn.execute("SELECT COUNT(*) FROM llm_response").fetchone()[0]
+        return {
+            "http_responses": http_count,
+            "http_bytes": http_bytes,
+            "attachments": http_count - html_count,
+            "llm_responses": llm_count,
+        }
+
+
+class RecordingAdapter(HTTPAdapter):
+    """실제로 요청하고 응답을 픽스처로 기록하는 전송 어댑터"""
+
+    def __init__(self, store: FixtureStore):
+        super().__init__()
+        self.store = store
+
+    def send(self, request, **kwargs):
+        start = time.perf_counter()
+        response = super().send(request, **kwargs)
+        # 스트리밍 응답도 여기서 본문을 모두 읽는다 (이후 iter_content는 읽은 본문을 나눠 반환)
+        body = response.content
+        # 조건부 요청의 304는 본문이 없으므로 기존 200 기록을 덮어쓰지 않음
+        if response.status_code != 304:
+            self.store.put_http(request, response, body, time.perf_counter() - start)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    픽스처에서 응답을 재생하는 전송 어댑터 (네트워크 사용 안 함)
+
+    - 기록에 없는 요청은 ConnectionError (오프라인과 같은 실패 경로)
+    - If-None-Match / If-Modified-Since가 기록된 검증자와 같으면 304
+    """
+
+    def __init__(self, store: FixtureStore, simulate_latency: bool = True):
+        super().__init__()
+        self.store = store
+        self.simulate_latency = simulate_latency
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        recorded = self.store.get_http(request)
+        if recorded is None:
+            self.store.count("http_missing")
+            raise requests.ConnectionError(f"픽스처 없음: {request.method} {request.url}", request=request)
+
+        status, reason, headers, body, latency = recorded
+        headers = CaseInsensitiveDict(headers)
+        if self._not_modified(request, headers):
+            status, reason, body = 304, "Not Modified", b""
+            self.store.count("http_not_modified")
+        else:
+            self.store.count("http_replayed")
+
+        if self.simulate_latency:
+            time.sleep(latency)
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = headers
+        response.raw = io.BytesIO(body)
+        response.encoding = get_encoding_from_headers(headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = timedelta(seconds=latency)
+        return response
+
+    @staticmethod
+    def _not_modified(request, headers: CaseInsensitiveDict) -> bool:
+        etag = request.headers.get("If-None-Match")
+        if etag and etag == headers.get("ETag"):
+            return True
+        since = request.headers.get("If-Modified-Since")
+        return bool(since) and since == headers.get("Last-Modified")
+
+    def close(self):
+        pass
+
+
+def _llm_response(text: str, input_tokens: int, output_tokens: int) -> SimpleNamespace:
+    """anthropic Message와 같은 모양의 응답 (content[0].text, usage)"""
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        usage=SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens),
+    )
+
+
+class _RecordingMessages:
+    def __init__(self, messages, store: FixtureStore):
+        self._messages = messages
+        self._store = store
+
+    def create(self, **kwargs):
+        start = time.perf_counter()
+        response = self._messages.create(**kwargs)
+        latency = time.perf_counter() - start
+
+        usage = getattr(response, "usage", None)
+        self._store.put_llm(
+            kwargs["messages"], kwargs.get("model"), response.content[0].text,
+            getattr(usage, "input_tokens", 0), getattr(usage, "output_tokens", 0), latency,
+        )
+        return response
+
+
+class RecordingLLMClient:
+    """실제 Anthropic 클라이언트를 감싸 응답을 기록하는 클라이언트"""
+
+    def __init__(self, client, store: FixtureStore):
+        self.messages = _RecordingMessages(client.messages, store)
+
+
+class _ReplayMessages:
+    def __init__(self, store: FixtureStore, simulate_latency: bool):
+        self._store = store
+        self._simulate_latency = simulate_latency
+
+    def create(self, **kwargs):
+        recorded = self._store.get_llm(kwargs["messages"])
+        if recorded is None:
+            self._store.count("llm_missing")
+            raise LookupError("LLM 픽스처 없음 (기록 이후 프롬프트/첨부파일이 바뀜)")
+
+        text, input_tokens, output_tokens, latency = recorded
+        self._store.count("llm_replayed")
+        if self._simulate_latency:
+            time.sleep(latency)
+        return _llm_response(text, input_tokens, output_tokens)
+
+
+class ReplayLLMClient:
+    """픽스처에서 LLM 응답을 재생하는 클라이언트 (API 호출 없음)"""
+
+    def __init__(self, store: FixtureStore, simulate_latency: bool = True):
+        self.messages = _ReplayMessages(store, simulate_latency)
@@ -0,0 +1,329 @@
+"""
+파싱 파이프라인 오프라인 replay 벤치마크
+
+record: 실제 사이트 + Anthropic API로 crawl → parse → save_to_db를 한 번 실행하며
+        HTTP 응답(첨부파일 포함)과 LLM 응답을 픽스처 파일에 기록한다.
+replay: 네트워크 없이 픽스처를 재생해 같은 파이프라인을 로컬 DB에 실행하고 단계별 시간을 기록한다.
+        (동시성/캐시/저장 방식 변경 전후 처리량을 같은 입력으로 비교)
+
+- 스토리지/다운로드/캐시(HTTP, 다운로드 매니페스트, LLM)는 작업 디렉터리로 격리 (운영 데이터 보호)
+- 반복(--iterations) 간 캐시는 유지 → 1회차 = 캐시 없음, 2회차부터 = 캐시 적중 경로
+- 매 회차 전 파이프라인 테이블을 비워 같은 공지를 다시 파싱/저장 (--keep-db로 비활성화)
+- DB는 settings의 DB_*를 사용하며, 테이블을 비우므로 DB 이름에 'bench'가 포함되어야 한다.
+- --latency recorded(기본): 기록 당시 응답 시간만큼 대기 / none: 대기 없음 (CPU/DB 비용만)
+
+Usage:
+    cd services/parser
+    python -m benchmarks.pipeline_replay record --db-name swim_bench --init-schema
+    python -m benchmarks.pipeline_replay replay --db-name swim_bench --iterations 2
+    python -m benchmarks.pipeline_replay replay --db-name swim_bench --latency none --no-rate-limit
+    python -m benchmarks.pipeline_replay replay --db-name swim_bench --compare benchmarks/results/<이전 결과>.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.fixtures import (
+    FixtureStore, RecordingAdapter, RecordingLLMClient, ReplayAdapter, ReplayLLMClient,
+)
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+DEFAULT_FIXTURES = BENCHMARK_DIR / "fixtures" / "pipeline.sqlite3"
+RESULTS_DIR = BENCHMARK_DIR / "results"
+INIT_SQL = BENCHMARK_DIR.parents[1] / "db" / "init.sql"
+
+# 매 회차 전에 비우는 테이블 (FK 순서, facility/review는 유지)
+PIPELINE_TABLES = (
+    "daily_schedule", "daily_schedule_month", "calendar_snapshot", "facility_closure",
+    "swim_session", "swim_schedule", "fee", "notice",
+)
+
+STAGES = ("crawl", "parse", "save")
+
+
+def _configure_environment(args: argparse.Namespace, workdir: Path) -> None:
+    """
+    파서 설정을 환경변수로 덮어쓰기
+
+    settings는 import 시점에 생성되므로 파서 모듈을 import하기 전에 호출해야 한다.
+    """
+    storage = workdir / "storage"
+    overrides = {
+        "STORAGE_DIR": storage,
+        "DOWNLOAD_DIR": workdir / "downloads",
+        "LOG_DIR": workdir / "logs",
+        "LLM_CACHE_PATH": storage / "llm_cache.sqlite3",
+        "HTTP_CACHE_PATH": storage / "http_cache.sqlite3",
+        "DOWNLOAD_MANIFEST_PATH": storage / "download_manifest.sqlite3",
+        "CRAWL_INCREMENTAL": "false",
+        "LOG_LEVEL": args.log_level,
+        "LOG_FORMAT": "text",
+        "LOG_FILE_ENABLED": "false",
+        "LOKI_ENABLED": "false",
+        "METRICS_ENABLED": "false",
+        "DISCORD_WEBHOOK_URL": "",
+    }
+    if args.db_name:
+        overrides["DB_NAME"] = args.db_name
+    if args.command == "replay":
+        # API 키는 사용하지 않지만 settings 필수 항목
+        os.environ.setdefault("ANTHROPIC_API_KEY", "offline-replay")
+        if args.no_rate_limit:
+            overrides["CRAWL_DELAY_SECONDS"] = "0"
+        if args.no_cache:
+            overrides.update(HTTP_CACHE_ENABLED="false", LLM_CACHE_ENABLED="false",
+                             DOWNLOAD_MANIFEST_ENABLED="false")
+
+    os.environ.update({name: str(value) for name, value in overrides.items()})
+
+
+def _check_bench_db() -> None:
+    from infrastructure.config import settings
+
+    # 매 회차 테이블을 비우므로 실수로 운영/개발 DB를 가리키지 않도록 이름으로 확인
+    if "bench" not in settings.DB_NAME:
+        raise SystemExit(f"벤치마크 DB 이름에 'bench'가 포함되어야 합니다 (테이블을 비움): {settings.DB_NAME}")
+
+
+def _execute(statements: List[str]) -> None:
+    from infrastructure.database.connection import get_connection
+
+    conn = get_connection()
+    try:
+        with conn.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _init_schema() -> None:
+    """services/db/init.sql 적용 (CREATE TABLE IF NOT EXISTS)"""
+    lines = [line for line in INIT_SQL.read_text(encoding="utf-8").splitlines()
+             if not line.strip().startswith("--")]
+    _execute([s.strip() for s in "\n".join(lines).split(";") if s.strip()])
+
+
+def _reset_db() -> None:
+    _execute([f"DELETE FROM {table}" for table in PIPELINE_TABLES])
+
+
+def _run_pipeline(keyword: str, max_pages: int) -> Dict:
+    """main.py와 같은 crawl → parse → save_to_db (증분 mark 무시) → 단계별 시간/건수"""
+    import main as pipeline
+
+    timings = {}
+    start = time.perf_counter()
+
+    notices = pipeline.crawl(keyword=keyword, max_pages=max_pages, full=True)
+    timings["crawl"] = time.perf_counter() - start
+
+    stage_start = time.perf_counter()
+    validated = pipeline.parse(monthly_notices=notices)
+    timings["parse"] = time.perf_counter() - stage_start
+
+    stage_start = time.perf_counter()
+    saved = pipeline.save_to_db(validated_results=validated)
+    timings["save"] = time.perf_counter() - stage_start
+    timings["total"] = time.perf_counter() - start
+
+    return {
+        "timings": {stage: round(seconds, 3) for stage, seconds in timings.items()},
+        "counts": {
+            "notices": sum(len(items) for items in notices.values()),
+            "parsed": len(validated),
+            "new_saved": saved["new_saved"],
+            "already_exists": saved["already_exists"],
+            "failed": saved["failed"],
+        },
+    }
+
+
+def _git_commit() -> str:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def record(args: argparse.Namespace, store: FixtureStore) -> None:
+    from core.parser.llm.llm_parser import LLMParser, install_llm_client
+    from infrastructure.utils.http_utils import install_transport_adapter
+
+    real_client = LLMParser().client
+    if real_client is None:
+        raise SystemExit("기록에는 ANTHROPIC_API_KEY가 필요합니다.")
+
+    install_transport_adapter(RecordingAdapter(store))
+    install_llm_client(RecordingLLMClient(real_client, store))
+
+    if args.init_schema:
+        _init_schema()
+    _reset_db()
+
+    outcome = _run_pipeline(args.keyword, args.max_pages)
+    store.set_meta({
+        "keyword": args.keyword,
+        "max_pages": args.max_pages,
+        "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "counts": outcome["counts"],
+    })
+
+    print(f"기록 완료: {outcome['counts']}, 단계별 {outcome['timings']}")
+    print(f"픽스처: {store.path} {store.summary()}")
+
+
+def _format_iteration(result: Dict) -> str:
+    t, c, s = result["timings"], result["counts"], result["replay"]
+    return (
+        f"#{result['iteration']}  "
+        + "  ".join(f"{stage} {t[stage]:>7.2f}s" for stage in STAGES)
+        + f"  total {t['total']:>7.2f}s  |  공지 {c['notices']} 파싱 {c['parsed']} 저장 {c['new_saved']}"
+        + f" 실패 {c['failed']}  |  http {s.get('http_replayed', 0)} (304 {s.get('http_not_modified', 0)},"
+        + f" 누락 {s.get('http_missing', 0)})  llm {s.get('llm_replayed', 0)} (누락 {s.get('llm_missing', 0)})"
+    )
+
+
+def replay(args: argparse.Namespace, store: FixtureStore) -> Dict:
+    from core.parser.llm.llm_parser import install_llm_client
+    from infrastructure.config import settings
+    from infrastructure.utils.http_utils import install_transport_adapter
+
+    meta = store.get_meta()
+    if not meta:
+        raise SystemExit(f"기록된 픽스처가 없습니다: {store.path} (먼저 record 실행)")
+
+    simulate_latency = args.latency == "recorded"
+    install_transport_adapter(ReplayAdapter(store, simulate_latency=simulate_latency))
+    install_llm_client(ReplayLLMClient(store, simulate_latency=simulate_latency))
+
+    if args.init_schema:
+        _init_schema()
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "fixtures": {**store.summary(), "recorded": meta},
+            "latency": args.latency,
+            "settings": {
+                name: getattr(settings, name) for name in (
+                    "CRAWL_CONCURRENCY", "PARSE_CONCURRENCY", "CRAWL_DELAY_SECONDS", "CRAWL_BURST",
+                    "HTTP_CACHE_ENABLED", "DOWNLOAD_MANIFEST_ENABLED", "LLM_CACHE_ENABLED",
+                    "LLM_COMBINED_PROMPT",
+                )
+            },
+        },
+        "iterations": [],
+    }
+
+    print(f"재생: {store.path} {store.summary()}, 기록 조건 keyword={meta['keyword']} max_pages={meta['max_pages']}")
+    for iteration in range(1, args.iterations + 1):
+        if not args.keep_db:
+            _reset_db()
+
+        before = Counter(store.stats)
+        outcome = _run_pipeline(meta["keyword"], meta["max_pages"])
+        outcome["iteration"] = iteration
+        outcome["replay"] = dict(Counter(store.stats) - before)
+
+        report["iterations"].append(outcome)
+        print(_format_iteration(outcome))
+
+    return report
+
+
+def _pct(new: float, old: float) -> str:
+    if not old:
+        return "   n/a"
+    return f"{(new - old) / old * 100:+6.1f}%"
+
+
+def compare(baseline_path: Path, report: Dict) -> None:
+    """이전 결과 대비 회차/단계별 시간 변화 출력"""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    previous = {r["iteration"]: r for r in baseline["iterations"]}
+
+    print(f"\n비교: {baseline['meta']['commit']} → {report['meta']['commit']}")
+    for result in report["iterations"]:
+        old = previous.get(result["iteration"])
+        if old is None:
+            continue
+        print(
+            f"#{result['iteration']}  "
+            + "  ".join(
+                f"{stage} {_pct(result['timings'][stage], old['timings'][stage])}"
+                for stage in (*STAGES, "total")
+            )
+        )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="파싱 파이프라인 record/replay 벤치마크")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES, help="픽스처 SQLite 경로")
+    common.add_argument("--db-name", help="벤치마크 DB 이름 (기본: DB_NAME 설정, 'bench' 포함 필수)")
+    common.add_argument("--init-schema", action="store_true", help="services/db/init.sql로 테이블 생성")
+    common.add_argument("--workdir", type=Path, help="스토리지/캐시 작업 디렉터리 (기본: 임시 디렉터리)")
+    common.add_argument("--log-level", default="WARNING", help="파이프라인 로그 레벨 (기본: WARNING)")
+
+    rec = subparsers.add_parser("record", parents=[common], help="실제 사이트/API 응답 기록")
+    rec.add_argument("--keyword", default="수영", help="검색 키워드 (기본: 수영)")
+    rec.add_argument("--max-pages", type=int, default=3, help="최대 페이지 수 (기본: 3)")
+
+    rep = subparsers.add_parser("replay", parents=[common], help="픽스처로 오프라인 재생")
+    rep.add_argument("--iterations", type=int, default=2, help="반복 횟수 (캐시 유지, 기본: 2)")
+    rep.add_argument("--latency", choices=("recorded", "none"), default="recorded",
+                     help="응답 대기 흉내 (recorded: 기록 당시 응답 시간, none: 대기 없음)")
+    rep.add_argument("--no-rate-limit", action="store_true", help="호스트별 요청 간격 제한 해제")
+    rep.add_argument("--no-cache", action="store_true", help="HTTP/다운로드/LLM 캐시 비활성화")
+    rep.add_argument("--keep-db", action="store_true", help="회차 사이에 DB를 비우지 않음 (중복 건너뛰기 경로 측정)")
+    rep.add_argument("--output", type=Path, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    rep.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="swim-replay-") as tmp:
+        workdir = args.workdir or Path(tmp)
+        _configure_environment(args, workdir)
+        _check_bench_db()
+        store = FixtureStore(args.fixtures)
+
+        if args.command == "record":
+            record(args, store)
+            return
+
+        report = replay(args, store)
+
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}_{report['meta']['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2, default=str), encoding="utf-8")
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        compare(args.compare, report)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
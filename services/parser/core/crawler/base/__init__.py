@@ -6,10 +6,13 @@ from core.crawler.base.list_crawler import BaseListCrawler
 from core.crawler.base.detail_crawler import BaseDetailCrawler
 from core.crawler.base.facility_crawler import BaseFacilityCrawler
 from core.crawler.base.attachment_downloader import BaseAttachmentDownloader
+from core.crawler.base.watermark import CrawlWatermarks, Watermark
 
 __all__ = [
     "BaseListCrawler",
     "BaseDetailCrawler",
     "BaseFacilityCrawler",
     "BaseAttachmentDownloader",
+    "CrawlWatermarks",
+    "Watermark",
 ]
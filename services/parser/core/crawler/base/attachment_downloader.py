@@ -1,10 +1,13 @@
 """
 첨부파일 다운로더
 게시글의 첨부파일을 다운로드하여 로컬에 저장
+(다운로드 매니페스트로 이미 받은 파일은 건너뛰고, 같은 내용의 파일은 한 번만 저장)
 """
+import hashlib
 import os
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 import logging
 import re
 from urllib.parse import unquote
@@ -12,6 +15,9 @@ from urllib.parse import unquote
 import requests
 
 from core.exceptions import DownloadError
+from core.models.facility import Organization
+from infrastructure.cache.download_manifest import DownloadManifest, get_download_manifest
+from infrastructure.metrics.registry import DOWNLOADED_BYTES, DOWNLOADS
 from infrastructure.utils.http_utils import create_session
 
 logging.basicConfig(level=logging.INFO)
@@ -21,26 +27,61 @@ logger = logging.getLogger(__name__)
 DEFAULT_DOWNLOAD_DIR = Path(__file__).parent.parent.parent / "storage" / "raw_data"
 
 
+def write_atomically(file_path: Path, chunks: Iterable[bytes]) -> Tuple[str, int]:
+    """
+    같은 디렉토리의 임시 파일에 쓴 뒤 rename으로 교체
+
+    공지를 동시에 처리하므로 다른 스레드가 해시 계산/텍스트 추출 중인 파일을
+    덮어쓰거나 쓰다 만 파일을 읽지 않도록 한다.
+
+    Returns:
+        (sha256, 크기)
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+
+    fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=".", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                if chunk:
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    return digest.hexdigest(), size
+
+
 class BaseAttachmentDownloader:
     """첨부파일 다운로더 기본 클래스"""
 
-    def __init__(self, download_dir: Optional[Path] = None):
+    org: Optional[Organization] = None
+
+    def __init__(self, download_dir: Optional[Path] = None, manifest: Optional[DownloadManifest] = None):
         """
         Args:
             download_dir: 다운로드 디렉토리 경로
+            manifest: 다운로드 매니페스트 (기본: 프로세스 전역, DOWNLOAD_MANIFEST_ENABLED=false면 사용 안 함)
         """
         self.download_dir = download_dir or DEFAULT_DOWNLOAD_DIR
         self.download_dir.mkdir(parents=True, exist_ok=True)
 
         self.session = create_session()
+        self.manifest = manifest if manifest is not None else get_download_manifest()
 
-    def download(self, url: str, filename: Optional[str] = None) -> Path:
+    def download(self, url: str, filename: Optional[str] = None, post_id: Optional[str] = None) -> Path:
         """
         파일 다운로드
 
         Args:
             url: 다운로드 URL
             filename: 저장할 파일명 (없으면 자동 추출)
+            post_id: 게시글 ID (있으면 download_dir/<post_id>/ 아래에 저장, 다른 공지의 같은 파일명과 분리)
 
         Returns:
             저장된 파일 경로
@@ -48,6 +89,13 @@ class BaseAttachmentDownloader:
         Raises:
             DownloadError: 다운로드 실패 시
         """
+        if self.manifest is not None:
+            existing = self.manifest.lookup(url)
+            if existing:
+                logger.info(f"이미 받은 파일, 다운로드 생략: {existing.name}")
+                DOWNLOADS.labels(self._metrics_org, "skipped").inc()
+                return existing
+
         try:
             response = self.session.get(url, stream=True, timeout=30)
             response.raise_for_status()
@@ -63,21 +111,30 @@ class BaseAttachmentDownloader:
 
         # 안전한 파일명으로 변환
         safe_filename = self._sanitize_filename(filename)
-        file_path = self.download_dir / safe_filename
+        target_dir = self.download_dir / self._sanitize_filename(post_id) if post_id else self.download_dir
+        file_path = target_dir / safe_filename
 
-        # 파일 저장
+        # 파일 저장 (저장하면서 sha256 계산)
         try:
-            with open(file_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-
+            sha256, size = write_atomically(file_path, response.iter_content(chunk_size=8192))
             logger.info(f"다운로드 완료: {file_path}")
-            return file_path
 
-        except IOError as e:
+        except (IOError, requests.RequestException) as e:
             raise DownloadError(f"파일 저장 실패: {e}", cause=e)
 
+        DOWNLOADED_BYTES.labels(self._metrics_org).inc(size)
+        if self.manifest is not None:
+            recorded = self.manifest.record(url, file_path, sha256, size)
+            DOWNLOADS.labels(self._metrics_org, "deduplicated" if recorded != file_path else "downloaded").inc()
+            return recorded
+
+        DOWNLOADS.labels(self._metrics_org, "downloaded").inc()
+        return file_path
+
+    @property
+    def _metrics_org(self) -> str:
+        return self.org.value if self.org else "unknown"
+
     def _extract_filename_from_response(self, response, url: str) -> Optional[str]:
         """응답 헤더 또는 URL에서 파일명 추출"""
         # Content-Disposition 헤더에서 파일명 추출
@@ -127,9 +184,9 @@ class BaseAttachmentDownloader:
 
         return safe_name
 
-    def download_hwp(self, url: str, filename: Optional[str] = None) -> Path:
+    def download_hwp(self, url: str, filename: Optional[str] = None, post_id: Optional[str] = None) -> Path:
         """HWP 파일 다운로드 (확장자 검증 포함)"""
-        filepath = self.download(url, filename)
+        filepath = self.download(url, filename, post_id)
 
         if not filepath.suffix.lower() == ".hwp":
             logger.warning(f"다운로드된 파일이 HWP가 아님: {filepath}")
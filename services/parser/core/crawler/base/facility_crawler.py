@@ -8,6 +8,9 @@ from typing import List, Dict, Optional, TYPE_CHECKING
 import logging
 
 from core.models.facility import Facility, Organization
+from infrastructure.config import settings
+from infrastructure.metrics.registry import CRAWL_PAGES
+from infrastructure.utils.concurrency import run_concurrently
 
 if TYPE_CHECKING:
     from core.models.crawler import FacilityInfoResponse
@@ -20,7 +23,7 @@ class BaseFacilityCrawler(ABC):
     시설 기본 정보 크롤러 추상 클래스
 
     공통 로직:
-    - 모든 시설 크롤링 (crawl_all_facilities)
+    - 모든 시설 크롤링 (crawl_all_facilities, 시설 단위 동시 요청)
 
     기관별 구현 필요:
     - 단일 시설 크롤링 (crawl_facility)
@@ -67,26 +70,35 @@ class BaseFacilityCrawler(ABC):
         """
         모든 시설 크롤링 (공통 로직)
 
+        시설 페이지는 CRAWL_CONCURRENCY 만큼 동시에 요청한다. (결과는 시설 순서 유지)
+
         Returns:
             FacilityInfoResponse DTO 리스트
         """
         facilities = self.get_target_facilities()
-        results = []
 
-        for facility in facilities:
+        def crawl_one(facility: Facility) -> Optional["FacilityInfoResponse"]:
             self.logger.info(f"[{facility.name}] 크롤링 시작...")
 
             try:
                 data = self.crawl_facility(facility)
+                CRAWL_PAGES.labels(facility.organization.value, "facility").inc()
                 if data:
-                    results.append(data)
                     self.logger.info(f"[{facility.name}] 크롤링 완료")
                 else:
                     self.logger.warning(f"[{facility.name}] 데이터 없음")
+                return data
 
             except Exception as e:
                 self.logger.error(f"[{facility.name}] 크롤링 실패: {e}")
-                continue
+                return None
+
+        results = [
+            data for data in run_concurrently(
+                crawl_one, facilities, settings.CRAWL_CONCURRENCY, thread_name_prefix="facility"
+            )
+            if data
+        ]
 
         self.logger.info(f"전체 크롤링 완료: {len(results)}/{len(facilities)}개 시설")
         return results
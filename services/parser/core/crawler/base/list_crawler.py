@@ -7,9 +7,11 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 import logging
-import time
 
+from core.crawler.base.watermark import CrawlWatermarks
 from core.models.crawler import PostSummary
+from core.models.facility import Organization
+from infrastructure.metrics.registry import CRAWL_PAGES
 
 logger = logging.getLogger(__name__)
 
@@ -20,14 +22,18 @@ class BaseListCrawler(ABC):
 
     공통 로직:
     - 페이지네이션 (get_posts)
-    - Rate limiting (_sleep)
+    - 증분 크롤링 (watermarks: 이미 본 게시글에 도달하면 중단)
     - 에러 핸들링
+    (Rate limiting은 create_session 세션의 호스트별 토큰 버킷이 담당)
 
     기관별 구현 필요:
     - HTTP 세션 초기화 (_init_session)
     - 단일 페이지 크롤링 (_crawl_page)
+    - 기관 (org)
     """
 
+    org: Optional[Organization] = None
+
     def __init__(self):
         self.session = self._init_session()
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -68,27 +74,31 @@ class BaseListCrawler(ABC):
         """
         pass
 
-    def get_posts(self, keyword: str = "수영", max_pages: int = 5, **kwargs) -> List[PostSummary]:
+    def get_posts(self, keyword: str = "수영", max_pages: int = 5,
+                  watermarks: Optional[CrawlWatermarks] = None, **kwargs) -> List[PostSummary]:
         """
         공통 크롤링 로직 (템플릿 메서드 패턴)
 
-        페이지네이션, 에러 핸들링, Rate limiting을 공통으로 처리
+        페이지네이션, 에러 핸들링을 공통으로 처리
 
         Args:
             keyword: 검색 키워드 (기본값: "수영")
             max_pages: 최대 검색할 페이지 수
+            watermarks: 증분 크롤링 mark (지정 시 이미 본 게시글에 도달하면 중단)
             **kwargs: 기관별 추가 파라미터 (facility_id 등)
 
         Returns:
             모든 페이지의 PostSummary 리스트
         """
         all_posts = []
+        mark_key = self.watermark_key(keyword, **kwargs)
 
         for page in range(1, max_pages + 1):
             self.logger.info(f"페이지 {page} 크롤링 중...")
 
             try:
                 posts = self._crawl_page(keyword, page, **kwargs)
+                CRAWL_PAGES.labels(self.metrics_org, "list").inc()
 
                 if not posts:
                     self.logger.info(f"페이지 {page}에서 더 이상 게시글 없음. 종료.")
@@ -97,25 +107,29 @@ class BaseListCrawler(ABC):
                 all_posts.extend(posts)
                 self.logger.debug(f"페이지 {page}: {len(posts)}개 게시글 발견")
 
+                if watermarks and watermarks.reached(mark_key, posts):
+                    self.logger.info(f"페이지 {page}에서 이전 크롤링 지점 도달. 종료.")
+                    break
+
             except Exception as e:
                 self.logger.error(f"페이지 {page} 크롤링 실패: {e}")
                 # 실패해도 계속 진행 (다음 페이지 시도)
                 continue
 
-            # Rate limiting
-            self._sleep()
+        if watermarks:
+            watermarks.observe(mark_key, all_posts)
 
         self.logger.info(f"총 {len(all_posts)}개 게시글 수집 완료")
         return all_posts
 
-    def _sleep(self, seconds: float = 0.5):
-        """
-        서버 부하 방지 (Rate limiting)
+    @property
+    def metrics_org(self) -> str:
+        """메트릭 라벨용 기관 키"""
+        return self.org.value if self.org else self.__class__.__name__
 
-        Args:
-            seconds: 대기 시간 (초)
-        """
-        time.sleep(seconds)
+    def watermark_key(self, keyword: str, facility_id: Optional[str] = None, **kwargs) -> str:
+        """(기관, 키워드, 시설) 게시판 식별 키"""
+        return CrawlWatermarks.key(self.metrics_org, keyword, facility_id)
 
     def filter_posts_by_keyword(self, posts: List[PostSummary], keyword: str) -> List[PostSummary]:
         """
@@ -0,0 +1,148 @@
+"""
+증분 크롤링 high-water mark
+
+(기관, 키워드, 시설) 게시판별로 마지막으로 본 최신 게시글(post_id, 등록일)을 기억하고,
+목록 페이지를 넘기다 이미 본 게시글에 도달하면 페이지네이션을 멈춘다.
+정상 상태의 야간 크롤링은 게시판당 1페이지만 요청한다.
+
+새로 관찰한 mark는 pending에 쌓아두고, 파이프라인이 DB 저장까지 끝낸 뒤 commit()한다.
+(다운로드/추출/LLM 파싱 실패는 hold()로 표시 → 확정하지 않고 다음 실행에서 같은 범위를 다시 크롤링)
+"""
+import re
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_DATE_PATTERN = re.compile(r"(\d{4})\D{0,2}(\d{1,2})\D{0,2}(\d{1,2})")
+
+
+def _normalize_date(value) -> str:
+    """등록일 → YYYY-MM-DD (해석 불가 시 빈 문자열)"""
+    if value is None:
+        return ""
+    text = str(value).strip()
+
+    # epoch milliseconds (API가 숫자로 주는 경우)
+    if text.isdigit() and len(text) >= 12:
+        return datetime.fromtimestamp(int(text) / 1000).strftime("%Y-%m-%d")
+
+    match = _DATE_PATTERN.search(text)
+    if not match:
+        return ""
+    year, month, day = (int(g) for g in match.groups())
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def _numeric_id(post_id: str) -> Optional[int]:
+    return int(post_id) if str(post_id).isdigit() else None
+
+
+@dataclass
+class Watermark:
+    """게시판별 마지막으로 본 최신 게시글"""
+    post_id: str
+    date: str  # YYYY-MM-DD
+
+    def _order(self) -> Tuple[str, int]:
+        numeric = _numeric_id(self.post_id)
+        return self.date, numeric if numeric is not None else -1
+
+    @classmethod
+    def of(cls, post) -> "Watermark":
+        """PostSummary/PostDetail → Watermark"""
+        return cls(post_id=str(post.post_id), date=_normalize_date(post.date))
+
+    def covers(self, post) -> bool:
+        """post가 이 mark 이전(이미 본) 게시글인지"""
+        other = Watermark.of(post)
+        if other.post_id == self.post_id:
+            return True
+
+        if other.date and self.date and other.date != self.date:
+            return other.date < self.date
+
+        # 같은 날짜(또는 날짜 해석 불가) → 게시글 번호로 비교
+        mine, theirs = _numeric_id(self.post_id), _numeric_id(other.post_id)
+        if mine is not None and theirs is not None:
+            return theirs <= mine
+        return False
+
+
+class CrawlWatermarks:
+    """게시판별 high-water mark 모음 (commit 전까지 변경은 pending에 보관, 기관 동시 크롤링 대응)"""
+
+    def __init__(self, marks: Optional[Dict[str, dict]] = None):
+        self._marks: Dict[str, Watermark] = {
+            key: Watermark(**value) for key, value in (marks or {}).items()
+        }
+        self._pending: Dict[str, Watermark] = {}
+        self._held: List[str] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(org_key: str, keyword: str, facility: Optional[str] = None) -> str:
+        """(기관, 키워드, 시설) → mark 키 (시설 미지정은 "*")"""
+        return f"{org_key}:{keyword}:{facility or '*'}"
+
+    def get(self, key: str) -> Optional[Watermark]:
+        """커밋된 mark (이번 실행에서 관찰한 pending은 중단 판단에 쓰지 않음)"""
+        return self._marks.get(key)
+
+    def reached(self, key: str, posts: list) -> bool:
+        """
+        이미 본 구간에 도달했는지
+
+        목록은 최신순이므로 페이지의 마지막(가장 오래된) 게시글이 이미 본 글이면
+        다음 페이지는 모두 본 글이다. (상단 고정 공지는 오래된 글이어도 판단에 영향 없음)
+        """
+        mark = self.get(key)
+        return bool(mark and posts and mark.covers(posts[-1]))
+
+    def observe(self, key: str, posts: Iterable) -> None:
+        """이번 크롤링에서 본 게시글 중 최신 글을 pending mark로 기록"""
+        candidates = [Watermark.of(post) for post in posts]
+        if not candidates:
+            return
+
+        newest = max(candidates, key=Watermark._order)
+        with self._lock:
+            current = self._pending.get(key) or self._marks.get(key)
+            if current is None or newest._order() > current._order():
+                self._pending[key] = newest
+
+    def commit(self) -> Dict[str, dict]:
+        """pending mark 반영 → 저장할 전체 mark 딕셔너리"""
+        with self._lock:
+            self._marks.update(self._pending)
+            self._pending.clear()
+        return self.to_dict()
+
+    def hold(self, reason: str) -> None:
+        """
+        이번 실행의 pending mark 확정 보류
+
+        DB 저장 전에 실패한 공지는 save 결과에 나타나지 않으므로,
+        mark를 올리면 목록 1페이지에서 밀려난 뒤 다시 크롤링되지 않는다.
+        """
+        with self._lock:
+            self._held.append(reason)
+
+    def discard(self) -> None:
+        """pending mark 및 보류 사유 폐기"""
+        with self._lock:
+            self._pending.clear()
+            self._held.clear()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    @property
+    def held(self) -> List[str]:
+        """확정 보류 사유 (비어 있으면 commit 가능)"""
+        with self._lock:
+            return list(self._held)
+
+    def to_dict(self) -> Dict[str, dict]:
+        return {key: asdict(mark) for key, mark in self._marks.items()}
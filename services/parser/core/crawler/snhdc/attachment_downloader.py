@@ -1,12 +1,17 @@
 """
 성남도시개발공사 첨부파일 다운로더
 /downloadFile.ajax API를 통해 HWP/PDF 파일 다운로드
+(다운로드 매니페스트로 이미 받은 파일은 건너뛰고, 같은 내용의 파일은 한 번만 저장)
 """
 from pathlib import Path
 from typing import Optional
 import logging
 import requests
 
+from core.crawler.base.attachment_downloader import write_atomically
+from core.models.facility import Organization
+from infrastructure.cache.download_manifest import DownloadManifest, get_download_manifest
+from infrastructure.metrics.registry import DOWNLOADED_BYTES, DOWNLOADS
 from infrastructure.utils.http_utils import create_session
 
 logging.basicConfig(level=logging.INFO)
@@ -18,15 +23,17 @@ DOWNLOAD_API_URL = "https://spo.isdc.co.kr/downloadFile.ajax"
 class AttachmentDownloader:
     """SNHDC 첨부파일 다운로더"""
 
-    def __init__(self, download_dir: Optional[Path] = None):
+    def __init__(self, download_dir: Optional[Path] = None, manifest: Optional[DownloadManifest] = None):
         """
         Args:
             download_dir: 다운로드 디렉토리 (기본값: ./downloads)
+            manifest: 다운로드 매니페스트 (기본: 프로세스 전역, DOWNLOAD_MANIFEST_ENABLED=false면 사용 안 함)
         """
         self.download_dir = download_dir or Path("downloads")
         self.download_dir.mkdir(parents=True, exist_ok=True)
 
         self.session = create_session()
+        self.manifest = manifest if manifest is not None else get_download_manifest()
 
     def download_file(self,
                      idx: str,
@@ -62,6 +69,15 @@ class AttachmentDownloader:
             logger.warning(f"파일명을 찾을 수 없습니다: file_no={file_no}")
             return None
 
+        # 다운로드 API는 POST 단일 URL이므로 (게시글 ID, 파일 번호, 파일명)으로 식별
+        source_key = f"snhdc:{idx}:{file_no}:{filename}"
+        if self.manifest is not None:
+            existing = self.manifest.lookup(source_key)
+            if existing:
+                logger.info(f"이미 받은 파일, 다운로드 생략: {existing.name}")
+                DOWNLOADS.labels(Organization.SNHDC.value, "skipped").inc()
+                return existing
+
         logger.info(f"파일 다운로드 중: {filename}")
 
         # API 요청
@@ -78,14 +94,22 @@ class AttachmentDownloader:
             response = self.session.post(DOWNLOAD_API_URL, data=data, timeout=30)
             response.raise_for_status()
 
-            # 파일 저장
-            file_path = self.download_dir / filename
-            file_path.write_bytes(response.content)
+            # 파일 저장 (게시글별 디렉토리, 다른 공지의 같은 파일명과 분리)
+            file_path = self.download_dir / idx / filename
+            sha256, size = write_atomically(file_path, [response.content])
+
+            logger.info(f"✓ 다운로드 완료: {file_path} ({size} bytes)")
+            DOWNLOADED_BYTES.labels(Organization.SNHDC.value).inc(size)
 
-            logger.info(f"✓ 다운로드 완료: {file_path} ({len(response.content)} bytes)")
+            result = "downloaded"
+            if self.manifest is not None:
+                recorded = self.manifest.record(source_key, file_path, sha256, size)
+                if recorded != file_path:
+                    result, file_path = "deduplicated", recorded
+            DOWNLOADS.labels(Organization.SNHDC.value, result).inc()
             return file_path
 
-        except requests.RequestException as e:
+        except (requests.RequestException, OSError) as e:
             logger.error(f"다운로드 실패: {filename} - {e}")
             return None
 
@@ -12,6 +12,7 @@ import requests
 from core.models.facility import Facility, Organization, get_snhdc_program_url
 from core.crawler.base.facility_crawler import BaseFacilityCrawler
 from core.models.crawler import FacilityInfoResponse, WeekdayScheduleItem, WeekendSchedule
+from infrastructure.cache.http_response_cache import fetch_parsed
 from infrastructure.utils.http_utils import create_session
 
 logger = logging.getLogger(__name__)
@@ -45,14 +46,17 @@ class FacilityInfoCrawler(BaseFacilityCrawler):
         url = get_snhdc_program_url(facility)
 
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            # 변경 없는 페이지는 304/본문 해시로 판단해 이전 파싱 결과 재사용
+            return fetch_parsed(
+                self.session, url,
+                parse=lambda html: self._parse_facility_page(facility.name, url, html),
+                encode=FacilityInfoResponse.to_dict,
+                decode=FacilityInfoResponse.from_dict,
+            )
         except requests.RequestException as e:
             self.logger.error(f"페이지 요청 실패: {e}")
             return {}
 
-        return self._parse_facility_page(facility.name, url, response.text)
-
     def _parse_facility_page(self, facility_name: str, url: str, html: str) -> FacilityInfoResponse:
         """일일자유이용 안내 페이지 파싱 (다양한 HTML 구조 지원)"""
         soup = BeautifulSoup(html, "html.parser")
@@ -9,7 +9,9 @@ import requests
 
 from core.models.facility import Facility, Organization, SNHDC_BASE_URL
 from core.crawler.base.list_crawler import BaseListCrawler
+from core.crawler.base.watermark import CrawlWatermarks
 from core.models.crawler import PostSummary, PostDetail, Attachment
+from infrastructure.metrics.registry import CRAWL_PAGES
 from infrastructure.utils.html_utils import extract_clean_text
 from infrastructure.utils.http_utils import create_session
 
@@ -26,6 +28,8 @@ class ListCrawler(BaseListCrawler):
     AJAX API를 사용하여 게시글 목록 수집
     """
 
+    org = Organization.SNHDC
+
     @staticmethod
     def get_facility_id(facility_name: str) -> Optional[str]:
         """시설명으로 facility_id 조회"""
@@ -116,7 +120,8 @@ class ListCrawler(BaseListCrawler):
 
         return posts
 
-    def get_posts_with_details(self, keyword: str = "", max_pages: int = 5, **kwargs) -> List[PostDetail]:
+    def get_posts_with_details(self, keyword: str = "", max_pages: int = 5,
+                               watermarks: Optional[CrawlWatermarks] = None, **kwargs) -> List[PostDetail]:
         """
         게시글 목록과 상세 정보를 함께 수집 (SNHDC 전용)
 
@@ -125,12 +130,14 @@ class ListCrawler(BaseListCrawler):
         Args:
             keyword: 검색 키워드
             max_pages: 최대 페이지 수
+            watermarks: 증분 크롤링 mark (지정 시 이미 본 게시글에 도달하면 중단)
 
         Returns:
             PostDetail 리스트
         """
         details = []
         facility_id = kwargs.get("facility_id")
+        mark_key = self.watermark_key(keyword, facility_id=facility_id)
 
         for page in range(1, max_pages + 1):
             logger.info(f"페이지 {page} 크롤링 중...")
@@ -147,21 +154,27 @@ class ListCrawler(BaseListCrawler):
             try:
                 response = self.session.post(API_URL, data=data, timeout=10)
                 response.raise_for_status()
+                CRAWL_PAGES.labels(self.metrics_org, "list").inc()
                 json_data = response.json()
 
                 notice_list = json_data.get("data", [])
                 if not notice_list:
                     break
 
-                for item in notice_list:
-                    detail = self._item_to_post_detail(item)
-                    if detail:
-                        details.append(detail)
+                page_details = [d for d in map(self._item_to_post_detail, notice_list) if d]
+                details.extend(page_details)
+
+                if watermarks and watermarks.reached(mark_key, page_details):
+                    logger.info(f"페이지 {page}에서 이전 크롤링 지점 도달. 종료.")
+                    break
 
             except Exception as e:
                 logger.error(f"페이지 {page} 크롤링 실패: {e}")
                 break
 
+        if watermarks:
+            watermarks.observe(mark_key, details)
+
         logger.info(f"총 {len(details)}개 게시글 상세 수집 완료")
         return details
 
@@ -9,6 +9,7 @@ import logging
 from core.crawler.base.attachment_downloader import BaseAttachmentDownloader
 from core.exceptions import DownloadError
 from core.models.crawler import PostDetail
+from core.models.facility import Organization
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,8 @@ logger = logging.getLogger(__name__)
 class AttachmentDownloader(BaseAttachmentDownloader):
     """SNYOUTH 첨부파일 다운로더 (base 상속)"""
 
+    org = Organization.SNYOUTH
+
     def download_from_post_detail(self, post_detail: PostDetail) -> List[Path]:
         """
         PostDetail 객체에서 모든 첨부파일 다운로드
@@ -36,7 +39,8 @@ class AttachmentDownloader(BaseAttachmentDownloader):
             try:
                 file_path = self.download(
                     url=attachment.download_url,
-                    filename=attachment.filename
+                    filename=attachment.filename,
+                    post_id=post_detail.post_id
                 )
                 downloaded_files.append(file_path)
             except DownloadError as e:
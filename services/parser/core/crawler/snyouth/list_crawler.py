@@ -3,12 +3,15 @@
 성남시청소년청년재단 수영장 공지 게시판에서 게시글 목록을 수집
 """
 from bs4 import BeautifulSoup
+from dataclasses import asdict
 from typing import List, Dict, Optional
 import logging
 import requests
 
 from core.crawler.base.list_crawler import BaseListCrawler
 from core.models.crawler import PostSummary
+from core.models.facility import Organization
+from infrastructure.cache.http_response_cache import fetch_parsed
 from infrastructure.utils.http_utils import create_session
 
 logger = logging.getLogger(__name__)
@@ -24,6 +27,8 @@ class ListCrawler(BaseListCrawler):
     HTML 파싱 방식으로 게시글 목록 수집
     """
 
+    org = Organization.SNYOUTH
+
     def _init_session(self):
         """HTTP 세션 초기화"""
         return create_session()
@@ -37,14 +42,17 @@ class ListCrawler(BaseListCrawler):
         }
 
         try:
-            response = self.session.get(BOARD_URL, params=params, timeout=10)
-            response.raise_for_status()
+            # 변경 없는 목록 페이지는 304/본문 해시로 판단해 이전 파싱 결과 재사용
+            return fetch_parsed(
+                self.session, BOARD_URL, self._parse_list_page,
+                encode=lambda posts: [asdict(post) for post in posts],
+                decode=lambda items: [PostSummary(**item) for item in items],
+                params=params,
+            )
         except requests.RequestException as e:
             logger.error(f"페이지 요청 실패: {e}")
             return []
 
-        return self._parse_list_page(response.text)
-
     def _parse_list_page(self, html: str) -> List[PostSummary]:
         """목록 페이지 HTML 파싱"""
         soup = BeautifulSoup(html, "html.parser")
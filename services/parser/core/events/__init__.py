@@ -1,4 +1,4 @@
 from .event_bus import EventBus
-from .events import ScheduleSaved, PoolClosureDetected
+from .events import ScheduleSaved, BatchCompleted, PoolClosureDetected
 
-__all__ = ["EventBus", "ScheduleSaved", "PoolClosureDetected"]
+__all__ = ["EventBus", "ScheduleSaved", "BatchCompleted", "PoolClosureDetected"]
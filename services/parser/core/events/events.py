@@ -10,6 +10,12 @@ class ScheduleSaved:
     valid_month: str
 
 
+@dataclass(frozen=True)
+class BatchCompleted:
+    """수집 배치(저장 단계)가 끝난 후 발행되는 이벤트"""
+    new_saved: int
+
+
 @dataclass(frozen=True)
 class PoolClosureDetected:
     """수영장 휴장이 감지되었을 때 발행되는 이벤트"""
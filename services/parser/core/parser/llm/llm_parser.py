@@ -6,36 +6,66 @@ Anthropic Claude API를 사용하여 raw_text에서 구조화된 데이터 추
 1. parse_schedule(): 자유수영 스케줄 정보만 추출
 2. parse_closures(): 휴무일 정보만 추출
 3. parse(): 두 기능을 결합하여 전체 정보 추출 (기존 호환성 유지)
+   - 기본: 두 요청을 동시에 실행 (공지당 LLM 대기 시간 ≈ 한 번의 호출)
+   - LLM_COMBINED_PROMPT: 통합 프롬프트 한 번으로 추출 (출력 토큰 한도가 충분할 때만)
 """
 import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Optional
 
 from core.exceptions import ParseError
 from infrastructure.config import settings
 from infrastructure.config.logging_config import get_logger
-from core.parser.llm.prompts import EXTRACTION_PROMPT, CLOSURE_EXTRACTION_PROMPT
+from infrastructure.cache.llm_result_cache import LLMResultCache, get_llm_result_cache
+from infrastructure.metrics.registry import LLM_CACHE_HITS, LLM_REQUEST_DURATION, LLM_TOKENS
+from core.parser.llm.prompts import EXTRACTION_PROMPT, CLOSURE_EXTRACTION_PROMPT, COMBINED_EXTRACTION_PROMPT
 from core.parser.llm.validator import ScheduleValidator, validate_and_fix
 from core.models.parser import ParsedScheduleData, ClosureData
 
 logger = get_logger(__name__)
 
+# 통합 프롬프트 사용에 필요한 최소 출력 토큰 (스케줄 + 휴무일 JSON을 한 번에 받기 위함)
+COMBINED_MIN_MAX_TOKENS = 6000
+
+# Anthropic 클라이언트 대신 사용할 messages.create 호환 클라이언트 (오프라인 record/replay 벤치마크용)
+_client_override = None
+
+
+def install_llm_client(client) -> None:
+    """이후 생성되는 LLMParser가 사용할 클라이언트 지정 (None이면 Anthropic 클라이언트로 복원)"""
+    global _client_override
+    _client_override = client
+
 
 class LLMParser:
     """LLM 기반 자유수영 정보 파서"""
 
-    def __init__(self):
-        """환경변수에서 API 키와 모델 정보를 로드하여 초기화"""
+    def __init__(self, cache: Optional[LLMResultCache] = None):
+        """
+        환경변수에서 API 키와 모델 정보를 로드하여 초기화
+
+        Args:
+            cache: LLM 결과 캐시 (기본: 프로세스 전역 캐시, LLM_CACHE_ENABLED=false면 사용 안 함)
+        """
         self.api_key = settings.ANTHROPIC_API_KEY
         self.model = settings.LLM_MODEL
         self.max_tokens = settings.LLM_MAX_TOKENS
         self.temperature = settings.LLM_TEMPERATURE
+        self.timeout = settings.LLM_TIMEOUT
+        self.max_retries = settings.LLM_MAX_RETRIES
+        self.combined_prompt = settings.LLM_COMBINED_PROMPT
+        self.cache = cache if cache is not None else get_llm_result_cache()
         self.client = None
         self._init_client()
 
     def _init_client(self):
         """Anthropic 클라이언트 초기화"""
+        if _client_override is not None:
+            self.client = _client_override
+            return
+
         if not self.api_key:
             logger.warning("ANTHROPIC_API_KEY가 설정되지 않았습니다.")
             return
@@ -43,9 +73,12 @@ class LLMParser:
         try:
             from anthropic import Anthropic
             # JetBrains 프록시 대신 Anthropic API 직접 사용
+            # 타임아웃/재시도는 스케줄·휴무일 요청이 같은 클라이언트 설정을 공유
             self.client = Anthropic(
                 api_key=self.api_key,
-                base_url="https://api.anthropic.com"
+                base_url="https://api.anthropic.com",
+                timeout=self.timeout,
+                max_retries=self.max_retries
             )
             logger.info(f"Anthropic 클라이언트 초기화 완료 (모델: {self.model})")
         except ImportError:
@@ -78,64 +111,15 @@ class LLMParser:
 
         # 자유수영 전용 프롬프트 구성
         prompt = EXTRACTION_PROMPT + raw_text[:8000]  # 토큰 제한 고려
-
-        if notice_date:
-            # 등록일에서 연도와 월 추출
-            date_match = re.search(r'(\d{4})-(\d{2})', notice_date)
-            if date_match:
-                reg_year, reg_month = int(date_match.group(1)), int(date_match.group(2))
-                prompt += f"\n\n**★★★ 연도 결정 필수 정보 ★★★**"
-                prompt += f"\n- 공지 등록일: {notice_date} (등록 연도: {reg_year}년, 등록 월: {reg_month}월)"
-                prompt += f"\n- 문서에 '1월', '2월', '3월' 등 1~3월이 나오고, 등록일이 10~12월이면:"
-                prompt += f"\n  → valid_month는 반드시 **{reg_year + 1}년** 으로 설정!"
-                prompt += f"\n  예) 등록일 {reg_year}-12-29, 프로그램 '1월' → valid_month = '{reg_year + 1}년 1월'"
-                prompt += f"\n- 등록일({notice_date})보다 과거의 valid_month는 절대 불가!"
-            else:
-                prompt += f"\n힌트: 이 공지는 '{notice_date}'에 등록되었습니다."
-
-        if notice_title:
-            prompt += f"\n\n공지사항 제목: '{notice_title}'"
-
-        if facility_name:
-            prompt += f"\n시설명: '{facility_name}'"
+        prompt += self._schedule_hints(facility_name, notice_date, notice_title)
 
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-
-            # 응답에서 JSON 추출
-            response_text = response.content[0].text.strip()
-            result = self._extract_json(response_text)
+            result = self._request_json(prompt, "schedule")
 
             if not result:
                 raise ParseError("LLM 응답에서 JSON을 추출할 수 없습니다.")
 
-            result["source_url"] = source_url
-            result["closures"] = []  # 자유수영 파싱에서는 closures 제외
-            parsed_data = ParsedScheduleData.from_dict(result)
-            logger.info(f"자유수영 스케줄 파싱 성공: {parsed_data.facility_name}")
-
-            # 검증 및 자동 수정
-            validator = ScheduleValidator()
-            is_valid, warnings, errors = validator.validate(parsed_data)
-
-            if not is_valid:
-                logger.warning(f"파싱 결과 검증 실패: {errors}")
-                parsed_data = validate_and_fix(parsed_data)
-
-                is_valid, warnings, errors = validator.validate(parsed_data)
-                if is_valid:
-                    logger.info("자동 수정 후 검증 성공")
-                else:
-                    logger.error(f"자동 수정 후에도 검증 실패: {errors}")
-
-            return parsed_data
+            return self._to_schedule_data(result, source_url)
 
         except ParseError:
             raise
@@ -164,52 +148,13 @@ class LLMParser:
 
         # 휴무일 전용 프롬프트 구성
         prompt = CLOSURE_EXTRACTION_PROMPT + raw_text[:8000]
-
-        if notice_date:
-            # 등록일에서 연도와 월 추출
-            date_match = re.search(r'(\d{4})-(\d{2})', notice_date)
-            if date_match:
-                reg_year, reg_month = int(date_match.group(1)), int(date_match.group(2))
-                prompt += f"\n\n**★★★ 연도 결정 필수 정보 ★★★**"
-                prompt += f"\n- 공지 등록일: {notice_date} (등록 연도: {reg_year}년, 등록 월: {reg_month}월)"
-                prompt += f"\n- 문서에 '1월', '2월', '3월' 등 1~3월이 나오고, 등록일이 10~12월이면:"
-                prompt += f"\n  → dates는 반드시 **{reg_year + 1}년** 으로 설정!"
-                prompt += f"\n  예) 등록일 {reg_year}-12-29, 휴무일 '2월 1일' → dates = ['**{reg_year + 1}-02-01**']"
-                prompt += f"\n- 등록일({notice_date})보다 과거 날짜는 절대 불가!"
-            else:
-                prompt += f"\n힌트: 이 공지는 '{notice_date}'에 등록되었습니다."
-
-        if facility_name:
-            prompt += f"\n힌트: 시설명은 '{facility_name}'입니다."
+        prompt += self._closure_hints(facility_name, notice_date)
 
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-
-            response_text = response.content[0].text.strip()
-            result = self._extract_json(response_text)
-
-            if result and "closures" in result:
-                closures = [
-                    ClosureData(
-                        closure_type=c["closure_type"],
-                        day_of_week=c.get("day_of_week"),
-                        week_pattern=c.get("week_pattern"),
-                        dates=c.get("dates"),
-                        reason=c.get("reason", "")
-                    )
-                    for c in result["closures"]
-                ]
+            closures = self._to_closures(self._request_json(prompt, "closure"))
+            if closures:
                 logger.info(f"휴무일 파싱 성공: {len(closures)}건")
-                return closures
-
-            return []
+            return closures
 
         except Exception as e:
             logger.error(f"휴무일 파싱 실패: {e}")
@@ -219,7 +164,9 @@ class LLMParser:
         """
         raw_text에서 자유수영 정보 전체 추출 (스케줄 + 휴무일)
 
-        내부적으로 parse_schedule()과 parse_closures()를 순차 호출하여 결과를 병합합니다.
+        두 프롬프트는 서로 독립적이므로 parse_schedule()과 parse_closures()를 동시에 호출하여
+        결과를 병합합니다. LLM_COMBINED_PROMPT가 켜져 있고 출력 토큰 한도가 충분하면
+        통합 프롬프트 한 번으로 추출합니다.
 
         Args:
             raw_text: HWP/PDF에서 추출한 원문 텍스트
@@ -231,28 +178,234 @@ class LLMParser:
         Returns:
             ParsedScheduleData DTO 또는 None
         """
-        # 1. 자유수영 스케줄 파싱 (ParseError는 호출자에게 전파)
-        parsed_data = self.parse_schedule(
-            raw_text=raw_text,
-            facility_name=facility_name,
-            notice_date=notice_date,
-            notice_title=notice_title,
-            source_url=source_url
-        )
-
-        # 2. 휴무일 파싱
-        closures = self.parse_closures(
-            raw_text=raw_text,
-            facility_name=facility_name or parsed_data.facility_name,
-            notice_date=notice_date
-        )
-
-        # 3. 결과 병합
-        parsed_data.closures = closures
+        if self.combined_prompt and self.max_tokens >= COMBINED_MIN_MAX_TOKENS:
+            parsed_data = self.parse_combined(
+                raw_text=raw_text,
+                facility_name=facility_name,
+                notice_date=notice_date,
+                notice_title=notice_title,
+                source_url=source_url
+            )
+        else:
+            parsed_data = self._parse_concurrently(
+                raw_text=raw_text,
+                facility_name=facility_name,
+                notice_date=notice_date,
+                notice_title=notice_title,
+                source_url=source_url
+            )
 
         logger.info(f"전체 파싱 완료: {parsed_data.facility_name} (스케줄: {len(parsed_data.schedules)}, 휴무일: {len(parsed_data.closures)})")
         return parsed_data
 
+    def parse_combined(self, raw_text: str, facility_name: str = "", notice_date: str = "", notice_title: str = "", source_url: str = "") -> ParsedScheduleData:
+        """
+        통합 프롬프트 한 번으로 스케줄 + 휴무일 추출
+
+        Returns:
+            ParsedScheduleData DTO (closures 포함)
+
+        Raises:
+            ParseError: 파싱 실패 시
+        """
+        if not self.client:
+            raise ParseError("Anthropic 클라이언트가 초기화되지 않았습니다.")
+
+        if not raw_text or len(raw_text.strip()) < 50:
+            raise ParseError("파싱할 텍스트가 너무 짧습니다.")
+
+        prompt = COMBINED_EXTRACTION_PROMPT + raw_text[:8000]
+        prompt += self._schedule_hints(facility_name, notice_date, notice_title)
+        prompt += self._closure_hints("", notice_date)
+
+        try:
+            result = self._request_json(prompt, "combined")
+
+            if not result or not isinstance(result.get("schedule"), dict):
+                raise ParseError("통합 프롬프트 응답에서 스케줄 JSON을 추출할 수 없습니다.")
+
+            parsed_data = self._to_schedule_data(result["schedule"], source_url)
+            parsed_data.closures = self._to_closures(result.get("closure"))
+            return parsed_data
+
+        except ParseError:
+            raise
+        except Exception as e:
+            raise ParseError(f"통합 프롬프트 파싱 실패: {e}", cause=e)
+
+    def _parse_concurrently(self, raw_text: str, facility_name: str, notice_date: str, notice_title: str, source_url: str) -> ParsedScheduleData:
+        """스케줄(현재 스레드)과 휴무일(별도 스레드) 요청을 동시에 실행 후 병합"""
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-closure")
+        try:
+            # 휴무일 시설명 힌트는 크롤링 시설명만 사용 (스케줄 결과를 기다리지 않음)
+            closure_future = executor.submit(
+                self.parse_closures,
+                raw_text=raw_text,
+                facility_name=facility_name,
+                notice_date=notice_date
+            )
+
+            # 1. 자유수영 스케줄 파싱 (ParseError는 호출자에게 전파)
+            parsed_data = self.parse_schedule(
+                raw_text=raw_text,
+                facility_name=facility_name,
+                notice_date=notice_date,
+                notice_title=notice_title,
+                source_url=source_url
+            )
+
+            # 2. 휴무일 결과 대기 (클라이언트는 요청당 timeout으로 max_retries번까지 재시도하므로 전체 시도 시간만큼)
+            closure_wait = self.timeout * (self.max_retries + 1)
+            try:
+                closures = closure_future.result(timeout=closure_wait)
+            except FutureTimeoutError:
+                # 휴무일 없이 저장하면 휴장일에도 운영으로 표시되므로 공지 파싱 실패로 처리
+                raise ParseError(f"휴무일 파싱 시간 초과 ({closure_wait}초)")
+
+            # 3. 결과 병합
+            parsed_data.closures = closures
+            return parsed_data
+        finally:
+            # 스케줄 파싱 실패 시 휴무일 요청 완료를 기다리지 않음
+            executor.shutdown(wait=False)
+
+    def _request_json(self, prompt: str, prompt_type: str) -> Optional[dict]:
+        """
+        LLM 호출 → 응답 JSON (캐시 우선)
+
+        같은 모델/설정/프롬프트의 결과가 캐시에 있으면 API를 호출하지 않는다.
+        JSON 추출에 성공한 응답만 캐시한다.
+
+        Args:
+            prompt: 최종 프롬프트
+            prompt_type: 메트릭 라벨 (schedule/closure/combined)
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = LLMResultCache.make_key(self.model, prompt, self.temperature, self.max_tokens)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"LLM 캐시 적중: {cache_key[:12]}")
+                LLM_CACHE_HITS.labels(prompt_type).inc()
+                return cached
+
+        result = self._extract_json(self._request(prompt, prompt_type))
+
+        if result is not None and cache_key is not None:
+            try:
+                self.cache.set(cache_key, self.model, result)
+            except Exception as e:
+                logger.warning(f"LLM 캐시 저장 실패: {e}")
+
+        return result
+
+    def _request(self, prompt: str, prompt_type: str) -> str:
+        """LLM 호출 (공통 모델/토큰/온도 설정) → 응답 텍스트"""
+        with LLM_REQUEST_DURATION.labels(prompt_type).time():
+            response = self.client.messages.create(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            )
+
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            LLM_TOKENS.labels(prompt_type, "input").inc(usage.input_tokens)
+            LLM_TOKENS.labels(prompt_type, "output").inc(usage.output_tokens)
+
+        return response.content[0].text.strip()
+
+    def _schedule_hints(self, facility_name: str, notice_date: str, notice_title: str) -> str:
+        """자유수영 프롬프트 힌트 (등록일 기반 연도 결정, 제목, 시설명)"""
+        hints = ""
+
+        if notice_date:
+            # 등록일에서 연도와 월 추출
+            date_match = re.search(r'(\d{4})-(\d{2})', notice_date)
+            if date_match:
+                reg_year, reg_month = int(date_match.group(1)), int(date_match.group(2))
+                hints += f"\n\n**★★★ 연도 결정 필수 정보 ★★★**"
+                hints += f"\n- 공지 등록일: {notice_date} (등록 연도: {reg_year}년, 등록 월: {reg_month}월)"
+                hints += f"\n- 문서에 '1월', '2월', '3월' 등 1~3월이 나오고, 등록일이 10~12월이면:"
+                hints += f"\n  → valid_month는 반드시 **{reg_year + 1}년** 으로 설정!"
+                hints += f"\n  예) 등록일 {reg_year}-12-29, 프로그램 '1월' → valid_month = '{reg_year + 1}년 1월'"
+                hints += f"\n- 등록일({notice_date})보다 과거의 valid_month는 절대 불가!"
+            else:
+                hints += f"\n힌트: 이 공지는 '{notice_date}'에 등록되었습니다."
+
+        if notice_title:
+            hints += f"\n\n공지사항 제목: '{notice_title}'"
+
+        if facility_name:
+            hints += f"\n시설명: '{facility_name}'"
+
+        return hints
+
+    def _closure_hints(self, facility_name: str, notice_date: str) -> str:
+        """휴무일 프롬프트 힌트 (등록일 기반 연도 결정, 시설명)"""
+        hints = ""
+
+        if notice_date:
+            # 등록일에서 연도와 월 추출
+            date_match = re.search(r'(\d{4})-(\d{2})', notice_date)
+            if date_match:
+                reg_year, reg_month = int(date_match.group(1)), int(date_match.group(2))
+                hints += f"\n\n**★★★ 연도 결정 필수 정보 ★★★**"
+                hints += f"\n- 공지 등록일: {notice_date} (등록 연도: {reg_year}년, 등록 월: {reg_month}월)"
+                hints += f"\n- 문서에 '1월', '2월', '3월' 등 1~3월이 나오고, 등록일이 10~12월이면:"
+                hints += f"\n  → dates는 반드시 **{reg_year + 1}년** 으로 설정!"
+                hints += f"\n  예) 등록일 {reg_year}-12-29, 휴무일 '2월 1일' → dates = ['**{reg_year + 1}-02-01**']"
+                hints += f"\n- 등록일({notice_date})보다 과거 날짜는 절대 불가!"
+            else:
+                hints += f"\n힌트: 이 공지는 '{notice_date}'에 등록되었습니다."
+
+        if facility_name:
+            hints += f"\n힌트: 시설명은 '{facility_name}'입니다."
+
+        return hints
+
+    def _to_schedule_data(self, result: dict, source_url: str) -> ParsedScheduleData:
+        """스케줄 JSON → ParsedScheduleData (검증 및 자동 수정 포함)"""
+        result["source_url"] = source_url
+        result["closures"] = []  # 자유수영 파싱에서는 closures 제외
+        parsed_data = ParsedScheduleData.from_dict(result)
+        logger.info(f"자유수영 스케줄 파싱 성공: {parsed_data.facility_name}")
+
+        # 검증 및 자동 수정
+        validator = ScheduleValidator()
+        is_valid, warnings, errors = validator.validate(parsed_data)
+
+        if not is_valid:
+            logger.warning(f"파싱 결과 검증 실패: {errors}")
+            parsed_data = validate_and_fix(parsed_data)
+
+            is_valid, warnings, errors = validator.validate(parsed_data)
+            if is_valid:
+                logger.info("자동 수정 후 검증 성공")
+            else:
+                logger.error(f"자동 수정 후에도 검증 실패: {errors}")
+
+        return parsed_data
+
+    def _to_closures(self, result: Optional[dict]) -> list[ClosureData]:
+        """휴무일 JSON → ClosureData 리스트 (없으면 빈 리스트)"""
+        if not result or "closures" not in result:
+            return []
+
+        return [
+            ClosureData(
+                closure_type=c["closure_type"],
+                day_of_week=c.get("day_of_week"),
+                week_pattern=c.get("week_pattern"),
+                dates=c.get("dates"),
+                reason=c.get("reason", "")
+            )
+            for c in result["closures"]
+        ]
+
     def _extract_json(self, text: str) -> Optional[dict]:
         """응답 텍스트에서 JSON 추출"""
         # 먼저 전체 텍스트가 JSON인지 시도
@@ -6,6 +6,9 @@ LLM 파서용 프롬프트 정의
 2. CLOSURE_EXTRACTION_PROMPT: 시설 휴무일 정보 추출 전용
 
 각 프롬프트는 단일 책임을 가지며, 서로의 영역을 침범하지 않습니다.
+
+COMBINED_EXTRACTION_PROMPT는 위 두 프롬프트를 그대로 묶어 한 번의 호출로
+두 결과를 함께 받는 통합 프롬프트입니다. (LLM_COMBINED_PROMPT 설정 시 사용)
 """
 
 CLOSURE_EXTRACTION_PROMPT = """당신은 수영장 공지사항에서 휴무일 정보만을 추출하는 전문가입니다.
@@ -281,3 +284,27 @@ EXTRACTION_PROMPT = """당신은 수영장 자유수영 안내문에서 정보
 
 텍스트:
 """
+
+
+def _strip_text_marker(prompt: str) -> str:
+    """프롬프트 끝의 "텍스트:" 표시 제거 (통합 프롬프트에서 원문은 마지막에 한 번만 붙임)"""
+    return prompt.rstrip().rsplit("텍스트:", 1)[0].rstrip()
+
+
+COMBINED_EXTRACTION_PROMPT = f"""아래 텍스트에 대해 두 가지 작업을 각각 독립적으로 수행하고, 두 결과를 하나의 JSON으로 반환해주세요.
+
+==================== 작업 1: 자유수영 스케줄 ====================
+{_strip_text_marker(EXTRACTION_PROMPT)}
+
+==================== 작업 2: 휴무일 ====================
+{_strip_text_marker(CLOSURE_EXTRACTION_PROMPT)}
+
+==================== 최종 응답 형식 ====================
+두 작업의 응답 JSON을 다음과 같이 묶어서 반환하세요 (JSON만 반환, 다른 텍스트 없이):
+{{
+  "schedule": {{작업 1의 응답 JSON}},
+  "closure": {{작업 2의 응답 JSON}}
+}}
+
+텍스트:
+"""
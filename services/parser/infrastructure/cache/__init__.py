@@ -1,3 +1,16 @@
 from .redis_publisher import CacheInvalidationPublisher
+from .llm_result_cache import LLMResultCache, get_llm_result_cache
+from .http_response_cache import HttpResponseCache, fetch_parsed, get_http_response_cache
+from .download_manifest import DownloadManifest, file_sha256, get_download_manifest
 
-__all__ = ["CacheInvalidationPublisher"]
+__all__ = [
+    "CacheInvalidationPublisher",
+    "LLMResultCache",
+    "get_llm_result_cache",
+    "HttpResponseCache",
+    "fetch_parsed",
+    "get_http_response_cache",
+    "DownloadManifest",
+    "file_sha256",
+    "get_download_manifest",
+]
@@ -0,0 +1,149 @@
+"""
+첨부파일 다운로드 매니페스트 (SQLite, 내용 해시 기반)
+
+- download: 원본 키(URL 또는 기관별 식별자) → sha256, 크기, 저장 경로, 받은 시각
+  이미 받은 파일이 그대로(크기 + sha256 일치) 있으면 다시 요청하지 않는다.
+  다른 공지에 같은 파일이 올라와도(sha256 동일) 디스크에는 한 번만 저장한다.
+- extracted_text: sha256 → HWP/PDF 추출 텍스트
+  같은 내용의 파일은 텍스트 추출을 다시 하지 않는다.
+"""
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from infrastructure.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def file_sha256(path: Path) -> str:
+    """파일 sha256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DownloadManifest:
+    """첨부파일 다운로드 매니페스트 (스레드 안전)"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: SQLite 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS download (
+                   source_key TEXT PRIMARY KEY,
+                   sha256 TEXT NOT NULL,
+                   size INTEGER NOT NULL,
+                   path TEXT NOT NULL,
+                   fetched_at REAL NOT NULL
+               )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_download_sha256 ON download (sha256)")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS extracted_text (
+                   sha256 TEXT PRIMARY KEY,
+                   text TEXT NOT NULL,
+                   extracted_at REAL NOT NULL
+               )"""
+        )
+
+    def lookup(self, source_key: str) -> Optional[Path]:
+        """
+        이미 받은 파일 조회
+
+        저장 경로의 파일이 기록된 크기/sha256과 일치할 때만 반환한다.
+        (삭제/변조된 파일은 기록을 지우고 None → 다시 다운로드)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256, size, path FROM download WHERE source_key = ?", (source_key,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        sha256, size, path = row[0], row[1], Path(row[2])
+        if path.is_file() and path.stat().st_size == size and file_sha256(path) == sha256:
+            return path
+
+        logger.info(f"매니페스트 파일 불일치, 다시 다운로드: {path.name}")
+        with self._lock:
+            self._conn.execute("DELETE FROM download WHERE source_key = ?", (source_key,))
+        return None
+
+    def record(self, source_key: str, path: Path, sha256: str, size: int) -> Path:
+        """
+        다운로드 결과 기록
+
+        같은 내용(sha256)의 파일이 이미 다른 경로에 있으면 방금 받은 파일을 지우고 기존 파일을 가리킨다.
+
+        Returns:
+            최종 파일 경로
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, size FROM download WHERE sha256 = ? AND path != ?", (sha256, str(path))
+            ).fetchall()
+            for other_path, other_size in rows:
+                existing = Path(other_path)
+                if existing.is_file() and existing.stat().st_size == other_size:
+                    path.unlink(missing_ok=True)
+                    logger.info(f"동일 첨부파일 재사용: {path.name} → {existing.name}")
+                    path = existing
+                    break
+
+            self._conn.execute(
+                """INSERT OR REPLACE INTO download (source_key, sha256, size, path, fetched_at)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (source_key, sha256, size, str(path), time.time())
+            )
+        return path
+
+    def get_text(self, sha256: str) -> Optional[str]:
+        """내용 해시로 추출 텍스트 조회"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text FROM extracted_text WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_text(self, sha256: str, text: str) -> None:
+        """추출 텍스트 저장"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO extracted_text (sha256, text, extracted_at) VALUES (?, ?, ?)",
+                (sha256, text, time.time())
+            )
+
+
+_manifest: Optional[DownloadManifest] = None
+_manifest_lock = threading.Lock()
+
+
+def get_download_manifest() -> Optional[DownloadManifest]:
+    """프로세스 전역 다운로드 매니페스트 (DOWNLOAD_MANIFEST_ENABLED=false면 None)"""
+    global _manifest
+    if not settings.DOWNLOAD_MANIFEST_ENABLED:
+        return None
+    if _manifest is None:
+        with _manifest_lock:
+            if _manifest is None:
+                try:
+                    _manifest = DownloadManifest(settings.DOWNLOAD_MANIFEST_PATH)
+                except sqlite3.Error as e:
+                    logger.warning(f"다운로드 매니페스트 초기화 실패, 매니페스트 없이 진행: {e}")
+                    return None
+    return _manifest
@@ -0,0 +1,191 @@
+"""
+크롤러 HTTP 응답 캐시 (조건부 요청 + 본문 해시)
+
+URL(+쿼리)별로 ETag / Last-Modified / 본문 sha256 / 파싱 결과를 저장한다.
+- 다음 요청에 If-None-Match / If-Modified-Since를 붙여 304면 저장된 파싱 결과를 그대로 반환
+- 서버가 검증자를 주지 않아 200이 와도 본문 해시가 같으면 BeautifulSoup 파싱을 건너뜀
+
+시설 이용안내 페이지와 공지 목록 페이지는 대부분 매일 같은 내용이므로
+변경 없는 페이지는 304 한 번, 파싱 0회로 끝난다.
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import requests
+
+from infrastructure.config import settings
+from infrastructure.metrics.registry import HTTP_CACHE_RESULTS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """저장된 응답 검증자 + 파싱 결과"""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body_hash: str
+    parsed: Any
+
+
+class HttpResponseCache:
+    """SQLite 기반 HTTP 응답 캐시 (스레드 안전)"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: SQLite 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS http_response (
+                   cache_key TEXT PRIMARY KEY,
+                   url TEXT NOT NULL,
+                   etag TEXT,
+                   last_modified TEXT,
+                   body_hash TEXT NOT NULL,
+                   parsed TEXT NOT NULL,
+                   updated_at REAL NOT NULL
+               )"""
+        )
+
+    @staticmethod
+    def make_key(url: str, params: Optional[dict] = None) -> str:
+        """URL + 쿼리 파라미터 → 캐시 키"""
+        if not params:
+            return url
+        query = json.dumps(params, ensure_ascii=False, sort_keys=True, default=str)
+        return f"{url}?{query}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """캐시 조회 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body_hash, parsed FROM http_response WHERE cache_key = ?",
+                (key,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        try:
+            parsed = json.loads(row[3])
+        except json.JSONDecodeError:
+            logger.warning(f"HTTP 캐시 값 손상, 무시: {key}")
+            return None
+        return CachedResponse(etag=row[0], last_modified=row[1], body_hash=row[2], parsed=parsed)
+
+    def set(self, key: str, url: str, etag: Optional[str], last_modified: Optional[str],
+            body_hash: str, parsed: Any) -> None:
+        """검증자 + 파싱 결과 저장"""
+        payload = json.dumps(parsed, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO http_response
+                   (cache_key, url, etag, last_modified, body_hash, parsed, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (key, url, etag, last_modified, body_hash, payload, time.time())
+            )
+
+    def purge(self) -> int:
+        """전체 삭제 → 삭제된 항목 수"""
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM http_response").rowcount
+            self._conn.execute("VACUUM")
+
+        logger.info(f"HTTP 캐시 삭제: {deleted}건")
+        return deleted
+
+
+_cache: Optional[HttpResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_http_response_cache() -> Optional[HttpResponseCache]:
+    """프로세스 전역 HTTP 응답 캐시 (HTTP_CACHE_ENABLED=false면 None)"""
+    global _cache
+    if not settings.HTTP_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = HttpResponseCache(settings.HTTP_CACHE_PATH)
+                except sqlite3.Error as e:
+                    logger.warning(f"HTTP 캐시 초기화 실패, 캐시 없이 진행: {e}")
+                    return None
+    return _cache
+
+
+def fetch_parsed(session: requests.Session, url: str, parse: Callable[[str], Any],
+                 encode: Callable[[Any], Any], decode: Callable[[Any], Any],
+                 params: Optional[dict] = None, timeout: int = 10) -> Any:
+    """
+    조건부 GET + 파싱 (변경 없는 페이지는 저장된 파싱 결과 반환)
+
+    Args:
+        session: HTTP 세션
+        url: 요청 URL
+        parse: HTML 본문 → 결과 (BeautifulSoup 파싱)
+        encode: 결과 → JSON 저장 형태
+        decode: JSON 저장 형태 → 결과
+        params: 쿼리 파라미터
+        timeout: 요청 타임아웃 (초)
+
+    Returns:
+        parse 결과 (None/빈 결과는 캐시하지 않음)
+
+    Raises:
+        requests.RequestException: 요청 실패
+    """
+    cache = get_http_response_cache()
+    if cache is None:
+        response = session.get(url, params=params, timeout=timeout)
+        response.raise_for_status()
+        return parse(response.text)
+
+    key = cache.make_key(url, params)
+    cached = cache.get(key)
+
+    headers = {}
+    if cached and cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached and cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+
+    response = session.get(url, params=params, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and cached:
+        logger.debug(f"변경 없음 (304): {key}")
+        HTTP_CACHE_RESULTS.labels("not_modified").inc()
+        return decode(cached.parsed)
+
+    response.raise_for_status()
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    body_hash = hashlib.sha256(response.content).hexdigest()
+
+    if cached and cached.body_hash == body_hash:
+        logger.debug(f"본문 해시 동일, 파싱 생략: {key}")
+        HTTP_CACHE_RESULTS.labels("unchanged").inc()
+        if (etag, last_modified) != (cached.etag, cached.last_modified):
+            cache.set(key, url, etag, last_modified, body_hash, cached.parsed)
+        return decode(cached.parsed)
+
+    HTTP_CACHE_RESULTS.labels("changed").inc()
+    result = parse(response.text)
+    if result:
+        cache.set(key, url, etag, last_modified, body_hash, encode(result))
+    return result
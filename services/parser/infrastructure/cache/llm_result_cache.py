@@ -0,0 +1,169 @@
+"""
+LLM 파싱 결과 캐시 (SQLite, 내용 주소 기반)
+
+키: sha256(모델 + 온도 + 최대 토큰 + 최종 프롬프트)
+- 최종 프롬프트에는 프롬프트 템플릿, raw_text, 힌트(시설명/등록일/제목)가 모두 포함되므로
+  템플릿을 고치거나 원문이 바뀌면 자동으로 다른 키가 된다.
+값: LLM 응답에서 추출한 JSON (추출 성공한 응답만 저장)
+
+같은 첨부파일 재처리(skip_existing=False, DB 초기화, 여러 게시판 중복 게시) 시
+Anthropic 호출 없이 즉시 결과를 반환한다.
+용량이 LLM_CACHE_MAX_BYTES를 넘으면 가장 오래 사용하지 않은 항목부터 삭제한다.
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from infrastructure.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 용량 초과 시 이 비율까지 줄여 매 저장마다 eviction이 반복되지 않게 함
+_EVICT_TARGET_RATIO = 0.9
+
+
+class LLMResultCache:
+    """SQLite 기반 LLM 결과 캐시 (스레드 안전)"""
+
+    def __init__(self, path: Path, max_bytes: int):
+        """
+        Args:
+            path: SQLite 파일 경로
+            max_bytes: 저장 값 총 크기 상한 (bytes)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS llm_result (
+                   cache_key TEXT PRIMARY KEY,
+                   model TEXT NOT NULL,
+                   value TEXT NOT NULL,
+                   size INTEGER NOT NULL,
+                   created_at REAL NOT NULL,
+                   accessed_at REAL NOT NULL
+               )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_result_accessed ON llm_result (accessed_at)")
+
+    @staticmethod
+    def make_key(model: str, prompt: str, temperature: float, max_tokens: int) -> str:
+        """요청 내용 → 캐시 키"""
+        digest = hashlib.sha256()
+        for part in (model, str(temperature), str(max_tokens), prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """캐시 조회 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM llm_result WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE llm_result SET accessed_at = ? WHERE cache_key = ?", (time.time(), key)
+            )
+
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            logger.warning(f"LLM 캐시 값 손상, 무시: {key[:12]}")
+            return None
+
+    def set(self, key: str, model: str, value: dict) -> None:
+        """결과 저장 후 용량 초과분 정리"""
+        payload = json.dumps(value, ensure_ascii=False)
+        size = len(payload.encode("utf-8"))
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO llm_result
+                   (cache_key, model, value, size, created_at, accessed_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (key, model, payload, size, now, now)
+            )
+            self._evict()
+
+    def purge(self, older_than_days: Optional[int] = None) -> int:
+        """
+        캐시 삭제
+
+        Args:
+            older_than_days: 지정 시 마지막 사용이 N일 이전인 항목만 삭제 (None이면 전체)
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            if older_than_days is None:
+                deleted = self._conn.execute("DELETE FROM llm_result").rowcount
+            else:
+                cutoff = time.time() - older_than_days * 86400
+                deleted = self._conn.execute(
+                    "DELETE FROM llm_result WHERE accessed_at < ?", (cutoff,)
+                ).rowcount
+            self._conn.execute("VACUUM")
+
+        logger.info(f"LLM 캐시 삭제: {deleted}건")
+        return deleted
+
+    def stats(self) -> dict:
+        """항목 수 / 총 크기"""
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_result"
+            ).fetchone()
+        return {"entries": count, "bytes": total, "max_bytes": self.max_bytes}
+
+    def _evict(self) -> None:
+        """용량 상한 초과 시 LRU 순으로 삭제 (lock 안에서 호출)"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_result").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * _EVICT_TARGET_RATIO)
+        removed = 0
+        rows = self._conn.execute("SELECT cache_key, size FROM llm_result ORDER BY accessed_at").fetchall()
+        victims = []
+        for cache_key, size in rows:
+            if total <= target:
+                break
+            victims.append((cache_key,))
+            total -= size
+            removed += 1
+
+        self._conn.executemany("DELETE FROM llm_result WHERE cache_key = ?", victims)
+        logger.info(f"LLM 캐시 용량 초과, {removed}건 삭제")
+
+
+_cache: Optional[LLMResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_result_cache() -> Optional[LLMResultCache]:
+    """프로세스 전역 LLM 결과 캐시 (LLM_CACHE_ENABLED=false면 None)"""
+    global _cache
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = LLMResultCache(settings.LLM_CACHE_PATH, settings.LLM_CACHE_MAX_BYTES)
+                except sqlite3.Error as e:
+                    logger.warning(f"LLM 캐시 초기화 실패, 캐시 없이 진행: {e}")
+                    return None
+    return _cache
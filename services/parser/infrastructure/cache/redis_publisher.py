@@ -38,7 +38,7 @@ class CacheInvalidationPublisher:
             self._enabled = False
             self._client = None
 
-    def publish_schedule_saved(self, facility_name: str, valid_month: str) -> bool:
+    def publish_schedule_saved(self, facility_name: str, valid_month: str, fees_changed: bool = True) -> bool:
         if not self._enabled:
             return False
 
@@ -47,6 +47,7 @@ class CacheInvalidationPublisher:
                 "event": "schedule_saved",
                 "facility_name": facility_name,
                 "valid_month": valid_month,
+                "fees_changed": fees_changed,
                 "timestamp": datetime.now().isoformat(),
             }, ensure_ascii=False)
             self._client.publish(CHANNEL, message)
@@ -56,6 +57,24 @@ class CacheInvalidationPublisher:
             logger.warning(f"캐시 무효화 이벤트 발행 실패: {e}")
             return False
 
+    def publish_batch_complete(self, new_saved: int) -> bool:
+        """배치 완료 알림 (API가 무효화 후 주요 캐시를 워밍)"""
+        if not self._enabled:
+            return False
+
+        try:
+            message = json.dumps({
+                "event": "batch_complete",
+                "new_saved": new_saved,
+                "timestamp": datetime.now().isoformat(),
+            }, ensure_ascii=False)
+            self._client.publish(CHANNEL, message)
+            logger.info(f"배치 완료 이벤트 발행: 신규 저장 {new_saved}건")
+            return True
+        except redis.RedisError as e:
+            logger.warning(f"배치 완료 이벤트 발행 실패: {e}")
+            return False
+
     def close(self):
         if self._client:
             self._client.close()
@@ -44,6 +44,14 @@ class Settings(BaseSettings):
     LLM_MODEL: str = "claude-sonnet-4-6"
     LLM_MAX_TOKENS: int = 4000
     LLM_TEMPERATURE: float = 0.0
+    LLM_TIMEOUT: float = 120.0  # 요청당 타임아웃 (초)
+    LLM_MAX_RETRIES: int = 2  # 429/5xx/연결 오류 재시도 횟수
+    LLM_COMBINED_PROMPT: bool = False  # 스케줄 + 휴무일 통합 프롬프트 (LLM_MAX_TOKENS >= 6000일 때만 적용)
+
+    # LLM 결과 캐시 (프롬프트 해시 기반, 재처리 시 API 호출 생략)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_PATH: Path = STORAGE_DIR / "llm_cache.sqlite3"
+    LLM_CACHE_MAX_BYTES: int = 104_857_600  # 100MB
 
     # ===================================================================
     # Database 설정
@@ -72,7 +80,18 @@ class Settings(BaseSettings):
     # 크롤링 제한
     CRAWL_MAX_PAGES: int = 5
     CRAWL_MAX_FILES: int = 10
-    CRAWL_DELAY_SECONDS: float = 0.5  # Rate limiting
+    CRAWL_DELAY_SECONDS: float = 0.5  # Rate limiting (호스트별 요청 간격, 토큰 버킷 충전 주기)
+    CRAWL_BURST: int = 2  # 호스트별 순간 허용 요청 수
+    CRAWL_CONCURRENCY: int = 4  # 시설/상세 페이지 동시 요청 수
+    CRAWL_INCREMENTAL: bool = True  # 게시판별 high-water mark에 도달하면 페이지네이션 중단
+
+    # 조건부 요청 캐시 (ETag/Last-Modified + 본문 해시, 변경 없는 페이지는 파싱 생략)
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_PATH: Path = STORAGE_DIR / "http_cache.sqlite3"
+
+    # 첨부파일 다운로드 매니페스트 (이미 받은 파일 생략, 같은 내용은 한 번만 저장, 추출 텍스트 재사용)
+    DOWNLOAD_MANIFEST_ENABLED: bool = True
+    DOWNLOAD_MANIFEST_PATH: Path = STORAGE_DIR / "download_manifest.sqlite3"
 
     # HTTP 타임아웃
     HTTP_TIMEOUT: int = 30
@@ -93,6 +112,10 @@ class Settings(BaseSettings):
     LOKI_URL: str = "http://localhost:3100/loki/api/v1/push"
     LOKI_TAGS: dict = {"application": "swim-scheduler-parser", "env": "local"}
 
+    # Prometheus 메트릭 (스케줄러 프로세스가 :METRICS_PORT/metrics 노출)
+    METRICS_ENABLED: bool = True
+    METRICS_PORT: int = 8001
+
     # ===================================================================
     # Redis 설정 (캐시 무효화 Pub/Sub)
     # ===================================================================
@@ -121,6 +144,9 @@ class Settings(BaseSettings):
     MAX_FILE_SIZE_MB: int = 10
     SUPPORTED_FILE_EXTENSIONS: list[str] = ["hwp", "pdf", "xlsx"]
 
+    # 동시 파싱 (공지 단위 다운로드/추출/LLM 호출 병렬 처리, 1이면 순차)
+    PARSE_CONCURRENCY: int = 4
+
     # ===================================================================
     # Pydantic Settings 설정
     # ===================================================================
@@ -7,15 +7,16 @@ Parser 서비스 DI Container
 """
 from infrastructure.config import settings
 from infrastructure.notification import NotificationService
-from infrastructure.cache import CacheInvalidationPublisher
+from infrastructure.cache import CacheInvalidationPublisher, LLMResultCache, get_llm_result_cache
 from infrastructure.database.repository import SwimRepository
 from application.storage_service import StorageService
+from core.crawler.base.watermark import CrawlWatermarks
 from application.swim_crawler_service import SwimCrawlerService
 from application.fallback_service import FallbackService
 from application.event_handlers import (
-    DiscordEventHandler, CacheEventHandler, ClosureDetectionHandler,
+    DiscordEventHandler, CacheEventHandler, CalendarSnapshotHandler, ClosureDetectionHandler,
 )
-from core.events import EventBus, ScheduleSaved, PoolClosureDetected
+from core.events import EventBus, ScheduleSaved, BatchCompleted, PoolClosureDetected
 
 
 class Container:
@@ -25,9 +26,11 @@ class Container:
         self._notification_service: NotificationService | None = None
         self._cache_publisher: CacheInvalidationPublisher | None = None
         self._storage_service: StorageService | None = None
+        self._crawl_watermarks: CrawlWatermarks | None = None
         self._event_bus: EventBus | None = None
         self._discord_event_handler: DiscordEventHandler | None = None
         self._cache_event_handler: CacheEventHandler | None = None
+        self._calendar_snapshot_handler: CalendarSnapshotHandler | None = None
         self._closure_detection_handler: ClosureDetectionHandler | None = None
 
     # -- Infrastructure (Singleton) --
@@ -42,6 +45,9 @@ class Container:
             self._cache_publisher = CacheInvalidationPublisher()
         return self._cache_publisher
 
+    def llm_result_cache(self) -> LLMResultCache | None:
+        return get_llm_result_cache()
+
     # -- Storage (Singleton) --
 
     def storage_service(self) -> StorageService:
@@ -49,6 +55,11 @@ class Container:
             self._storage_service = StorageService(storage_dir=settings.STORAGE_DIR)
         return self._storage_service
 
+    def crawl_watermarks(self) -> CrawlWatermarks:
+        if self._crawl_watermarks is None:
+            self._crawl_watermarks = CrawlWatermarks(self.storage_service().load_crawl_watermarks())
+        return self._crawl_watermarks
+
     # -- Repository (Factory) --
 
     def swim_repository(self) -> SwimRepository:
@@ -57,7 +68,8 @@ class Container:
     # -- Application Services (Factory) --
 
     def swim_crawler_service(self) -> SwimCrawlerService:
-        return SwimCrawlerService(storage=self.storage_service())
+        watermarks = self.crawl_watermarks() if settings.CRAWL_INCREMENTAL else None
+        return SwimCrawlerService(storage=self.storage_service(), watermarks=watermarks)
 
     def fallback_service(self) -> FallbackService:
         return FallbackService(storage=self.storage_service())
@@ -79,6 +91,11 @@ class Container:
             self._cache_event_handler = CacheEventHandler(self.cache_publisher())
         return self._cache_event_handler
 
+    def calendar_snapshot_handler(self) -> CalendarSnapshotHandler:
+        if self._calendar_snapshot_handler is None:
+            self._calendar_snapshot_handler = CalendarSnapshotHandler(self.swim_repository)
+        return self._calendar_snapshot_handler
+
     def closure_detection_handler(self) -> ClosureDetectionHandler:
         if self._closure_detection_handler is None:
             self._closure_detection_handler = ClosureDetectionHandler(self.event_bus())
@@ -88,8 +105,10 @@ class Container:
         """이벤트 핸들러를 EventBus에 구독 등록. 최초 1회 호출."""
         bus = self.event_bus()
         bus.subscribe(ScheduleSaved, self.discord_event_handler().on_schedule_saved)
+        bus.subscribe(ScheduleSaved, self.calendar_snapshot_handler().on_schedule_saved)
         bus.subscribe(ScheduleSaved, self.cache_event_handler().on_schedule_saved)
         bus.subscribe(ScheduleSaved, self.closure_detection_handler().on_schedule_saved)
+        bus.subscribe(BatchCompleted, self.cache_event_handler().on_batch_completed)
         bus.subscribe(PoolClosureDetected, self.discord_event_handler().on_pool_closure)
 
 
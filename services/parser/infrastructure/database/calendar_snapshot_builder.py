@@ -0,0 +1,173 @@
+"""
+달력 응답 스냅샷 빌더
+
+valid_month 단위로 /api/schedules/calendar 응답 JSON을 미리 렌더링하여
+calendar_snapshot 테이블에 저장한다. API는 ORM 조회 없이 이 blob을 그대로 반환한다.
+"""
+import json
+import logging
+from collections import defaultdict
+
+from infrastructure.database.daily_schedule_builder import format_time
+from infrastructure.utils.closure_utils import (
+    build_closure_info,
+    get_season_from_month,
+    should_include_schedule,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CalendarSnapshotBuilder:
+    """calendar_snapshot 테이블 갱신 (커밋은 호출자 책임)"""
+
+    def render(self, cursor, valid_month: str) -> dict:
+        """
+        월간 달력 응답 생성 (API ScheduleService.get_calendar_data와 동일한 구조)
+
+        Args:
+            cursor: DB 커서
+            valid_month: 적용 월 (YYYY-MM)
+
+        Returns:
+            {"year", "month", "season", "schedules"} 딕셔너리
+        """
+        year, month = (int(v) for v in valid_month.split("-"))
+        season = get_season_from_month(month)
+
+        cursor.execute(
+            """SELECT s.id, s.facility_id, f.name, s.day_type, s.season
+               FROM swim_schedule s
+               JOIN facility f ON f.id = s.facility_id
+               WHERE s.valid_month = %s
+               ORDER BY f.name, s.day_type, s.id""",
+            (valid_month,)
+        )
+        schedules = [
+            row for row in cursor.fetchall()
+            if should_include_schedule(row[4], season)
+        ]
+
+        sessions_map = self._load_sessions(cursor, [row[0] for row in schedules])
+        closures_map = self._load_closures(cursor, {row[1] for row in schedules}, valid_month)
+
+        # 데이터 그룹핑 (facility 기준, 월은 고정)
+        facilities = {}
+        for schedule_id, facility_id, facility_name, day_type, schedule_season in schedules:
+            if facility_id not in facilities:
+                facilities[facility_id] = {
+                    "facility_id": facility_id,
+                    "facility_name": facility_name,
+                    "valid_month": valid_month,
+                    "schedules": {},
+                    "closure_info": build_closure_info(closures_map.get(facility_id, [])),
+                }
+
+            schedule_key = f"{day_type}_{schedule_season or ''}"
+            grouped = facilities[facility_id]["schedules"].setdefault(schedule_key, {
+                "day_type": day_type,
+                "season": schedule_season or "",
+                "sessions": [],
+            })
+            grouped["sessions"].extend(sessions_map.get(schedule_id, []))
+
+        result = []
+        for data in facilities.values():
+            item = {
+                "facility_id": data["facility_id"],
+                "facility_name": data["facility_name"],
+                "valid_month": data["valid_month"],
+                "schedules": list(data["schedules"].values()),
+            }
+            if data["closure_info"]:
+                item["closure_info"] = data["closure_info"]
+            result.append(item)
+
+        return {
+            "year": year,
+            "month": month,
+            "season": season,
+            "schedules": result,
+        }
+
+    def refresh(self, cursor, valid_month: str) -> bool:
+        """
+        월간 달력 스냅샷 재생성 (UPSERT)
+
+        Returns:
+            저장 여부 (월 형식이 잘못된 경우 False)
+        """
+        try:
+            payload = self.render(cursor, valid_month)
+        except (ValueError, AttributeError):
+            logger.warning(f"달력 스냅샷 생성 건너뜀 (잘못된 월 형식): {valid_month}")
+            return False
+
+        cursor.execute(
+            """INSERT INTO calendar_snapshot (valid_month, payload)
+               VALUES (%s, %s)
+               ON DUPLICATE KEY UPDATE payload = VALUES(payload), updated_at = CURRENT_TIMESTAMP""",
+            (valid_month, json.dumps(payload, ensure_ascii=False))
+        )
+        logger.debug(f"달력 스냅샷 갱신: {valid_month} ({len(payload['schedules'])}개 시설)")
+        return True
+
+    def rebuild_all(self, cursor) -> int:
+        """
+        DB에 있는 모든 월의 달력 스냅샷 재생성 (초기 적재/백필용)
+
+        Returns:
+            갱신된 월 수
+        """
+        cursor.execute("SELECT DISTINCT valid_month FROM swim_schedule")
+        months = [row[0] for row in cursor.fetchall()]
+        count = sum(1 for valid_month in months if self.refresh(cursor, valid_month))
+
+        logger.info(f"달력 스냅샷 전체 재생성: {count}개 월")
+        return count
+
+    def _load_sessions(self, cursor, schedule_ids: list) -> dict:
+        grouped = defaultdict(list)
+        if not schedule_ids:
+            return grouped
+
+        placeholders = ", ".join(["%s"] * len(schedule_ids))
+        cursor.execute(
+            f"""SELECT schedule_id, session_name, start_time, end_time, capacity, lanes, applicable_days
+                FROM swim_session WHERE schedule_id IN ({placeholders})
+                ORDER BY id""",
+            tuple(schedule_ids)
+        )
+        for row in cursor.fetchall():
+            grouped[row[0]].append({
+                "session_name": row[1],
+                "start_time": format_time(row[2]),
+                "end_time": format_time(row[3]),
+                "capacity": row[4],
+                "lanes": row[5],
+                "applicable_days": row[6],
+            })
+        return grouped
+
+    def _load_closures(self, cursor, facility_ids: set, valid_month: str) -> dict:
+        grouped = defaultdict(list)
+        if not facility_ids:
+            return grouped
+
+        placeholders = ", ".join(["%s"] * len(facility_ids))
+        cursor.execute(
+            f"""SELECT facility_id, closure_type, day_of_week, week_pattern, closure_date, reason
+                FROM facility_closure
+                WHERE valid_month = %s AND facility_id IN ({placeholders})
+                ORDER BY id""",
+            (valid_month, *facility_ids)
+        )
+        for row in cursor.fetchall():
+            grouped[row[0]].append({
+                "closure_type": row[1],
+                "day_of_week": row[2],
+                "week_pattern": row[3],
+                "closure_date": row[4],
+                "reason": row[5],
+            })
+        return grouped
@@ -1,8 +1,15 @@
 """
 MariaDB 연결 관리
+
+프로세스 전역 커넥션 풀을 두고 get_connection()은 풀에서 연결을 빌려준다.
+빌린 연결의 close()는 실제로 끊지 않고 풀에 반납한다.
+(save_to_db, 폴백 저장, 기존 URL 조회 등 단계마다 TCP+인증 핸드셰이크를 반복하지 않음)
 """
-import logging
+import atexit
+import queue
+import threading
 from contextlib import contextmanager
+from typing import Optional
 
 from infrastructure.config import settings
 from infrastructure.config.logging_config import get_logger
@@ -20,8 +27,8 @@ DB_CONFIG = {
 }
 
 
-def get_connection():
-    """MariaDB 연결 반환"""
+def _create_raw_connection():
+    """풀을 거치지 않는 새 MariaDB 연결"""
     try:
         import pymysql
         conn = pymysql.connect(**DB_CONFIG)
@@ -35,6 +42,152 @@ def get_connection():
         raise
 
 
+class PooledConnection:
+    """풀에서 빌린 연결 래퍼 (close() 시 풀에 반납, 나머지는 원본 연결에 위임)"""
+
+    def __init__(self, pool: "ConnectionPool", raw):
+        self._pool = pool
+        self._raw = raw
+        self._released = False
+
+    @property
+    def open(self) -> bool:
+        return not self._released and self._raw.open
+
+    def close(self):
+        if not self._released:
+            self._released = True
+            self._pool.release(self._raw)
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+
+class ConnectionPool:
+    """크기 제한 + 헬스체크 커넥션 풀 (스레드 안전)"""
+
+    def __init__(self, size: int, max_overflow: int, timeout: int):
+        self._size = size
+        self._max_connections = size + max_overflow
+        self._timeout = timeout
+        self._idle: "queue.LifoQueue" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._total = 0
+
+    def acquire(self) -> PooledConnection:
+        """
+        연결 대여
+
+        유휴 연결은 ping으로 상태를 확인하고, 끊어졌으면 새로 연결한다.
+        최대 연결 수에 도달하면 timeout 동안 반납을 기다린다.
+        """
+        raw = self._take_idle()
+        if raw is None:
+            with self._lock:
+                can_create = self._total < self._max_connections
+                if can_create:
+                    self._total += 1
+            if can_create:
+                try:
+                    raw = _create_raw_connection()
+                except Exception:
+                    with self._lock:
+                        self._total -= 1
+                    raise
+            else:
+                try:
+                    raw = self._idle.get(timeout=self._timeout)
+                except queue.Empty:
+                    raise TimeoutError(f"DB 커넥션 풀 대기 시간 초과 ({self._timeout}초)")
+                raw = self._ensure_alive(raw)
+
+        return PooledConnection(self, raw)
+
+    def release(self, raw) -> None:
+        """연결 반납 (미완료 트랜잭션은 롤백, 풀 크기 초과분은 종료)"""
+        try:
+            if raw.open:
+                raw.rollback()
+        except Exception as e:
+            logger.debug(f"반납 연결 롤백 실패, 폐기: {e}")
+            self._discard(raw)
+            return
+
+        if not raw.open or self._idle.qsize() >= self._size:
+            self._discard(raw)
+            return
+        self._idle.put(raw)
+
+    def close_all(self) -> None:
+        """유휴 연결 모두 종료"""
+        while True:
+            try:
+                raw = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(raw)
+
+    def _take_idle(self):
+        while True:
+            try:
+                raw = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            try:
+                return self._ensure_alive(raw)
+            except Exception:
+                continue
+
+    def _ensure_alive(self, raw):
+        """헬스체크 (실패 시 폐기 후 새 연결로 교체)"""
+        try:
+            raw.ping(reconnect=False)
+            return raw
+        except Exception as e:
+            logger.debug(f"유휴 연결 헬스체크 실패, 재연결: {e}")
+            self._discard(raw)
+            with self._lock:
+                self._total += 1
+            try:
+                return _create_raw_connection()
+            except Exception:
+                with self._lock:
+                    self._total -= 1
+                raise
+
+    def _discard(self, raw) -> None:
+        try:
+            raw.close()
+        except Exception:
+            pass
+        with self._lock:
+            self._total -= 1
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """프로세스 전역 커넥션 풀 (lazy 생성)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    size=settings.DB_POOL_SIZE,
+                    max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+                    timeout=settings.DB_POOL_TIMEOUT,
+                )
+                atexit.register(_pool.close_all)
+    return _pool
+
+
+def get_connection():
+    """MariaDB 연결 반환 (풀에서 대여, close() 시 반납)"""
+    return get_pool().acquire()
+
+
 @contextmanager
 def get_cursor():
     """커서 컨텍스트 매니저"""
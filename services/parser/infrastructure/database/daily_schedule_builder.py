@@ -0,0 +1,227 @@
+"""
+일별 스케줄 Materialized 테이블 빌더
+
+시설 + 월 단위로 swim_schedule/swim_session/facility_closure/notice/fee를 읽어
+해당 월의 모든 날짜를 daily_schedule 테이블에 미리 펼쳐 저장한다.
+API의 /api/schedules/daily는 이 테이블을 (date) 인덱스로 바로 조회한다.
+갱신한 (시설, 월)은 daily_schedule_month에 기록해 API가 생성 완료 여부를 판단한다.
+"""
+import calendar
+import json
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+from infrastructure.utils.closure_utils import (
+    check_facility_closure,
+    get_day_type,
+    get_season_from_month,
+    should_include_schedule,
+    should_include_session,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def format_time(value) -> str:
+    """TIME 컬럼 값을 API 응답과 같은 HH:MM:SS 문자열로 변환 (pymysql은 timedelta 반환)"""
+    if isinstance(value, timedelta):
+        total = int(value.total_seconds())
+        return f"{total // 3600:02d}:{total % 3600 // 60:02d}:{total % 60:02d}"
+    if isinstance(value, (time, datetime)):
+        return value.strftime("%H:%M:%S")
+    return str(value)
+
+
+class DailyScheduleBuilder:
+    """daily_schedule 테이블 갱신 (호출자의 트랜잭션 안에서 실행)"""
+
+    def refresh(self, cursor, facility_id: int, valid_month: str) -> int:
+        """
+        시설 + 월의 일별 스케줄 재계산
+
+        Args:
+            cursor: DB 커서 (커밋은 호출자 책임)
+            facility_id: 시설 ID
+            valid_month: 적용 월 (YYYY-MM)
+
+        Returns:
+            저장된 일별 레코드 수
+        """
+        try:
+            year, month = (int(v) for v in valid_month.split("-"))
+        except (ValueError, AttributeError):
+            logger.warning(f"일별 스케줄 생성 건너뜀 (잘못된 월 형식): {valid_month}")
+            return 0
+
+        schedules = self._load_schedules(cursor, facility_id, valid_month)
+        closures = self._load_closures(cursor, facility_id, valid_month)
+        notice = self._load_notice(cursor, facility_id, valid_month)
+        fees = self._load_fees(cursor, facility_id)
+
+        season = get_season_from_month(month)
+        rows = []
+
+        for day in range(1, calendar.monthrange(year, month)[1] + 1):
+            target_date = date(year, month, day)
+            day_type = get_day_type(target_date)
+
+            matching = [
+                s for s in schedules
+                if s["day_type"] == day_type and should_include_schedule(s["season"], season)
+            ]
+
+            if matching:
+                is_closed, closure_reason = check_facility_closure(closures, target_date)
+                sessions = [] if is_closed else [
+                    {
+                        "session_name": session["session_name"],
+                        "start_time": session["start_time"],
+                        "end_time": session["end_time"],
+                        "capacity": session["capacity"],
+                        "lanes": session["lanes"],
+                    }
+                    for schedule in matching
+                    for session in schedule["sessions"]
+                    if should_include_session(session["applicable_days"], target_date.weekday())
+                ]
+                schedule_season = matching[0]["season"] or ""
+            elif not schedules and notice and closures:
+                # 스케줄 없이 공지 + 휴무 정보만 있는 시설 → 전체 휴장
+                is_closed, closure_reason = True, closures[0]["reason"]
+                sessions = []
+                schedule_season = ""
+            else:
+                continue
+
+            rows.append((
+                target_date, facility_id, valid_month, day_type, schedule_season,
+                is_closed, closure_reason,
+                json.dumps(sessions, ensure_ascii=False),
+                json.dumps(fees, ensure_ascii=False),
+                notice["source_url"] if notice else None,
+                notice["title"] if notice else None,
+                notice["crawled_at"] if notice else None,
+            ))
+
+        cursor.execute(
+            "DELETE FROM daily_schedule WHERE facility_id = %s AND valid_month = %s",
+            (facility_id, valid_month)
+        )
+        if rows:
+            cursor.executemany(
+                """INSERT INTO daily_schedule
+                   (date, facility_id, valid_month, day_type, season, is_closed, closure_reason,
+                    sessions, fees, source_url, notice_title, crawled_at)
+                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""",
+                rows
+            )
+
+        # 생성 기록 (스케줄이 있어도 계절이 맞지 않아 0일인 시설도 "생성 완료"로 표시)
+        cursor.execute(
+            """INSERT INTO daily_schedule_month (facility_id, valid_month, day_count)
+               VALUES (%s, %s, %s)
+               ON DUPLICATE KEY UPDATE day_count = VALUES(day_count), refreshed_at = CURRENT_TIMESTAMP""",
+            (facility_id, valid_month, len(rows))
+        )
+
+        # 요금은 시설 단위라 다른 월의 일별 레코드에도 반영
+        cursor.execute(
+            "UPDATE daily_schedule SET fees = %s WHERE facility_id = %s AND valid_month <> %s",
+            (json.dumps(fees, ensure_ascii=False), facility_id, valid_month)
+        )
+
+        logger.debug(f"일별 스케줄 갱신: facility_id={facility_id}, {valid_month} ({len(rows)}일)")
+        return len(rows)
+
+    def rebuild_all(self, cursor) -> int:
+        """
+        DB에 있는 모든 시설 + 월 조합의 일별 스케줄 재생성 (초기 적재/백필용)
+
+        Returns:
+            갱신된 시설 + 월 조합 수
+        """
+        cursor.execute(
+            """SELECT facility_id, valid_month FROM swim_schedule
+               UNION
+               SELECT facility_id, valid_month FROM facility_closure"""
+        )
+        pairs = cursor.fetchall()
+        for facility_id, valid_month in pairs:
+            self.refresh(cursor, facility_id, valid_month)
+
+        logger.info(f"일별 스케줄 전체 재생성: {len(pairs)}개 시설/월")
+        return len(pairs)
+
+    def _load_schedules(self, cursor, facility_id: int, valid_month: str) -> list[dict]:
+        cursor.execute(
+            """SELECT id, day_type, season FROM swim_schedule
+               WHERE facility_id = %s AND valid_month = %s
+               ORDER BY id""",
+            (facility_id, valid_month)
+        )
+        schedules = {
+            row[0]: {"day_type": row[1], "season": row[2], "sessions": []}
+            for row in cursor.fetchall()
+        }
+        if not schedules:
+            return []
+
+        placeholders = ", ".join(["%s"] * len(schedules))
+        cursor.execute(
+            f"""SELECT schedule_id, session_name, start_time, end_time, capacity, lanes, applicable_days
+                FROM swim_session WHERE schedule_id IN ({placeholders})
+                ORDER BY id""",
+            tuple(schedules)
+        )
+        for row in cursor.fetchall():
+            schedules[row[0]]["sessions"].append({
+                "session_name": row[1],
+                "start_time": format_time(row[2]),
+                "end_time": format_time(row[3]),
+                "capacity": row[4],
+                "lanes": row[5],
+                "applicable_days": row[6],
+            })
+        return list(schedules.values())
+
+    def _load_closures(self, cursor, facility_id: int, valid_month: str) -> list[dict]:
+        cursor.execute(
+            """SELECT closure_type, day_of_week, week_pattern, closure_date, reason
+               FROM facility_closure
+               WHERE facility_id = %s AND valid_month = %s
+               ORDER BY id""",
+            (facility_id, valid_month)
+        )
+        return [
+            {
+                "closure_type": row[0],
+                "day_of_week": row[1],
+                "week_pattern": row[2],
+                "closure_date": row[3],
+                "reason": row[4],
+            }
+            for row in cursor.fetchall()
+        ]
+
+    def _load_notice(self, cursor, facility_id: int, valid_month: str) -> Optional[dict]:
+        cursor.execute(
+            """SELECT source_url, title, crawled_at FROM notice
+               WHERE facility_id = %s AND valid_date = %s
+               ORDER BY id LIMIT 1""",
+            (facility_id, valid_month)
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return {"source_url": row[0], "title": row[1], "crawled_at": row[2]}
+
+    def _load_fees(self, cursor, facility_id: int) -> list[dict]:
+        cursor.execute(
+            "SELECT category, price, note FROM fee WHERE facility_id = %s ORDER BY id",
+            (facility_id,)
+        )
+        return [
+            {"category": row[0], "price": row[1], "note": row[2] or ""}
+            for row in cursor.fetchall()
+        ]
@@ -10,6 +10,8 @@ from typing import Optional, List
 
 from core.exceptions import RepositoryError
 from infrastructure.database.connection import get_connection
+from infrastructure.database.daily_schedule_builder import DailyScheduleBuilder
+from infrastructure.database.calendar_snapshot_builder import CalendarSnapshotBuilder
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,8 @@ class SwimRepository:
 
     def __init__(self):
         self.conn = None
+        self._daily_builder = DailyScheduleBuilder()
+        self._calendar_builder = CalendarSnapshotBuilder()
 
     def __enter__(self):
         return self
@@ -104,10 +108,8 @@ class SwimRepository:
                     self._save_pool_closure(cursor, facility_id, notice_id, valid_date, notes)
                 logger.info(f"수영장 휴장 저장: {facility_name} ({valid_date})")
             else:
-                for schedule in schedules:
-                    schedule_id = self._save_schedule(cursor, facility_id, notice_id, schedule, valid_date)
-                    sessions = schedule.get("sessions", [])
-                    self._save_sessions(cursor, schedule_id, sessions)
+                schedule_ids = self._save_schedules(cursor, facility_id, notice_id, schedules, valid_date)
+                self._save_sessions(cursor, schedule_ids, schedules)
 
             # 4. fee 저장
             fees = data.get("fees", [])
@@ -116,6 +118,9 @@ class SwimRepository:
             # 5. closure 저장 (monthly 타입은 이미 _save_pool_closure에서 처리됨)
             self._save_closures(cursor, facility_id, notice_id, valid_date, closures)
 
+            # 6. 일별 스케줄 materialized 테이블 갱신 (같은 트랜잭션)
+            self._daily_builder.refresh(cursor, facility_id, valid_date)
+
             self._commit()
             logger.info(f"저장 완료: {facility_name}")
             return True
@@ -127,6 +132,60 @@ class SwimRepository:
             self._rollback()
             raise RepositoryError(f"저장 실패: {e}", cause=e)
 
+    def rebuild_daily_schedules(self) -> int:
+        """
+        daily_schedule 테이블 전체 재생성 (초기 적재/백필용)
+
+        Returns:
+            갱신된 시설 + 월 조합 수
+        """
+        try:
+            conn = self._get_conn()
+            cursor = conn.cursor()
+            count = self._daily_builder.rebuild_all(cursor)
+            self._commit()
+            return count
+        except Exception as e:
+            self._rollback()
+            raise RepositoryError(f"일별 스케줄 재생성 실패: {e}", cause=e)
+
+    def refresh_calendar_snapshot(self, valid_month: str) -> bool:
+        """
+        월간 달력 스냅샷 갱신
+
+        Args:
+            valid_month: 적용 월 ("2026년 3월" 또는 YYYY-MM)
+
+        Returns:
+            저장 여부
+        """
+        try:
+            conn = self._get_conn()
+            cursor = conn.cursor()
+            saved = self._calendar_builder.refresh(cursor, self._convert_valid_month(valid_month))
+            self._commit()
+            return saved
+        except Exception as e:
+            self._rollback()
+            raise RepositoryError(f"달력 스냅샷 갱신 실패: {e}", cause=e)
+
+    def rebuild_calendar_snapshots(self) -> int:
+        """
+        calendar_snapshot 테이블 전체 재생성 (초기 적재/백필용)
+
+        Returns:
+            갱신된 월 수
+        """
+        try:
+            conn = self._get_conn()
+            cursor = conn.cursor()
+            count = self._calendar_builder.rebuild_all(cursor)
+            self._commit()
+            return count
+        except Exception as e:
+            self._rollback()
+            raise RepositoryError(f"달력 스냅샷 재생성 실패: {e}", cause=e)
+
     def _get_or_create_facility(self, cursor, name: str) -> int:
         """시설 조회 또는 생성"""
         # 조회
@@ -189,49 +248,77 @@ class SwimRepository:
         )
         return cursor.lastrowid
 
-    def _save_schedule(self, cursor, facility_id: int, notice_id: int, schedule: dict, valid_month: str) -> int:
-        """스케줄 저장"""
-        day_type = schedule.get("day_type", "")
-        season = schedule.get("season") or None  # 빈 문자열 -> None
+    def _save_schedules(self, cursor, facility_id: int, notice_id: int,
+                        schedules: List[dict], valid_month: str) -> List[int]:
+        """스케줄 일괄 저장 → 입력 순서대로의 schedule ID 목록"""
+        if not schedules:
+            return []
 
-        cursor.execute(
+        cursor.executemany(
             """INSERT INTO swim_schedule (facility_id, notice_id, day_type, season, valid_month)
                VALUES (%s, %s, %s, %s, %s)""",
-            (facility_id, notice_id, day_type, season, valid_month)
-        )
-        return cursor.lastrowid
-
-    def _save_sessions(self, cursor, schedule_id: int, sessions: List[dict]):
-        """세션 일괄 저장"""
-        for session in sessions:
-            cursor.execute(
-                """INSERT INTO swim_session
-                   (schedule_id, session_name, start_time, end_time, capacity, lanes, applicable_days)
-                   VALUES (%s, %s, %s, %s, %s, %s, %s)""",
+            [
                 (
-                    schedule_id,
-                    session.get("session_name"),
-                    session.get("start_time"),
-                    session.get("end_time"),
-                    session.get("capacity"),
-                    session.get("lanes"),
-                    session.get("applicable_days"),
+                    facility_id,
+                    notice_id,
+                    schedule.get("day_type", ""),
+                    schedule.get("season") or None,  # 빈 문자열 -> None
+                    valid_month,
                 )
+                for schedule in schedules
+            ]
+        )
+
+        # 방금 생성한 notice에만 속한 스케줄이므로 ID 순서 = 입력 순서
+        cursor.execute(
+            "SELECT id FROM swim_schedule WHERE notice_id = %s ORDER BY id",
+            (notice_id,)
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+    def _save_sessions(self, cursor, schedule_ids: List[int], schedules: List[dict]):
+        """세션 일괄 저장 (전체 스케줄의 세션을 한 번에)"""
+        rows = [
+            (
+                schedule_id,
+                session.get("session_name"),
+                session.get("start_time"),
+                session.get("end_time"),
+                session.get("capacity"),
+                session.get("lanes"),
+                session.get("applicable_days"),
             )
+            for schedule_id, schedule in zip(schedule_ids, schedules)
+            for session in schedule.get("sessions", [])
+        ]
+        if not rows:
+            return
+
+        cursor.executemany(
+            """INSERT INTO swim_session
+               (schedule_id, session_name, start_time, end_time, capacity, lanes, applicable_days)
+               VALUES (%s, %s, %s, %s, %s, %s, %s)""",
+            rows
+        )
 
     def _save_fees(self, cursor, facility_id: int, fees: List[dict]):
         """이용료 일괄 저장"""
-        for fee in fees:
-            cursor.execute(
-                """INSERT INTO fee (facility_id, category, price, note)
-                   VALUES (%s, %s, %s, %s)""",
+        if not fees:
+            return
+
+        cursor.executemany(
+            """INSERT INTO fee (facility_id, category, price, note)
+               VALUES (%s, %s, %s, %s)""",
+            [
                 (
                     facility_id,
                     fee.get("category"),
                     fee.get("price"),
                     fee.get("note", ""),
                 )
-            )
+                for fee in fees
+            ]
+        )
 
     def _save_pool_closure(self, cursor, facility_id: int, notice_id: int,
                            valid_month: str, notes: List[str]):
@@ -254,34 +341,38 @@ class SwimRepository:
 
     def _save_closures(self, cursor, facility_id: int, notice_id: int,
                        valid_month: str, closures: List[dict]):
-        """휴무일 일괄 저장"""
+        """휴무일 일괄 저장 (입력 순서 유지)"""
+        rows = []
         for closure in closures:
             closure_type = closure.get("closure_type")
             # monthly 타입은 _save_pool_closure()에서 이미 처리됨
             if closure_type == "monthly":
                 continue
-            day_of_week = closure.get("day_of_week")
-            week_pattern = closure.get("week_pattern")
             reason = closure.get("reason", "")
             dates = closure.get("dates", [])
 
             if closure_type == "specific_date" and dates:
                 # 특정 날짜 휴무: 각 날짜별로 레코드 생성
-                for date_str in dates:
-                    cursor.execute(
-                        """INSERT INTO facility_closure
-                           (facility_id, notice_id, valid_month, closure_type, closure_date, reason)
-                           VALUES (%s, %s, %s, %s, %s, %s)""",
-                        (facility_id, notice_id, valid_month, closure_type, date_str, reason)
-                    )
-            else:
-                # 정기휴무(regular) 또는 공휴일(holiday)
-                cursor.execute(
-                    """INSERT INTO facility_closure
-                       (facility_id, notice_id, valid_month, closure_type, day_of_week, week_pattern, reason)
-                       VALUES (%s, %s, %s, %s, %s, %s, %s)""",
-                    (facility_id, notice_id, valid_month, closure_type, day_of_week, week_pattern, reason)
+                rows.extend(
+                    (facility_id, notice_id, valid_month, closure_type, date_str, None, None, reason)
+                    for date_str in dates
                 )
+            else:
+                # 정기휴무(regular) 또는 공휴일(holiday), 빈 주차 패턴은 매주(NULL)로 저장
+                rows.append((
+                    facility_id, notice_id, valid_month, closure_type, None,
+                    closure.get("day_of_week"), closure.get("week_pattern") or None, reason
+                ))
+
+        if not rows:
+            return
+
+        cursor.executemany(
+            """INSERT INTO facility_closure
+               (facility_id, notice_id, valid_month, closure_type, closure_date, day_of_week, week_pattern, reason)
+               VALUES (%s, %s, %s, %s, %s, %s, %s, %s)""",
+            rows
+        )
 
     def _convert_valid_month(self, valid_month: str) -> str:
         """
@@ -0,0 +1,3 @@
+from .exporter import start_metrics_server
+
+__all__ = ["start_metrics_server"]
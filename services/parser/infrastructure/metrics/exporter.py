@@ -0,0 +1,45 @@
+"""
+메트릭 HTTP 서버
+
+prometheus_client 내장 서버를 데몬 스레드로 띄워 BlockingScheduler와 함께 동작한다.
+"""
+import logging
+import threading
+
+from prometheus_client import start_http_server
+
+from infrastructure.config import settings
+
+logger = logging.getLogger(__name__)
+
+_started = False
+_lock = threading.Lock()
+
+
+def start_metrics_server(port: int = None) -> bool:
+    """
+    /metrics 서버 시작 (프로세스당 한 번, METRICS_ENABLED=false면 시작하지 않음)
+
+    Args:
+        port: 포트 (기본 settings.METRICS_PORT)
+
+    Returns:
+        서버 실행 여부
+    """
+    global _started
+    if not settings.METRICS_ENABLED:
+        return False
+
+    with _lock:
+        if _started:
+            return True
+        port = port or settings.METRICS_PORT
+        try:
+            start_http_server(port)
+        except OSError as e:
+            logger.warning(f"메트릭 서버 시작 실패 (port {port}), 메트릭 없이 진행: {e}")
+            return False
+        _started = True
+
+    logger.info(f"메트릭 서버 시작: :{port}/metrics")
+    return True
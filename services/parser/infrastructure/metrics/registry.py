@@ -0,0 +1,113 @@
+"""
+Parser 파이프라인 Prometheus 메트릭 정의
+
+스케줄러 프로세스의 메트릭 서버(METRICS_PORT)가 기본 registry를 노출한다.
+야간 배치는 하루 한 번 실행되므로 단계별 소요 시간은 마지막 실행 값을 Gauge로 둔다.
+"""
+from prometheus_client import Counter, Gauge, Histogram
+
+_HTTP_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+_EXTRACT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+_LLM_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+_DB_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# -- 크롤링 --
+
+CRAWL_PAGES = Counter(
+    "swim_parser_crawl_pages_total",
+    "크롤링한 페이지 수 (list/detail/facility)",
+    ["org", "kind"],
+)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "swim_parser_http_request_duration_seconds",
+    "호스트별 HTTP 요청 시간 (속도 제한 대기 제외, 응답 헤더 수신까지)",
+    ["host", "status"],
+    buckets=_HTTP_BUCKETS,
+)
+
+HTTP_RATE_LIMIT_WAIT = Counter(
+    "swim_parser_http_rate_limit_wait_seconds_total",
+    "호스트별 속도 제한 대기 시간 합계",
+    ["host"],
+)
+
+HTTP_CACHE_RESULTS = Counter(
+    "swim_parser_http_cache_results_total",
+    "조건부 요청 결과 (not_modified/unchanged/changed)",
+    ["result"],
+)
+
+NOTICES_SKIPPED = Counter(
+    "swim_parser_notices_skipped_total",
+    "이미 저장된 공지로 건너뛴 수 (crawl: 상세 요청 전, parse: 파싱 전, save: DB 중복)",
+    ["stage"],
+)
+
+# -- 첨부파일 --
+
+DOWNLOADED_BYTES = Counter(
+    "swim_parser_downloaded_bytes_total",
+    "첨부파일 다운로드 bytes",
+    ["org"],
+)
+
+DOWNLOADS = Counter(
+    "swim_parser_downloads_total",
+    "첨부파일 다운로드 결과 (downloaded/skipped/deduplicated)",
+    ["org", "result"],
+)
+
+EXTRACTION_DURATION = Histogram(
+    "swim_parser_extraction_duration_seconds",
+    "HWP/PDF 텍스트 추출 시간",
+    ["file_type"],
+    buckets=_EXTRACT_BUCKETS,
+)
+
+# -- LLM --
+
+LLM_REQUEST_DURATION = Histogram(
+    "swim_parser_llm_request_duration_seconds",
+    "LLM 호출 시간",
+    ["prompt_type"],
+    buckets=_LLM_BUCKETS,
+)
+
+LLM_TOKENS = Counter(
+    "swim_parser_llm_tokens_total",
+    "LLM 토큰 사용량",
+    ["prompt_type", "direction"],
+)
+
+LLM_CACHE_HITS = Counter(
+    "swim_parser_llm_cache_hits_total",
+    "LLM 결과 캐시 적중 수",
+    ["prompt_type"],
+)
+
+# -- DB / 배치 --
+
+DB_SAVE_DURATION = Histogram(
+    "swim_parser_db_save_duration_seconds",
+    "DB 저장 단계 소요 시간",
+    buckets=_DB_BUCKETS,
+)
+
+STAGE_DURATION = Gauge(
+    "swim_parser_stage_duration_seconds",
+    "마지막 배치의 단계별 소요 시간 (crawl/parse/save/total)",
+    ["stage"],
+)
+
+LAST_RUN_TIMESTAMP = Gauge(
+    "swim_parser_last_run_timestamp_seconds",
+    "마지막 배치 종료 시각 (epoch)",
+    ["status"],
+)
+
+RUN_RESULTS = Counter(
+    "swim_parser_run_results_total",
+    "배치 결과 항목 수 (crawled/parsed/saved/already_exists/failed)",
+    ["result"],
+)
@@ -0,0 +1,162 @@
+"""
+휴무일/계절 판정 유틸리티
+
+API(app.shared.util)의 일별 스케줄 판정 규칙과 동일하게 유지해야 한다.
+daily_schedule 테이블을 적재 시점에 미리 계산할 때 사용.
+"""
+from datetime import date
+from typing import List, Optional
+
+import holidays
+
+# 한국 공휴일 캘린더 (한국어 이름 사용)
+kr_holidays = holidays.KR(language='ko')
+
+# 요일 매핑 (weekday -> 한글 요일명)
+WEEKDAY_TO_KOREAN = {
+    0: "월요일",
+    1: "화요일",
+    2: "수요일",
+    3: "목요일",
+    4: "금요일",
+    5: "토요일",
+    6: "일요일"
+}
+
+# 요일 매핑 (weekday -> 한글 약자)
+WEEKDAY_SHORT = {
+    0: "월",
+    1: "화",
+    2: "수",
+    3: "목",
+    4: "금",
+    5: "토",
+    6: "일"
+}
+
+
+def get_day_type(target_date: date) -> str:
+    """날짜 → 스케줄 요일 타입 (평일/토요일/일요일)"""
+    weekday = target_date.weekday()
+    if weekday == 5:
+        return "토요일"
+    if weekday == 6:
+        return "일요일"
+    return "평일"
+
+
+def get_season_from_month(month: int) -> str:
+    """월 번호로부터 계절 반환 (3~10월=하절기, 11~2월=동절기)"""
+    if not 1 <= month <= 12:
+        raise ValueError(f"Invalid month: {month}")
+
+    return "하절기" if 3 <= month <= 10 else "동절기"
+
+
+def should_include_schedule(schedule_season: Optional[str], target_season: str) -> bool:
+    """스케줄이 대상 계절에 포함되는지 판단 (빈 값/임시운영은 항상 포함)"""
+    if not schedule_season:
+        return True
+    if schedule_season == "임시운영":
+        return True
+    return schedule_season == target_season
+
+
+def should_include_session(applicable_days: Optional[str], weekday: int) -> bool:
+    """세션이 특정 요일에 적용되는지 판단 (None=전체, "월,수,금"=월수금)"""
+    if not applicable_days:
+        return True
+
+    target_day = WEEKDAY_SHORT.get(weekday, "")
+    applicable_list = [d.strip() for d in applicable_days.split(",")]
+    return target_day in applicable_list
+
+
+def get_week_of_month(target_date: date) -> int:
+    """해당 날짜가 그 달의 몇 번째 주인지 계산 (1~5)"""
+    first_weekday = target_date.replace(day=1).weekday()
+    return (target_date.day + first_weekday - 1) // 7 + 1
+
+
+def matches_regular_pattern(target_date: date, closure: dict) -> bool:
+    """정기휴무 패턴(요일 + 주차)에 매칭되는지 확인"""
+    if WEEKDAY_TO_KOREAN.get(target_date.weekday()) != closure.get("day_of_week"):
+        return False
+
+    week_pattern = closure.get("week_pattern")
+    if week_pattern is None:
+        return True
+
+    week_numbers = [int(w.strip()) for w in week_pattern.split(",")]
+    return get_week_of_month(target_date) in week_numbers
+
+
+def check_facility_closure(closures: List[dict], target_date: date) -> tuple[bool, Optional[str]]:
+    """
+    특정 날짜가 휴무일인지 확인
+
+    Args:
+        closures: 해당 시설+월의 facility_closure 레코드 목록
+        target_date: 확인할 날짜
+
+    Returns:
+        (휴무 여부, 휴무 사유)
+    """
+    # 월 전체 휴장 체크 (closure_date가 NULL인 specific_date 레코드)
+    for closure in closures:
+        if closure["closure_type"] == "specific_date" and closure.get("closure_date") is None:
+            return True, closure.get("reason") or "임시휴장"
+
+    # 공휴일은 기본적으로 휴무 처리
+    if target_date in kr_holidays:
+        return True, f"공휴일 휴무 ({kr_holidays.get(target_date)})"
+
+    for closure in closures:
+        if closure["closure_type"] == "specific_date":
+            if closure.get("closure_date") == target_date:
+                return True, closure.get("reason") or "특정일 휴무"
+
+        elif closure["closure_type"] == "regular":
+            if matches_regular_pattern(target_date, closure):
+                return True, closure.get("reason") or "정기휴무"
+
+    return False, None
+
+
+def build_closure_info(closures: List[dict]) -> Optional[dict]:
+    """시설 + 월 휴무일 목록 → 월간 휴무 요약 (API ScheduleService._build_closure_info와 동일)"""
+    if not closures:
+        return None
+
+    specific_dates = [c for c in closures if c["closure_type"] == "specific_date"]
+    regular_closures = [c for c in closures if c["closure_type"] == "regular"]
+
+    full_closure = next(
+        (c for c in specific_dates if c.get("closure_date") is None), None
+    )
+    if full_closure:
+        return {
+            "is_closed": True,
+            "closure_type": "monthly",
+            "reason": full_closure.get("reason") or "임시휴장"
+        }
+    if len(specific_dates) >= 15:
+        return {
+            "is_closed": True,
+            "closure_type": "monthly",
+            "reason": specific_dates[0].get("reason")
+        }
+    if specific_dates or regular_closures:
+        return {
+            "is_closed": False,
+            "closure_type": "partial",
+            "specific_dates": len(specific_dates),
+            "regular_closures": [
+                {
+                    "day_of_week": c.get("day_of_week"),
+                    "week_pattern": c.get("week_pattern"),
+                    "reason": c.get("reason")
+                } for c in regular_closures
+            ]
+        }
+    return None
@@ -0,0 +1,34 @@
+"""
+동시 실행 유틸리티
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def run_concurrently(func: Callable[[T], R], items: Iterable[T], max_workers: int,
+                     thread_name_prefix: str = "worker") -> List[R]:
+    """
+    items 각각에 func을 스레드 풀에서 실행 (결과는 입력 순서 유지)
+
+    호출마다 별도 풀을 만들어 중첩 호출(기관 → 상세 페이지)에서도 교착되지 않는다.
+    예외는 해당 결과를 꺼낼 때 호출자에게 전파된다.
+
+    Args:
+        func: 실행할 함수
+        items: 입력 목록
+        max_workers: 최대 동시 실행 수 (1 이하면 순차 실행)
+        thread_name_prefix: 스레드 이름 접두사
+
+    Returns:
+        func 결과 리스트
+    """
+    items = list(items)
+    workers = max(1, min(max_workers, len(items)))
+    if workers == 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix) as executor:
+        return list(executor.map(func, items))
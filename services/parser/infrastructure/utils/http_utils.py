@@ -1,14 +1,52 @@
 """
 HTTP 관련 유틸리티
 """
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
 import requests
+from requests.adapters import BaseAdapter
+
+from infrastructure.metrics.registry import HTTP_RATE_LIMIT_WAIT, HTTP_REQUEST_DURATION
+from infrastructure.utils.rate_limiter import HostRateLimiter, get_host_rate_limiter
 
 DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
+# create_session()이 마운트할 전송 어댑터 (오프라인 record/replay 벤치마크용, None이면 실제 네트워크)
+_transport_adapter: Optional[BaseAdapter] = None
+
+
+def install_transport_adapter(adapter: Optional[BaseAdapter]) -> None:
+    """이후 생성되는 세션의 http/https 전송 어댑터 교체 (None이면 기본 어댑터로 복원)"""
+    global _transport_adapter
+    _transport_adapter = adapter
+
+
+class RateLimitedSession(requests.Session):
+    """요청마다 호스트별 토큰 버킷을 거치는 세션 (동시 크롤링 시에도 사이트별 요청 간격 유지, 호스트별 메트릭 기록)"""
+
+    def __init__(self, limiter: HostRateLimiter):
+        super().__init__()
+        self.limiter = limiter
+
+    def request(self, method, url, *args, **kwargs):
+        host = urlparse(url).netloc
+        HTTP_RATE_LIMIT_WAIT.labels(host).inc(self.limiter.acquire(url))
+
+        start = time.perf_counter()
+        status = "error"
+        try:
+            response = super().request(method, url, *args, **kwargs)
+            status = str(response.status_code)
+            return response
+        finally:
+            HTTP_REQUEST_DURATION.labels(host, status).observe(time.perf_counter() - start)
+
 
 def create_session(extra_headers: dict = None) -> requests.Session:
     """
-    공통 HTTP 세션 생성
+    공통 HTTP 세션 생성 (호스트별 속도 제한 적용)
 
     Args:
         extra_headers: 추가 헤더 (Content-Type 등)
@@ -16,10 +54,13 @@ def create_session(extra_headers: dict = None) -> requests.Session:
     Returns:
         requests.Session
     """
-    session = requests.Session()
+    session = RateLimitedSession(get_host_rate_limiter())
     session.headers.update({
         "User-Agent": DEFAULT_USER_AGENT
     })
     if extra_headers:
         session.headers.update(extra_headers)
+    if _transport_adapter is not None:
+        session.mount("http://", _transport_adapter)
+        session.mount("https://", _transport_adapter)
     return session
@@ -0,0 +1,92 @@
+"""
+호스트별 요청 속도 제한 (토큰 버킷)
+
+크롤러가 기관/시설/상세 페이지를 동시에 요청해도
+같은 사이트에는 CRAWL_DELAY_SECONDS 간격(+ CRAWL_BURST 만큼의 순간 허용량)으로만 요청한다.
+모든 크롤러/다운로더 세션(create_session)이 프로세스 전역 limiter를 공유한다.
+"""
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from infrastructure.config import settings
+
+
+class TokenBucket:
+    """토큰 버킷 (스레드 안전, 토큰이 없으면 충전될 때까지 대기)"""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Args:
+            rate: 초당 충전 토큰 수 (0 이하면 제한 없음)
+            capacity: 최대 토큰 수 (순간 허용 요청 수)
+        """
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        토큰 1개 획득
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
+
+
+class HostRateLimiter:
+    """호스트(netloc)별 토큰 버킷 모음"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> float:
+        """url의 호스트 버킷에서 토큰 획득 → 대기 시간 (초)"""
+        host = urlparse(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(host, TokenBucket(self.rate, self.capacity))
+        return bucket.acquire()
+
+
+_limiter: Optional[HostRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_host_rate_limiter() -> HostRateLimiter:
+    """프로세스 전역 limiter (CRAWL_DELAY_SECONDS 간격, CRAWL_BURST 순간 허용)"""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                delay = settings.CRAWL_DELAY_SECONDS
+                _limiter = HostRateLimiter(
+                    rate=1 / delay if delay > 0 else 0,
+                    capacity=settings.CRAWL_BURST,
+                )
+    return _limiter
@@ -6,15 +6,19 @@
 실행 방법:
     python main.py              # 전체 파이프라인 실행
     python main.py --crawl      # 크롤링만 실행
+    python main.py --full-crawl # 증분 mark 무시하고 max-pages까지 전체 크롤링
     python main.py --parse      # 파싱만 실행
     python main.py --save       # DB 저장만 실행
+    python main.py --purge-llm-cache [--older-than-days N]  # LLM 결과 캐시 삭제
 """
 import argparse
+import time
 
 from core.exceptions import RepositoryError
 from infrastructure.config.logging_config import get_logger
 from infrastructure.container import container
-from core.events import ScheduleSaved
+from infrastructure.metrics.registry import DB_SAVE_DURATION, NOTICES_SKIPPED
+from core.events import ScheduleSaved, BatchCompleted
 from core.parser.validators.date_validator import validate_valid_month
 from core.models.facility import Organization
 
@@ -65,7 +69,8 @@ def _merge_notices_without_duplicates(all_notices: dict, new_notices: dict, org_
 def _crawl_monthly_notices_with_keywords(
     service,
     keywords: list[str],
-    max_pages: int
+    max_pages: int,
+    full: bool = False
 ) -> dict:
     """
     여러 키워드로 공지사항 크롤링 및 병합
@@ -74,6 +79,7 @@ def _crawl_monthly_notices_with_keywords(
         service: SwimCrawlerService 인스턴스
         keywords: 검색 키워드 목록
         max_pages: 키워드당 최대 페이지 수
+        full: 증분 mark 무시 여부
 
     Returns:
         {"snyouth": [...], "snhdc": [...]} 형태의 병합된 공지사항
@@ -82,7 +88,7 @@ def _crawl_monthly_notices_with_keywords(
 
     for keyword in keywords:
         logger.info(f"키워드 '{keyword}' 검색 중...")
-        monthly_notices = service.crawl_monthly_notices(keyword=keyword, max_pages=max_pages, save=False)
+        monthly_notices = service.crawl_monthly_notices(keyword=keyword, max_pages=max_pages, save=False, full=full)
 
         # 중복 제거하면서 병합
         for org in ALL_ORGANIZATIONS:
@@ -138,12 +144,15 @@ def _save_validated_results(validated_results: list) -> None:
 # ===================================================================
 
 
-def crawl(keyword: str = "수영", max_pages: int = 3):
-    """1단계: 크롤링"""
+def crawl(keyword: str = "수영", max_pages: int = 3, full: bool = False):
+    """1단계: 크롤링 (full=False면 게시판별로 이전 크롤링 지점까지만)"""
     logger.info("=== 1단계: 크롤링 시작 ===")
 
     service = container.swim_crawler_service()
 
+    # 이전 실행에서 확정되지 않은 mark 폐기 (스케줄러는 프로세스가 계속 살아 있음)
+    container.crawl_watermarks().discard()
+
     # 기본 스케줄 크롤링
     logger.info("기본 스케줄 크롤링...")
     base_schedules = service.crawl_base_schedules(save=True)
@@ -153,7 +162,7 @@ def crawl(keyword: str = "수영", max_pages: int = 3):
     # 월별 공지사항 크롤링 (여러 키워드로 검색)
     logger.info("월별 공지사항 크롤링...")
     keywords = _get_search_keywords(keyword)
-    all_notices = _crawl_monthly_notices_with_keywords(service, keywords, max_pages)
+    all_notices = _crawl_monthly_notices_with_keywords(service, keywords, max_pages, full)
 
     # 병합된 결과 저장
     for org in ALL_ORGANIZATIONS:
@@ -197,7 +206,7 @@ def save_to_db(validated_results=None):
     """3단계: DB 저장"""
     logger.info("=== 3단계: DB 저장 시작 ===")
 
-    result = {"new_saved": 0, "already_exists": 0, "closures": [], "saved_items": []}
+    result = {"new_saved": 0, "already_exists": 0, "failed": 0, "closures": [], "saved_items": []}
 
     # 데이터 로드
     if validated_results is None:
@@ -210,6 +219,7 @@ def save_to_db(validated_results=None):
     closure_handler.detected_closures = []  # 이전 실행의 상태 초기화
 
     # DB 저장
+    start = time.perf_counter()
     with container.swim_repository() as repo:
         for data in validated_results:
             try:
@@ -228,9 +238,12 @@ def save_to_db(validated_results=None):
                 else:
                     result["already_exists"] += 1
             except RepositoryError as e:
+                result["failed"] += 1
                 logger.error(f"DB 저장 실패: {e}")
 
     result["closures"] = closure_handler.detected_closures
+    DB_SAVE_DURATION.observe(time.perf_counter() - start)
+    NOTICES_SKIPPED.labels("save").inc(result["already_exists"])
 
     logger.info(f"DB 저장 완료: {result['new_saved']}/{len(validated_results)}개")
     logger.info("=== DB 저장 완료 ===")
@@ -243,6 +256,35 @@ def save_base_schedule_fallbacks(validated_results=None):
     service.generate_and_save(validated_results)
 
 
+def commit_crawl_watermarks(save_result=None):
+    """
+    증분 크롤링 mark 확정
+
+    다운로드/추출/LLM 파싱과 DB 저장까지 실패 없이 끝난 경우에만 이번 크롤링 지점을 저장한다.
+    (실패 시 다음 실행에서 같은 범위를 다시 크롤링)
+    """
+    watermarks = container.crawl_watermarks()
+    held = watermarks.held
+    if held:
+        logger.warning(f"{', '.join(held)}, 크롤링 워터마크 갱신 보류")
+        watermarks.discard()
+        return
+
+    if save_result is not None and save_result.get("failed", 0) > 0:
+        logger.warning(f"DB 저장 실패 {save_result['failed']}건, 크롤링 워터마크 갱신 보류")
+        watermarks.discard()
+        return
+
+    if watermarks.pending_count:
+        container.storage_service().save_crawl_watermarks(watermarks.commit())
+
+
+def complete_batch(save_result=None):
+    """배치 완료 이벤트 발행 (API 캐시 워밍 트리거)"""
+    new_saved = save_result.get("new_saved", 0) if save_result else 0
+    container.event_bus().publish(BatchCompleted(new_saved=new_saved))
+
+
 # ===================================================================
 # 엔트리포인트
 # ===================================================================
@@ -252,8 +294,14 @@ def main():
     """메인 실행 함수"""
     parser = argparse.ArgumentParser(description="성남시 수영장 자유수영 정보 수집기")
     parser.add_argument("--crawl", action="store_true", help="크롤링만 실행")
+    parser.add_argument("--full-crawl", action="store_true", help="증분 크롤링 mark 무시 (max-pages까지 전체 크롤링)")
     parser.add_argument("--parse", action="store_true", help="파싱만 실행")
     parser.add_argument("--save", action="store_true", help="DB 저장만 실행")
+    parser.add_argument("--rebuild-daily", action="store_true", help="일별 스케줄 테이블 재생성")
+    parser.add_argument("--rebuild-calendar", action="store_true", help="달력 스냅샷 테이블 재생성")
+    parser.add_argument("--purge-llm-cache", action="store_true", help="LLM 결과 캐시 삭제")
+    parser.add_argument("--older-than-days", type=int, default=None,
+                        help="--purge-llm-cache와 함께 사용: N일 이상 사용하지 않은 항목만 삭제")
     parser.add_argument("--test-discord", action="store_true", help="Discord 알림 테스트")
     parser.add_argument("--keyword", default="수영", help="검색 키워드 (기본: 수영)")
     parser.add_argument("--max-pages", type=int, default=3, help="최대 페이지 수 (기본: 3)")
@@ -281,9 +329,31 @@ def main():
         logger.info("Discord 테스트 메시지 전송 완료")
         return
 
+    if args.purge_llm_cache:
+        cache = container.llm_result_cache()
+        if cache is None:
+            logger.info("LLM 캐시가 비활성화되어 있습니다. (LLM_CACHE_ENABLED=false)")
+            return
+        deleted = cache.purge(older_than_days=args.older_than_days)
+        stats = cache.stats()
+        logger.info(f"LLM 캐시 정리 완료: {deleted}건 삭제, 남은 항목 {stats['entries']}건 ({stats['bytes']:,} bytes)")
+        return
+
+    if args.rebuild_daily:
+        with container.swim_repository() as repo:
+            repo.rebuild_daily_schedules()
+        return
+
+    if args.rebuild_calendar:
+        with container.swim_repository() as repo:
+            repo.rebuild_calendar_snapshots()
+        return
+
     # 특정 단계만 실행
     if args.crawl:
-        crawl(keyword=args.keyword, max_pages=args.max_pages)
+        crawl(keyword=args.keyword, max_pages=args.max_pages, full=args.full_crawl)
+        # 크롤링 결과는 JSON으로 저장되어 이후 --parse/--save에서 사용
+        # (파싱/저장 결과를 알 수 없으므로 증분 mark는 확정하지 않음)
         return
 
     if args.parse:
@@ -291,17 +361,20 @@ def main():
         return
 
     if args.save:
-        save_to_db()
+        save_result = save_to_db()
         save_base_schedule_fallbacks()
+        complete_batch(save_result)
         return
 
     # 전체 파이프라인 실행
     logger.info("=== 전체 파이프라인 시작 ===")
 
-    monthly_notices = crawl(keyword=args.keyword, max_pages=args.max_pages)
+    monthly_notices = crawl(keyword=args.keyword, max_pages=args.max_pages, full=args.full_crawl)
     validated_results = parse(monthly_notices=monthly_notices)
-    save_to_db(validated_results=validated_results)
+    save_result = save_to_db(validated_results=validated_results)
+    commit_crawl_watermarks(save_result)
     save_base_schedule_fallbacks(validated_results=validated_results)
+    complete_batch(save_result)
 
     logger.info("=== 전체 파이프라인 완료 ===")
 
@@ -14,7 +14,9 @@ from apscheduler.triggers.cron import CronTrigger
 from core.exceptions import ParserBaseError
 from infrastructure.config.logging_config import get_logger
 from infrastructure.container import container
-from main import crawl, parse, save_to_db
+from infrastructure.metrics import start_metrics_server
+from infrastructure.metrics.registry import LAST_RUN_TIMESTAMP, RUN_RESULTS, STAGE_DURATION
+from main import crawl, parse, save_to_db, commit_crawl_watermarks, complete_batch
 
 logger = get_logger(__name__)
 
@@ -23,10 +25,12 @@ def run_daily_task():
     """매일 실행되는 크롤링 및 파싱 작업"""
     notifier = container.notification_service()
     errors = []
+    failed = False  # 단계별 errors로 잡히지 않은 예외로 작업이 중단됨
     start_time = time.time()
     monthly_notices = None
     validated_results = None
     save_result = {"new_saved": 0, "already_exists": 0, "closures": []}
+    stage_start = start_time
 
     try:
         logger.info("=" * 80)
@@ -40,6 +44,8 @@ def run_daily_task():
             errors.append(f"크롤링 실패: {e}")
             notifier.notify_error("크롤링", str(e))
             raise
+        finally:
+            stage_start = _record_stage("crawl", stage_start)
 
         # 2. LLM 파싱
         try:
@@ -48,21 +54,31 @@ def run_daily_task():
             errors.append(f"파싱 실패: {e}")
             notifier.notify_error("LLM 파싱", str(e))
             raise
+        finally:
+            stage_start = _record_stage("parse", stage_start)
 
         # 3. DB 저장
         try:
             save_result = save_to_db(validated_results=validated_results)
+            commit_crawl_watermarks(save_result)
         except ParserBaseError as e:
             errors.append(f"DB 저장 실패: {e}")
             notifier.notify_error("DB 저장", str(e))
+        finally:
+            stage_start = _record_stage("save", stage_start)
+
+        # 4. 배치 완료 알림 (API 캐시 워밍)
+        complete_batch(save_result)
 
         logger.info("=" * 80)
         logger.info(f"일일 크롤링 작업 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info("=" * 80)
 
     except ParserBaseError as e:
+        failed = True
         logger.error(f"일일 크롤링 작업 중 오류 발생: {e}", exc_info=True)
     except Exception as e:
+        failed = True
         logger.error(f"일일 크롤링 작업 중 예상치 못한 오류: {e}", exc_info=True)
 
     finally:
@@ -80,6 +96,16 @@ def run_daily_task():
                     })
 
         total_notices = len(crawled_notices)
+
+        # 배치 메트릭
+        STAGE_DURATION.labels("total").set(duration)
+        LAST_RUN_TIMESTAMP.labels("failure" if failed or errors else "success").set_to_current_time()
+        RUN_RESULTS.labels("crawled").inc(total_notices)
+        RUN_RESULTS.labels("parsed").inc(len(validated_results) if validated_results else 0)
+        RUN_RESULTS.labels("saved").inc(save_result.get("new_saved", 0))
+        RUN_RESULTS.labels("already_exists").inc(save_result.get("already_exists", 0))
+        RUN_RESULTS.labels("failed").inc(save_result.get("failed", 0))
+
         notifier.notify_daily_summary(
             total_notices=total_notices,
             new_saved=save_result.get("new_saved", 0),
@@ -94,6 +120,13 @@ def run_daily_task():
         )
 
 
+def _record_stage(stage: str, stage_start: float) -> float:
+    """단계 소요 시간 기록 → 다음 단계 시작 시각"""
+    now = time.time()
+    STAGE_DURATION.labels(stage).set(now - stage_start)
+    return now
+
+
 def shutdown_handler(signum, frame):
     """스케줄러 종료 핸들러"""
     logger.info("스케줄러 종료 신호 수신. 안전하게 종료합니다...")
@@ -106,6 +139,9 @@ def main():
     signal.signal(signal.SIGINT, shutdown_handler)
     signal.signal(signal.SIGTERM, shutdown_handler)
 
+    # 메트릭 서버 (데몬 스레드, BlockingScheduler와 함께 동작)
+    start_metrics_server()
+
     # 스케줄러 생성
     scheduler = BlockingScheduler()
 